@@ -0,0 +1,176 @@
+"""Tests for POST /v1/utterances (NDJSON batch) and /v1/utterance/stream (SSE)."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from wanda_voice_core.admission import AdmissionController
+from wanda_voice_core.api import WandaAPI
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.providers.base import ProviderBase, current_delta_sink
+from wanda_voice_core.run_manager import RunManager
+
+
+class DelayProvider(ProviderBase):
+    """Answers "echo <prompt>" after a delay given in the prompt."""
+
+    name = "stub"
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def send(self, prompt, context=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            delay = float(prompt.rsplit(" ", 1)[-1]) if prompt[-1].isdigit() else 0
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+        return f"echo {prompt}"
+
+    def is_available(self):
+        return True
+
+
+class StreamingProvider(DelayProvider):
+    """Passes its answer word by word to the delta sink, like Ollama."""
+
+    streams = True
+
+    async def send(self, prompt, context=None):
+        sink = current_delta_sink()
+        words = ["echo", " ", prompt]
+        for word in words:
+            if sink is not None:
+                sink(word)
+            await asyncio.sleep(0)
+        return "".join(words)
+
+
+@pytest.fixture
+async def client(tmp_path):
+    engine = WandaVoiceEngine()
+    engine.run_manager = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+    engine.admission = AdmissionController(max_concurrent=3, max_queue=0)
+    engine.provider_limits.default = 10
+    engine.set_providers(DelayProvider())
+    engine.set_refiner_enabled(False)
+    client = TestClient(TestServer(WandaAPI(engine).create_app()))
+    await client.start_server()
+    client.engine = engine
+    yield client
+    await client.close()
+    engine.run_manager.close()
+
+
+async def _ndjson(resp):
+    return [json.loads(line) for line in (await resp.text()).splitlines()]
+
+
+def _sse_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestBatch:
+    @pytest.mark.asyncio
+    async def test_results_in_completion_order(self, client):
+        items = [
+            {"id": "slow", "text": "Frage langsam 0.2"},
+            {"id": "fast", "text": "Frage schnell 0.01"},
+        ]
+        resp = await client.post("/v1/utterances", json=items)
+        assert resp.status == 200
+        assert resp.headers["Content-Type"].startswith("application/x-ndjson")
+        lines = await _ndjson(resp)
+        assert [line["id"] for line in lines] == ["fast", "slow"]
+        assert [line["index"] for line in lines] == [1, 0]
+        assert lines[1]["response_text"] == "echo Frage langsam 0.2"
+        assert all(line["status"] == 200 for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_bounded_by_admission(self, client):
+        items = [{"text": f"Frage {i} 0.02"} for i in range(10)]
+        resp = await client.post("/v1/utterances", json={"utterances": items})
+        lines = await _ndjson(resp)
+        # max_queue=0: batch items never exceed the running slots, so none is rejected
+        assert sorted(line["index"] for line in lines) == list(range(10))
+        assert all(line["status"] == 200 for line in lines)
+        assert client.engine._primary_provider.peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_item_reported_inline(self, client):
+        resp = await client.post("/v1/utterances", json=[{"text": ""}, "nope", {"text": "Hallo"}])
+        lines = {line["index"]: line for line in await _ndjson(resp)}
+        assert lines[0]["status"] == 400
+        assert lines[1]["status"] == 400
+        assert lines[2]["status"] == 200
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_array(self, client):
+        resp = await client.post("/v1/utterances", json={"text": "Hallo"})
+        assert resp.status == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batch(self, client):
+        client.engine.config.update({"api": {"max_batch": 2}})
+        resp = await client.post("/v1/utterances", json=[{"text": "a"}] * 3)
+        assert resp.status == 413
+
+
+class TestUtteranceStream:
+    @pytest.mark.asyncio
+    async def test_streams_run_events_then_result(self, client):
+        resp = await client.post(
+            "/v1/utterance/stream", json={"text": "Erkläre Photosynthese"}
+        )
+        assert resp.status == 200
+        assert resp.headers["Content-Type"] == "text/event-stream"
+        events = _sse_events(await resp.text())
+        names = [name for name, _ in events]
+        assert names[0] == "run.start"
+        assert "provider.response" in names
+        assert names[-2:] == ["response", "result"]
+        run_id = events[-1][1]["run_id"]
+        assert all(data["run_id"] == run_id for _, data in events)
+        assert events[-2][1]["text"] == "echo Erkläre Photosynthese"
+
+    @pytest.mark.asyncio
+    async def test_streaming_provider_sends_deltas(self, client):
+        client.engine.set_providers(StreamingProvider())
+        resp = await client.post("/v1/utterance/stream", json={"text": "Hallo"})
+        events = _sse_events(await resp.text())
+        deltas = [d["data"]["text"] for name, d in events if name == "response.delta"]
+        assert "".join(deltas) == "echo Hallo"
+        names = [name for name, _ in events]
+        assert names.index("response.delta") < names.index("provider.response")
+        # Deltas are delivered live but kept out of the run history
+        run_id = events[-1][1]["run_id"]
+        history = client.engine.event_bus.get_events_for_run(run_id)
+        assert "response.delta" not in [e.event_type for e in history]
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_bus_subscription(self, client):
+        bus = client.engine.event_bus
+        for text in ("eins", "zwei"):
+            resp = await client.post("/v1/utterance/stream", json={"text": text})
+            await resp.text()
+        assert len(bus._subscribers["*"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_overloaded_is_plain_429(self, client):
+        client.engine.admission = AdmissionController(max_concurrent=1, max_queue=0)
+        slow = asyncio.create_task(
+            client.post("/v1/utterance", json={"text": "Frage langsam 0.3"})
+        )
+        await asyncio.sleep(0.1)
+        resp = await client.post("/v1/utterance/stream", json={"text": "Hallo"})
+        assert resp.status == 429
+        assert (await slow).status == 200
@@ -0,0 +1,112 @@
+"""Tests for compressed per-run audio artifacts."""
+
+import numpy as np
+import pytest
+
+from wanda_voice_core import audio_artifacts
+from wanda_voice_core.audio_artifacts import (
+    encode_audio,
+    load_audio,
+    resolve_codec,
+    to_samples,
+)
+from wanda_voice_core.run_manager import RunManager
+
+
+def _tone(seconds=1.0, rate=16000):
+    t = np.arange(int(seconds * rate), dtype=np.float32) / rate
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+class TestSamples:
+    def test_float32_array_not_copied(self):
+        audio = _tone()
+        assert np.shares_memory(to_samples(audio), audio)
+
+    def test_buffer_not_copied(self):
+        audio = _tone()
+        buf = bytearray(audio.tobytes())
+        samples = to_samples(buf)
+        assert np.shares_memory(samples, np.frombuffer(buf, dtype=np.float32))
+        assert len(samples) == len(audio)
+
+    def test_wav_bytes_decoded(self):
+        wav = encode_audio(_tone(), 16000, "wav")
+        assert len(to_samples(wav)) == 16000
+
+
+class TestEncoding:
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            resolve_codec("mp3")
+
+    def test_falls_back_without_soundfile(self, monkeypatch):
+        monkeypatch.setattr(audio_artifacts, "sf", None)
+        assert resolve_codec("flac") == "wav"
+        assert resolve_codec("opus") == "wav"
+
+    def test_wav_roundtrip(self, tmp_path):
+        audio = _tone()
+        path = tmp_path / "a.wav"
+        path.write_bytes(encode_audio(audio, 16000, "wav"))
+        samples, rate = load_audio(path)
+        assert rate == 16000
+        assert np.max(np.abs(samples - audio)) < 1e-3
+        # 16-bit PCM halves float32
+        assert path.stat().st_size < audio.nbytes * 0.6
+
+    def test_trimmed_to_budget(self):
+        audio = _tone(2.0)
+        full = encode_audio(audio, 16000, "wav")
+        trimmed = encode_audio(audio, 16000, "wav", max_bytes=len(full) // 2)
+        assert trimmed is not None
+        assert len(trimmed) <= len(full) // 2
+
+    def test_dropped_without_budget(self):
+        assert encode_audio(_tone(), 16000, "wav", max_bytes=0) is None
+
+    def test_flac_roundtrip(self, tmp_path):
+        pytest.importorskip("soundfile")
+        audio = _tone()
+        path = tmp_path / "a.flac"
+        path.write_bytes(encode_audio(audio, 16000, "flac"))
+        samples, rate = load_audio(path)
+        assert rate == 16000
+        assert np.max(np.abs(samples - audio)) < 1e-3
+
+
+class TestRunManagerAudio:
+    def test_save_audio_and_replay(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path)
+        rm.start_run()
+        audio = _tone()
+        path = rm.save_audio(audio)
+        assert path.suffix == audio_artifacts.extension(rm.audio_codec)
+        assert rm.flush()
+        samples, rate = load_audio(path)
+        assert rate == 16000
+        assert len(samples) == len(audio)
+        assert rm.audio_stats["stored_bytes"] < rm.audio_stats["raw_bytes"]
+        rm.close()
+
+    def test_per_run_cap(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, audio_max_bytes=40000)
+        rm.start_run()
+        first = rm.save_audio(_tone(1.0), name="a")
+        second = rm.save_audio(_tone(1.0), name="b")
+        third = rm.save_audio(_tone(1.0), name="c")
+        assert rm.flush()
+        total = sum(p.stat().st_size for p in (first, second, third) if p.exists())
+        assert total <= 40000
+        assert first.exists()
+        assert not third.exists()
+        assert rm.audio_stats["dropped"] >= 1
+        # A new run gets a fresh budget
+        rm.start_run()
+        assert rm.save_audio(_tone(0.5)) is not None
+        assert rm.flush()
+        rm.close()
+
+    def test_no_run(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path)
+        assert rm.save_audio(_tone()) is None
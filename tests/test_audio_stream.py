@@ -0,0 +1,339 @@
+"""Tests for WebSocket audio ingestion (endpointing, incremental STT)."""
+
+import asyncio
+import wave
+
+import numpy as np
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from wanda_voice_core.api import WandaAPI
+from wanda_voice_core.audio_stream import (
+    SPEECH_END,
+    SPEECH_START,
+    AudioStreamSession,
+    Endpointer,
+    pcm16_to_float,
+)
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.providers.base import ProviderBase
+from wanda_voice_core.run_manager import RunManager
+from wanda_voice_core.ws_client import stream_files, wav_to_pcm16
+
+SR = 16000
+
+
+def tone(seconds, amp=0.3):
+    t = np.arange(int(seconds * SR)) / SR
+    return (amp * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SR), dtype=np.float32)
+
+
+def pcm(samples):
+    return (samples * 32767).astype("<i2").tobytes()
+
+
+class FakeSTT:
+    """Transcribes audio to its length in seconds."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, language="de"):
+        self.calls.append(len(audio))
+        return f"frage {round(len(audio) / SR, 1)}"
+
+
+class EchoProvider(ProviderBase):
+    name = "stub"
+
+    async def send(self, prompt, context=None):
+        return f"echo {prompt}"
+
+    def is_available(self):
+        return True
+
+
+def _engine(tmp_path):
+    engine = WandaVoiceEngine()
+    engine.run_manager = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+    engine.set_providers(EchoProvider())
+    engine.set_refiner_enabled(False)
+    return engine
+
+
+class TestEndpointer:
+    def test_detects_utterance_with_pre_roll(self):
+        ep = Endpointer(silence_timeout_s=0.3, pre_roll_ms=90)
+        events = ep.push(np.concatenate([silence(0.5), tone(1.0), silence(0.5)]))
+        assert [e.kind for e in events] == [SPEECH_START, SPEECH_END]
+        end = events[1]
+        assert end.reason == "silence"
+        # tone + pre-roll + trailing silence up to the timeout
+        assert 1.0 < len(end.audio) / SR < 1.5
+        assert not ep.speaking
+
+    def test_frames_split_across_pushes(self):
+        ep = Endpointer(silence_timeout_s=0.3)
+        audio = np.concatenate([tone(0.5), silence(0.5)])
+        events = []
+        for i in range(0, len(audio), 333):
+            events += ep.push(audio[i:i + 333])
+        assert [e.kind for e in events] == [SPEECH_START, SPEECH_END]
+
+    def test_short_blip_ignored(self):
+        ep = Endpointer(min_speech_ms=150)
+        assert ep.push(np.concatenate([tone(0.06), silence(1.0)])) == []
+
+    def test_max_length(self):
+        ep = Endpointer(max_seconds=1.0)
+        events = ep.push(tone(1.5))
+        assert events[1].reason == "max_length"
+        assert len(events[1].audio) == ep.max_frames * ep.frame_len
+        # Ongoing speech opens the next utterance
+        assert events[2].kind == SPEECH_START
+
+    def test_flush(self):
+        ep = Endpointer()
+        ep.push(tone(0.5))
+        event = ep.flush()
+        assert event.kind == SPEECH_END and event.reason == "flush"
+        assert ep.flush() is None
+
+    def test_pcm_conversion(self):
+        samples = pcm16_to_float(pcm(np.array([0.5, -0.5], dtype=np.float32)))
+        assert samples == pytest.approx([0.5, -0.5], abs=1e-3)
+
+
+class TestAudioStreamSession:
+    @pytest.mark.asyncio
+    async def test_partials_and_result(self, tmp_path):
+        engine = _engine(tmp_path)
+        stt = FakeSTT()
+        messages = []
+
+        async def send(msg):
+            messages.append(msg)
+
+        stream = AudioStreamSession(
+            engine, stt, send, session_id="sat1", partial_interval_s=0.5,
+            endpointer=Endpointer(silence_timeout_s=0.3),
+        )
+        data = pcm(np.concatenate([tone(2.0), silence(0.5)]))
+        for i in range(0, len(data), 641):  # odd sizes split samples
+            await stream.feed(data[i:i + 641])
+            await asyncio.sleep(0)
+        await stream.drain()
+        await stream.close()
+
+        kinds = [m["type"] for m in messages]
+        assert kinds[0] == "vad"
+        assert any(m["type"] == "transcript" and not m["final"] for m in messages)
+        final = [m for m in messages if m["type"] == "transcript" and m["final"]]
+        assert len(final) == 1
+        result = messages[-1]
+        assert result["type"] == "result"
+        assert result["response_text"] == f"echo {final[0]['text']}"
+        assert result["session_id"] == "sat1"
+        events = [m["event"]["event_type"] for m in messages if m["type"] == "event"]
+        assert events[0] == "run.start" and events[-1] == "run.end"
+        engine.run_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_transcript(self, tmp_path):
+        engine = _engine(tmp_path)
+
+        class Silent:
+            def transcribe(self, audio, language="de"):
+                return "  "
+
+        messages = []
+
+        async def send(msg):
+            messages.append(msg)
+
+        stream = AudioStreamSession(engine, Silent(), send, partial_interval_s=0)
+        await stream.feed(pcm(tone(0.5)))
+        await stream.finish()
+        assert messages[-1] == {"type": "result", "error": "No speech detected"}
+        engine.run_manager.close()
+
+
+    @pytest.mark.asyncio
+    async def test_feed_does_not_wait_for_pipeline(self, tmp_path):
+        engine = _engine(tmp_path)
+        provider = BlockingProvider()
+        engine.set_providers(provider)
+        messages = []
+
+        async def send(msg):
+            messages.append(msg)
+
+        stream = AudioStreamSession(
+            engine, FakeSTT(), send, partial_interval_s=0,
+            endpointer=Endpointer(silence_timeout_s=0.3),
+        )
+        utterance = pcm(np.concatenate([tone(0.5), silence(0.5)]))
+        await stream.feed(utterance)
+        await stream.feed(utterance)
+        await asyncio.wait_for(provider.started.wait(), 5)
+        # Both utterances were endpointed while the first run is in flight
+        vad = [m["state"] for m in messages if m["type"] == "vad"]
+        assert vad == ["speech", "silence", "speech", "silence"]
+        assert len(provider.prompts) == 1
+
+        provider.release.set()
+        await stream.finish()
+        results = [m["response_text"] for m in messages if m["type"] == "result"]
+        assert len(provider.prompts) == 2
+        assert results == [f"echo {p}" for p in provider.prompts]
+        await stream.close()
+        engine.run_manager.close()
+
+
+class BlockingProvider(ProviderBase):
+    """Answers only once release is set."""
+
+    name = "stub"
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.prompts = []
+
+    async def send(self, prompt, context=None):
+        self.prompts.append(prompt)
+        self.started.set()
+        await self.release.wait()
+        return f"echo {prompt}"
+
+    def is_available(self):
+        return True
+
+
+class TestAudioEndpoint:
+    @pytest.mark.asyncio
+    async def test_streams_wav_file(self, tmp_path):
+        path = tmp_path / "frage.wav"
+        audio = np.concatenate([silence(0.3), tone(1.2), silence(0.2)])
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(8000)  # client resamples to 16 kHz
+            w.writeframes(pcm(audio[::2]))
+        assert len(wav_to_pcm16(path)) == len(audio) * 2
+
+        engine = _engine(tmp_path / "runs")
+        client = TestClient(TestServer(WandaAPI(engine, stt_engine=FakeSTT()).create_app()))
+        await client.start_server()
+        try:
+            url = str(client.make_url("/v1/audio")).replace("http", "ws", 1)
+            results = await stream_files(url, [path], session_id="sat1")
+        finally:
+            await client.close()
+            engine.run_manager.close()
+        assert len(results) == 1
+        assert results[0]["response_text"].startswith("echo frage 1.")
+        assert results[0]["error"] is None
+
+    @pytest.mark.asyncio
+    async def test_without_stt(self):
+        client = TestClient(TestServer(WandaAPI(WandaVoiceEngine()).create_app()))
+        await client.start_server()
+        try:
+            ws = await client.ws_connect("/v1/audio")
+            msg = await ws.receive_json()
+            assert msg["type"] == "error"
+            await ws.close()
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_rejects_other_sample_rate(self, tmp_path):
+        client = TestClient(
+            TestServer(WandaAPI(_engine(tmp_path), stt_engine=FakeSTT()).create_app())
+        )
+        await client.start_server()
+        try:
+            ws = await client.ws_connect("/v1/audio")
+            await ws.send_json({"type": "start", "sample_rate": 44100})
+            msg = await ws.receive_json()
+            assert msg["type"] == "error" and "16000" in msg["error"]
+            await ws.close()
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stt_loaded_on_first_connection(self, tmp_path):
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return FakeSTT()
+
+        api = WandaAPI(_engine(tmp_path), stt_loader=loader)
+        client = TestClient(TestServer(api.create_app()))
+        await client.start_server()
+        try:
+            assert loads == []
+            for _ in range(2):
+                ws = await client.ws_connect("/v1/audio")
+                await ws.send_json({"type": "start", "sample_rate": SR})
+                assert (await ws.receive_json())["type"] == "ready"
+                await ws.close()
+        finally:
+            await client.close()
+            api.engine.run_manager.close()
+        assert loads == [1]
+        assert isinstance(api.stt_engine, FakeSTT)
+
+    @pytest.mark.asyncio
+    async def test_failed_stt_load_not_retried(self, tmp_path):
+        loads = []
+        api = WandaAPI(_engine(tmp_path), stt_loader=lambda: loads.append(1))
+        client = TestClient(TestServer(api.create_app()))
+        await client.start_server()
+        try:
+            for _ in range(2):
+                ws = await client.ws_connect("/v1/audio")
+                assert (await ws.receive_json())["type"] == "error"
+                await ws.close()
+        finally:
+            await client.close()
+            api.engine.run_manager.close()
+        assert loads == [1]
+
+    @pytest.mark.asyncio
+    async def test_reader_keeps_draining_during_pipeline(self, tmp_path):
+        engine = _engine(tmp_path)
+        provider = BlockingProvider()
+        engine.set_providers(provider)
+        client = TestClient(
+            TestServer(WandaAPI(engine, stt_engine=FakeSTT()).create_app())
+        )
+        await client.start_server()
+        try:
+            ws = await client.ws_connect("/v1/audio")
+            await ws.send_bytes(pcm(np.concatenate([tone(0.5), silence(1.5)])))
+            await asyncio.wait_for(provider.started.wait(), 5)
+            # Control messages are answered while the run is in flight
+            await ws.send_str("not json")
+            while (msg := await ws.receive_json(timeout=5))["type"] != "error":
+                assert msg["type"] != "result"
+            await ws.send_json({"type": "end"})
+            await ws.send_str("still not json")
+            assert (await ws.receive_json(timeout=5))["type"] == "error"
+
+            provider.release.set()
+            kinds = []
+            while not kinds or kinds[-1] != "end":
+                kinds.append((await ws.receive_json(timeout=5))["type"])
+            assert kinds[-2] == "result"
+            await ws.close()
+        finally:
+            await client.close()
+            engine.run_manager.close()
@@ -0,0 +1,186 @@
+"""Tests for the shared SSE broadcaster behind GET /v1/stream."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from wanda_voice_core.api import WandaAPI
+from wanda_voice_core.broadcaster import EventBroadcaster, EventFilter
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.event_bus import EventBus
+
+
+def _ids(frames):
+    return [int(f.split(b"\n", 1)[0][4:]) for f in frames]
+
+
+class TestEventFilter:
+    def test_exact_and_prefix(self):
+        flt = EventFilter(["run.end", "provider.*"])
+        assert flt.matches("run.end", None)
+        assert flt.matches("provider.request", None)
+        assert not flt.matches("run.start", None)
+
+    def test_run_id(self):
+        flt = EventFilter(run_id="r1")
+        assert flt.matches("anything", "r1")
+        assert not flt.matches("anything", "r2")
+
+    def test_empty_matches_all(self):
+        assert EventFilter([""]).matches("x", None)
+
+
+class TestEventBroadcaster:
+    @pytest.mark.asyncio
+    async def test_serializes_once_and_reads_from_cursor(self):
+        bus = EventBus()
+        b = EventBroadcaster(bus, capacity=8)
+        b.attach()
+        for i in range(3):
+            bus.emit("run.step", {"i": i}, run_id="r")
+        cursor, frames, missed = b.read(0, EventFilter())
+        assert (cursor, missed) == (3, 0)
+        assert _ids(frames) == [1, 2, 3]
+        # A second reader gets the very same bytes objects
+        assert b.read(0, EventFilter())[1][0] is frames[0]
+        b.detach()
+
+    @pytest.mark.asyncio
+    async def test_follow_stops_once_done_and_drained(self):
+        bus = EventBus()
+        b = EventBroadcaster(bus, capacity=8)
+        b.attach()
+        done = asyncio.get_running_loop().create_future()
+
+        async def run():
+            bus.emit("run.start", {}, run_id="r")
+            bus.emit("run.start", {}, run_id="other")
+            await asyncio.sleep(0.01)
+            bus.emit("run.end", {}, run_id="r")
+            done.set_result(None)
+
+        task = asyncio.create_task(run())
+        frames = [f async for f in b.follow(EventFilter(run_id="r"), done)]
+        await task
+        assert [f.split(b"\n")[1] for f in frames] == [
+            b"event: run.start",
+            b"event: run.end",
+        ]
+        b.detach()
+
+    @pytest.mark.asyncio
+    async def test_lapped_reader_reports_missed(self):
+        bus = EventBus()
+        b = EventBroadcaster(bus, capacity=4)
+        b.attach()
+        for i in range(10):
+            bus.emit("run.step", {"i": i})
+        cursor, frames, missed = b.read(2, EventFilter())
+        assert missed == 4
+        assert _ids(frames) == [7, 8, 9, 10]
+        assert cursor == 10
+        b.detach()
+
+    @pytest.mark.asyncio
+    async def test_events_from_other_threads(self):
+        bus = EventBus()
+        b = EventBroadcaster(bus, capacity=64)
+        b.attach()
+        threads = [
+            threading.Thread(target=lambda: [bus.emit("t.event", {}) for _ in range(10)])
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for _ in range(100):
+            if b.last_id == 40:
+                break
+            await asyncio.sleep(0.01)
+        assert b.last_id == 40
+        assert _ids(b.read(0, EventFilter(), limit=100)[1]) == list(range(1, 41))
+        b.detach()
+
+    @pytest.mark.asyncio
+    async def test_stream_filters_and_resumes(self):
+        bus = EventBus()
+        b = EventBroadcaster(bus, capacity=16)
+        b.attach()
+        bus.emit("run.start", {}, run_id="a")
+        bus.emit("run.start", {}, run_id="b")
+        bus.emit("run.end", {}, run_id="a")
+
+        frames = []
+
+        async def consume():
+            async for frame in b.stream(EventFilter(run_id="a"), last_event_id=0):
+                frames.append(frame)
+                if len(frames) == 3:
+                    return
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        bus.emit("run.step", {}, run_id="b")
+        bus.emit("run.step", {}, run_id="a")
+        await asyncio.wait_for(task, 1)
+        assert _ids(frames) == [1, 3, 5]
+        assert b.stats()["clients"] == 0
+        b.detach()
+
+    @pytest.mark.asyncio
+    async def test_detach_ends_streams(self):
+        bus = EventBus()
+        b = EventBroadcaster(bus)
+        b.attach()
+
+        async def consume():
+            return [frame async for frame in b.stream(EventFilter())]
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        b.detach()
+        assert await asyncio.wait_for(task, 1) == []
+        assert not bus._subscribers.get("*")
+
+
+class TestStreamEndpoint:
+    @pytest.mark.asyncio
+    async def test_last_event_id_resume(self):
+        engine = WandaVoiceEngine()
+        api = WandaAPI(engine)
+        client = TestClient(TestServer(api.create_app()))
+        await client.start_server()
+        try:
+            # First connection attaches the broadcaster at the live edge
+            resp = await client.get("/v1/stream")
+            engine.event_bus.emit("run.start", {}, run_id="x")
+            engine.event_bus.emit("provider.request", {}, run_id="x")
+            engine.event_bus.emit("run.end", {}, run_id="x")
+            first = await resp.content.readuntil(b"\n\n")
+            assert first.startswith(b"id: 1\nevent: run.start")
+            resp.close()
+
+            resp = await client.get(
+                "/v1/stream?types=run.*", headers={"Last-Event-ID": "1"}
+            )
+            frame = await resp.content.readuntil(b"\n\n")
+            assert frame.startswith(b"id: 3\nevent: run.end")
+            data = json.loads(frame.split(b"data: ", 1)[1])
+            assert data["run_id"] == "x"
+            resp.close()
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_invalid_last_event_id(self):
+        client = TestClient(TestServer(WandaAPI(WandaVoiceEngine()).create_app()))
+        await client.start_server()
+        try:
+            resp = await client.get("/v1/stream", headers={"Last-Event-ID": "abc"})
+            assert resp.status == 400
+        finally:
+            await client.close()
@@ -0,0 +1,184 @@
+"""Tests for concurrent runs, admission control and provider limits."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from wanda_voice_core.admission import AdmissionController, KeyedLimiter
+from wanda_voice_core.api import WandaAPI
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.providers.base import ProviderBase
+from wanda_voice_core.run_manager import RunManager
+from wanda_voice_core.schemas import OverloadedError, RunEvent
+
+
+class GateProvider(ProviderBase):
+    """Blocks every send until released; tracks peak concurrency."""
+
+    name = "gemini_cli"
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def send(self, prompt, context=None):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        return f"echo {prompt}"
+
+    def is_available(self):
+        return True
+
+
+def _engine(tmp_path, provider, **concurrency):
+    engine = WandaVoiceEngine()
+    engine.run_manager = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+    engine.set_providers(provider)
+    engine.set_refiner_enabled(False)
+    if concurrency:
+        engine.admission = AdmissionController(
+            concurrency.get("max_runs", 4), concurrency.get("max_queue", 16)
+        )
+        engine.provider_limits = KeyedLimiter(
+            "provider", concurrency.get("provider_limits", {})
+        )
+    return engine
+
+
+async def _wait_for(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+class TestRunContexts:
+    def test_overlapping_runs_keep_own_state(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+        a = rm.start_run()
+        b = rm.start_run()
+        for i in range(3):
+            rm.log_event(RunEvent(event_type="step", data={"i": i}, run_id=a))
+        rm.log_event(RunEvent(event_type="step", data={}, run_id=b))
+        rm.end_run({"result": "a"}, run_id=a)
+        assert rm.active_runs == [b]
+        rm.end_run({"result": "b"}, run_id=b)
+        assert rm.flush()
+        summary_a = json.loads((tmp_path / a / "summary.json").read_text())
+        summary_b = json.loads((tmp_path / b / "summary.json").read_text())
+        assert (summary_a["event_count"], summary_a["result"]) == (3, "a")
+        assert (summary_b["event_count"], summary_b["result"]) == (1, "b")
+        rm.close()
+
+    @pytest.mark.asyncio
+    async def test_current_run_is_per_task(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+
+        async def run(name):
+            run_id = rm.start_run()
+            await asyncio.sleep(0.01)
+            assert rm.current_run == run_id
+            rm.save_artifact("name.txt", name)
+            rm.end_run()
+            return run_id
+
+        ids = await asyncio.gather(run("a"), run("b"), run("c"))
+        assert rm.flush()
+        assert [(tmp_path / i / "name.txt").read_text() for i in ids] == ["a", "b", "c"]
+        assert rm.active_runs == []
+        rm.close()
+
+    @pytest.mark.asyncio
+    async def test_engine_runs_concurrently(self, tmp_path):
+        provider = GateProvider()
+        engine = _engine(tmp_path, provider, provider_limits={"gemini_cli": 4})
+        tasks = [
+            asyncio.create_task(engine.process_text(f"Frage {i}", skip_confirmation=True))
+            for i in range(3)
+        ]
+        await _wait_for(lambda: provider.active == 3)
+        assert len(engine.run_manager.active_runs) == 3
+        provider.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len({r.run_id for r in results}) == 3
+        for i, result in enumerate(results):
+            assert result.response_text == f"echo Frage {i}"
+        assert engine.run_manager.flush()
+        for result in results:
+            summary = json.loads(
+                (tmp_path / result.run_id / "summary.json").read_text()
+            )
+            assert summary["run_id"] == result.run_id
+            assert summary["result"] == result.response_text
+        engine.run_manager.close()
+
+
+class TestAdmission:
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        admission = AdmissionController(max_concurrent=1, max_queue=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with admission.slot():
+                await release.wait()
+
+        running = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await _wait_for(lambda: admission.waiting == 1)
+        with pytest.raises(OverloadedError):
+            async with admission.slot():
+                pass
+        release.set()
+        await asyncio.gather(running, queued)
+        assert admission.stats()["admitted"] == 2
+        assert admission.stats()["rejected"] == 1
+        assert admission.running == 0
+
+    @pytest.mark.asyncio
+    async def test_provider_limit(self, tmp_path):
+        provider = GateProvider()
+        engine = _engine(tmp_path, provider, provider_limits={"gemini_cli": 2})
+        tasks = [
+            asyncio.create_task(engine.process_text(f"Frage {i}", skip_confirmation=True))
+            for i in range(4)
+        ]
+        await _wait_for(lambda: provider.active == 2)
+        await asyncio.sleep(0.02)
+        assert provider.calls == 2
+        assert engine.provider_limits.stats()["gemini_cli"] == {"active": 2, "limit": 2}
+        provider.release.set()
+        await asyncio.gather(*tasks)
+        assert provider.peak == 2
+        engine.run_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_api_returns_429(self, tmp_path):
+        provider = GateProvider()
+        engine = _engine(tmp_path, provider, max_runs=1, max_queue=0)
+        client = TestClient(TestServer(WandaAPI(engine).create_app()))
+        await client.start_server()
+        try:
+            first = asyncio.create_task(
+                client.post("/v1/utterance", json={"text": "Erste Frage"})
+            )
+            await _wait_for(lambda: provider.active == 1)
+            resp = await client.post("/v1/utterance", json={"text": "Zweite Frage"})
+            assert resp.status == 429
+            assert resp.headers["Retry-After"] == "1"
+            provider.release.set()
+            assert (await first).status == 200
+        finally:
+            await client.close()
+            engine.run_manager.close()
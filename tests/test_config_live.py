@@ -0,0 +1,159 @@
+"""Tests for config snapshots, change notification and live reload."""
+
+import time
+
+import pytest
+import yaml
+
+from wanda_voice_core.config import ConfigSnapshot, VoiceCoreConfig
+from wanda_voice_core.config_watch import ConfigWatcher
+from wanda_voice_core.engine import WandaVoiceEngine
+
+
+def _write(path, data):
+    path.write_text(yaml.safe_dump(data))
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "voice.yaml"
+    _write(path, {"audio": {"silence_timeout": 1.5}, "refiner": {"enabled": True}})
+    return path
+
+
+class TestConfigSnapshot:
+    def test_flat_lookup(self):
+        snap = ConfigSnapshot.build({"a": {"b": {"c": 1}}, "d": [1, 2]})
+        assert snap.get("a.b.c") == 1
+        assert snap.get("a.b") == {"c": 1}
+        assert snap.get("d") == (1, 2)
+        assert snap.get("a.x", "fallback") == "fallback"
+
+    def test_immutable(self):
+        snap = ConfigSnapshot.build({"a": {"b": 1}})
+        with pytest.raises(TypeError):
+            snap.data["a"]["b"] = 2
+        assert snap.to_dict() == {"a": {"b": 1}}
+
+    def test_changed_keys(self):
+        old = ConfigSnapshot.build({"a": {"b": 1, "c": 2}, "x": 1})
+        new = ConfigSnapshot.build({"a": {"b": 1, "c": 3}, "y": 1})
+        assert old.changed_keys(new) == {"a.c", "x", "y"}
+        assert old.changed_keys(old) == set()
+
+
+class TestLiveConfig:
+    def test_loads_file_over_defaults(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        assert config.get("audio.silence_timeout") == 1.5
+        assert config.get("audio.sample_rate") == 16000
+
+    def test_update_notifies_matching_subscribers(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        audio, refiner, everything = [], [], []
+        config.subscribe("audio", lambda s, c: audio.append(c))
+        config.subscribe(["refiner.enabled"], lambda s, c: refiner.append(c))
+        config.subscribe("*", lambda s, c: everything.append(s.version))
+
+        assert config.update({"audio": {"silence_timeout": 0.8}}) == {
+            "audio.silence_timeout"
+        }
+        assert audio == [{"audio.silence_timeout"}]
+        assert refiner == []
+        assert everything == [1]
+        assert config.get("audio.silence_timeout") == 0.8
+        # Unchanged values don't bump the version or notify
+        assert config.update({"audio": {"silence_timeout": 0.8}}) == set()
+        assert everything == [1]
+
+    def test_overrides_survive_reload(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        config.update({"api": {"max_batch": 2}})
+        _write(config_file, {"audio": {"silence_timeout": 2.0}})
+        assert config.reload() == {"audio.silence_timeout"}
+        assert config.get("api.max_batch") == 2
+
+    def test_invalid_file_keeps_snapshot(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        before = config.snapshot
+        config_file.write_text("audio: [unclosed")
+        assert config.reload() == set()
+        assert config.snapshot is before
+
+    def test_listener_error_does_not_block_others(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        seen = []
+
+        def broken(snapshot, changed):
+            raise RuntimeError("boom")
+
+        config.subscribe("*", broken)
+        config.subscribe("*", lambda s, c: seen.append(c))
+        config.update({"refiner": {"enabled": False}})
+        assert seen == [{"refiner.enabled"}]
+
+
+class TestEngineReload:
+    def test_engine_applies_changes(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        engine = WandaVoiceEngine(config)
+        config.update(
+            {"refiner": {"enabled": False}, "router": {"confidence_threshold": 0.9}}
+        )
+        assert engine.refiner_enabled is False
+        assert engine.router.confidence_threshold == 0.9
+        reloads = [
+            e for e in engine.event_bus.get_recent_events(20)
+            if e.event_type == "config.reload"
+        ]
+        assert reloads[-1].data["changed"] == [
+            "refiner.enabled",
+            "router.confidence_threshold",
+        ]
+
+    def test_unrelated_keys_are_ignored(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        engine = WandaVoiceEngine(config)
+        config.update({"stt": {"model": "small"}})
+        assert not any(
+            e.event_type == "config.reload"
+            for e in engine.event_bus.get_recent_events(20)
+        )
+
+
+class TestConfigWatcher:
+    def test_reloads_on_rewrite(self, config_file):
+        config = VoiceCoreConfig(config_file)
+        assert config.watch(debounce_s=0.05)
+        try:
+            # Editors often save via temp file + rename
+            tmp = config_file.with_suffix(".tmp")
+            _write(tmp, {"audio": {"silence_timeout": 0.7}})
+            tmp.replace(config_file)
+            assert _wait_for(lambda: config.get("audio.silence_timeout") == 0.7)
+        finally:
+            config.stop_watching()
+
+    def test_poll_backend(self, config_file, monkeypatch):
+        monkeypatch.setattr(ConfigWatcher, "_open_inotify", lambda self: None)
+        calls = []
+        watcher = ConfigWatcher(
+            config_file, lambda: calls.append(1), poll_interval_s=0.05
+        )
+        watcher.start()
+        try:
+            assert watcher.backend == "poll"
+            time.sleep(0.1)
+            _write(config_file, {"audio": {"silence_timeout": 3.0, "x": 1}})
+            assert _wait_for(lambda: calls)
+        finally:
+            watcher.stop()
@@ -0,0 +1,130 @@
+"""Tests for priority-aware context packing and token counting."""
+
+from wanda_voice_core.context_packer import ContextPacker, Priority, Segment
+from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
+from wanda_voice_core.sessions import SessionStore, release_session, use_session
+from wanda_voice_core.token_economy import (
+    TokenCounter,
+    count_tokens,
+    truncate_to_tokens,
+)
+
+
+class TestCountTokens:
+    def test_empty(self):
+        assert count_tokens("") == 0
+
+    def test_words_and_punctuation(self):
+        assert count_tokens("Hallo, Welt!") >= 4
+
+    def test_cached(self):
+        count_tokens.cache_clear()
+        count_tokens("Wiederholter Verlauf")
+        count_tokens("Wiederholter Verlauf")
+        assert count_tokens.cache_info().hits >= 1
+
+    def test_cache_is_bounded_and_holds_no_text(self):
+        counter = TokenCounter(maxsize=2)
+        for text in ("eins zwei", "drei", "vier fünf sechs"):
+            counter(text)
+        assert counter.cache_info().currsize == 2
+        assert not any(
+            isinstance(part, str) for key in counter._cache for part in key
+        )
+        assert counter("vier fünf sechs") == count_tokens("vier fünf sechs")
+        assert counter.cache_info().hits == 1
+
+    def test_truncate_to_tokens(self):
+        text = "wort " * 500
+        cut = truncate_to_tokens(text, 50)
+        assert count_tokens(cut) <= 50
+        assert text.startswith(cut)
+        tail = truncate_to_tokens(text + "ende", 50, keep_end=True)
+        assert count_tokens(tail) <= 50
+        assert tail.endswith("ende")
+
+
+class TestContextPacker:
+    def test_everything_fits(self):
+        packer = ContextPacker(max_tokens=1000)
+        segments = [
+            Segment("System", Priority.SYSTEM, "context"),
+            Segment("user: a", Priority.OLDER, "history"),
+            Segment("assistant: b", Priority.RECENT, "history"),
+            Segment("User: frage", Priority.PROMPT, "prompt"),
+        ]
+        assert packer.pack_text(segments) == (
+            "System\n\nuser: a\nassistant: b\n\nUser: frage"
+        )
+
+    def test_prompt_survives_long_history(self):
+        packer = ContextPacker(max_tokens=60)
+        segments = [
+            Segment(f"user: {'alt ' * 20}{i}", Priority.OLDER, "history")
+            for i in range(20)
+        ]
+        segments.append(Segment("User: Was ist die Frage?", Priority.PROMPT, "prompt"))
+        text = packer.pack_text(segments)
+        assert text.endswith("User: Was ist die Frage?")
+
+    def test_recent_turns_beat_older_and_stay_contiguous(self):
+        packer = ContextPacker(max_tokens=30)
+        segments = [
+            Segment("user: " + "alt " * 30, Priority.OLDER, "history"),
+            Segment("user: kurz alt", Priority.OLDER, "history"),
+            Segment("assistant: neu", Priority.RECENT, "history"),
+            Segment("User: frage", Priority.PROMPT, "prompt"),
+        ]
+        kept = [s.text for s in packer.pack(segments)]
+        assert "assistant: neu" in kept
+        assert "user: kurz alt" in kept
+        assert not any(t.startswith("user: alt") for t in kept)
+
+    def test_oversized_prompt_is_truncated_not_dropped(self):
+        packer = ContextPacker(max_tokens=20)
+        kept = packer.pack([Segment("User: " + "x " * 200, Priority.PROMPT)])
+        assert len(kept) == 1
+        assert count_tokens(kept[0].text) <= 20
+
+    def test_summary_ranks_below_recent_and_keeps_its_end(self):
+        packer = ContextPacker(max_tokens=40)
+        segments = [
+            Segment("alt " * 100 + "zuletzt", Priority.SUMMARY, "summary"),
+            Segment("user: " + "frueher " * 30, Priority.OLDER, "history"),
+            Segment("assistant: neu", Priority.RECENT, "history"),
+            Segment("User: frage", Priority.PROMPT, "prompt"),
+        ]
+        kept = packer.pack(segments)
+        assert [s.priority for s in kept] == [
+            Priority.SUMMARY,
+            Priority.RECENT,
+            Priority.PROMPT,
+        ]
+        assert kept[0].text.endswith("zuletzt")
+        assert sum(count_tokens(s.text) + 1 for s in kept) <= 40
+
+
+class TestGeminiPromptPacking:
+    def test_question_is_last_with_long_history(self):
+        provider = GeminiCLIProvider()
+        for i in range(12):
+            provider._update_history("frage " * 300, "antwort " * 300)
+        prompt = provider._build_prompt("Wie spät ist es?")
+        assert prompt.endswith("User: Wie spät ist es?")
+        assert count_tokens(prompt) <= provider.packer.max_tokens
+
+    def test_session_summary_fills_summary_tier(self):
+        provider = GeminiCLIProvider()
+        store = SessionStore(max_turns=1)
+        session = store.get("s")
+        for i in range(3):
+            store.record_turn(session, f"frage {i}", f"antwort {i}")
+        token = use_session(session)
+        try:
+            prompt = provider._build_prompt("weiter", context=session.summary)
+            with_system = provider._build_prompt("weiter", context="System")
+        finally:
+            release_session(token)
+        assert prompt.startswith("Earlier in this conversation:\n")
+        assert prompt.count("frage 0") == 1  # not repeated as system context
+        assert with_system.startswith("System\n\nEarlier in this conversation:")
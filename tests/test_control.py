@@ -0,0 +1,128 @@
+"""Tests for the local control socket (daemon/client split)."""
+
+import asyncio
+import socket
+import threading
+
+import pytest
+
+from wanda_voice_core.control import (
+    ControlClient,
+    ControlError,
+    ControlServer,
+    encode_message,
+    forward_cli,
+)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=2)
+    loop.close()
+
+
+@pytest.fixture
+def server(loop, tmp_path):
+    srv = ControlServer(tmp_path / "ctl.sock")
+    state = {"refiner": True}
+
+    async def send_text(args):
+        return {"response_text": f"echo {args['text']}", "error": None,
+                "session": args.get("session_id")}
+
+    def refiner(args):
+        state["refiner"] = args["enabled"]
+        return {"refiner_enabled": state["refiner"]}
+
+    def fail(args):
+        raise RuntimeError("kaputt")
+
+    srv.register("send_text", send_text)
+    srv.register("refiner", refiner)
+    srv.register("status", lambda args: {"refiner_enabled": state["refiner"]})
+    srv.register("fail", fail)
+    asyncio.run_coroutine_threadsafe(srv.start(), loop).result(timeout=2)
+    yield srv
+    asyncio.run_coroutine_threadsafe(srv.stop(), loop).result(timeout=2)
+
+
+class TestControlSocket:
+    def test_roundtrip(self, server):
+        client = ControlClient(server.socket_path)
+        assert client.available()
+        assert client.call("send_text", text="hallo")["response_text"] == "echo hallo"
+        assert client.call("refiner", enabled=False) == {"refiner_enabled": False}
+        assert client.call("status") == {"refiner_enabled": False}
+
+    def test_socket_is_owner_only(self, server):
+        assert server.socket_path.stat().st_mode & 0o777 == 0o600
+
+    def test_errors(self, server):
+        client = ControlClient(server.socket_path)
+        with pytest.raises(ControlError, match="kaputt"):
+            client.call("fail")
+        with pytest.raises(ControlError, match="unknown command"):
+            client.call("nope")
+
+    def test_many_requests_on_one_connection(self, server):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(server.socket_path))
+        for _ in range(3):
+            sock.sendall(encode_message({"cmd": "ping"}))
+        data = b""
+        while data.count(b"pong") < 3:
+            data += sock.recv(4096)
+        sock.close()
+
+    def test_not_running(self, tmp_path):
+        client = ControlClient(tmp_path / "missing.sock")
+        assert not client.available()
+        with pytest.raises(ControlError):
+            client.call("status")
+
+    def test_stale_socket_replaced(self, loop, tmp_path):
+        path = tmp_path / "stale.sock"
+        dead = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        dead.bind(str(path))
+        dead.close()  # file remains, nobody listens
+        srv = ControlServer(path)
+        asyncio.run_coroutine_threadsafe(srv.start(), loop).result(timeout=2)
+        assert ControlClient(path).available()
+        asyncio.run_coroutine_threadsafe(srv.stop(), loop).result(timeout=2)
+        assert not path.exists()
+
+    def test_refuses_live_socket(self, loop, server):
+        other = ControlServer(server.socket_path)
+        with pytest.raises(ControlError):
+            asyncio.run_coroutine_threadsafe(other.start(), loop).result(timeout=2)
+
+
+class TestForwardCli:
+    def test_send_text(self, server, capsys):
+        code = forward_cli(
+            ["--send-text", "hallo", "--session", "cli", "--socket", str(server.socket_path)]
+        )
+        assert code == 0
+        assert "echo hallo" in capsys.readouterr().out
+
+    def test_refiner_and_status(self, server, capsys):
+        assert forward_cli(["--refiner", "off", "--socket", str(server.socket_path)]) == 0
+        assert forward_cli(["--status", "--socket", str(server.socket_path)]) == 0
+        out = capsys.readouterr().out
+        assert "Refiner off" in out
+        assert '"refiner_enabled": false' in out
+
+    def test_falls_back_without_daemon(self, tmp_path):
+        sock = str(tmp_path / "missing.sock")
+        assert forward_cli(["--send-text", "hallo", "--socket", sock]) is None
+        assert forward_cli(["--send-text", "hallo", "--client", "--socket", sock]) == 1
+        assert forward_cli(["--status", "--socket", sock]) == 1
+
+    def test_no_client_flags(self, server):
+        assert forward_cli(["--daemon"]) is None
+        assert forward_cli(["--send-text", "x", "--local"]) is None
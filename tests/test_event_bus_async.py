@@ -0,0 +1,103 @@
+"""Tests for asynchronous EventBus dispatch with bounded queues."""
+
+import threading
+import time
+import pytest
+
+from wanda_voice_core.event_bus import AsyncSubscriber, EventBus
+
+
+class TestAsyncDispatch:
+    def test_slow_subscriber_does_not_block_emit(self):
+        bus = EventBus()
+        release = threading.Event()
+        received = []
+
+        def slow(event):
+            release.wait(2)
+            received.append(event.event_type)
+
+        bus.subscribe("*", slow, dispatch="async")
+        start = time.monotonic()
+        for _ in range(10):
+            bus.emit("vad.speech")
+        assert time.monotonic() - start < 0.5
+
+        release.set()
+        assert bus.flush(timeout=2)
+        assert received == ["vad.speech"] * 10
+        bus.clear()
+
+    def test_drop_oldest(self):
+        release = threading.Event()
+        seen = []
+
+        def slow(event):
+            release.wait(2)
+            seen.append(event.data["i"])
+
+        sub = AsyncSubscriber(slow, max_queue=2, overflow="drop_oldest")
+        bus = EventBus()
+        for i in range(6):
+            sub(bus.emit("x", {"i": i}))
+            time.sleep(0.01)
+        release.set()
+        sub.flush()
+        assert seen[-2:] == [4, 5]
+        assert sub.dropped > 0
+        sub.stop()
+
+    def test_drop_newest(self):
+        release = threading.Event()
+        seen = []
+
+        def slow(event):
+            release.wait(2)
+            seen.append(event.data["i"])
+
+        sub = AsyncSubscriber(slow, max_queue=2, overflow="drop_newest")
+        bus = EventBus()
+        for i in range(6):
+            sub(bus.emit("x", {"i": i}))
+            time.sleep(0.01)
+        release.set()
+        sub.flush()
+        assert 5 not in seen
+        assert sub.stats()["dropped"] > 0
+        sub.stop()
+
+    def test_block_keeps_every_event(self):
+        seen = []
+        sub = AsyncSubscriber(
+            lambda e: (time.sleep(0.005), seen.append(e.data["i"])),
+            max_queue=1,
+            overflow="block",
+        )
+        bus = EventBus()
+        for i in range(10):
+            sub(bus.emit("x", {"i": i}))
+        sub.flush()
+        assert seen == list(range(10))
+        assert sub.dropped == 0
+        sub.stop()
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            AsyncSubscriber(lambda e: None, overflow="explode")
+
+    def test_unsubscribe_stops_worker(self):
+        bus = EventBus()
+        seen = []
+        bus.subscribe("x", seen.append, dispatch="async")
+        assert len(bus.subscriber_stats()) == 1
+        bus.unsubscribe("x", seen.append)
+        assert bus.subscriber_stats() == []
+        bus.emit("x")
+        assert seen == []
+
+    def test_sync_default_unchanged(self):
+        bus = EventBus()
+        seen = []
+        bus.subscribe("x", seen.append)
+        bus.emit("x")
+        assert len(seen) == 1
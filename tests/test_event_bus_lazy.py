@@ -0,0 +1,108 @@
+"""Tests for lazy payloads, sampling and history capture in EventBus."""
+
+import pytest
+
+from wanda_voice_core.event_bus import EventBus
+from wanda_voice_core.schemas import RunEvent
+
+
+class TestLazyPayload:
+    def test_unobserved_event_not_built(self):
+        bus = EventBus(no_history=["vad.speech"])
+        calls = []
+
+        def payload():
+            calls.append(1)
+            return {"energy": 0.1}
+
+        assert bus.emit("vad.speech", payload) is None
+        assert calls == []
+        assert bus.emit_stats()["skipped"] == 1
+        assert bus.get_recent_events() == []
+
+    def test_payload_built_for_subscriber(self):
+        bus = EventBus(no_history=["vad.speech"])
+        received = []
+        bus.subscribe("vad.speech", received.append)
+        event = bus.emit("vad.speech", lambda: {"energy": 0.1})
+        assert event.data == {"energy": 0.1}
+        assert received == [event]
+        # Delivered, but still kept out of the history
+        assert bus.get_recent_events() == []
+
+    def test_payload_built_for_history(self):
+        bus = EventBus()
+        bus.emit("stt.result", lambda: {"text": "hallo"}, run_id="r1")
+        assert bus.get_events_for_run("r1")[0].data == {"text": "hallo"}
+
+    def test_wildcard_counts_as_observer(self):
+        bus = EventBus(no_history=["vad.speech"])
+        received = []
+        bus.subscribe("*", received.append)
+        assert bus.wants("vad.speech")
+        bus.emit("vad.speech", lambda: {})
+        assert len(received) == 1
+
+    def test_payload_error_does_not_raise(self):
+        bus = EventBus()
+        event = bus.emit("error", lambda: 1 / 0)
+        assert "payload_error" in event.data
+
+    def test_wants(self):
+        bus = EventBus(no_history=["vad.speech"])
+        assert not bus.wants("vad.speech")
+        assert bus.wants("run.start")
+        bus.subscribe("vad.speech", lambda e: None)
+        assert bus.wants("vad.speech")
+
+    def test_unsubscribe_restores_fast_path(self):
+        bus = EventBus(no_history=["vad.speech"])
+        cb = lambda e: None  # noqa: E731
+        bus.subscribe("vad.speech", cb)
+        bus.unsubscribe("vad.speech", cb)
+        assert not bus.wants("vad.speech")
+
+
+class TestSampling:
+    def test_keeps_every_nth(self):
+        bus = EventBus(sample_every={"vad.speech": 5})
+        received = []
+        bus.subscribe("vad.speech", received.append)
+        for i in range(20):
+            bus.emit("vad.speech", {"i": i})
+        assert [e.data["i"] for e in received] == [0, 5, 10, 15]
+        assert bus.emit_stats()["sampled_out"] == 16
+
+    def test_other_types_unaffected(self):
+        bus = EventBus(sample_every={"vad.speech": 5})
+        for _ in range(3):
+            bus.emit("run.start", {})
+        assert len(bus.get_recent_events()) == 3
+
+    def test_presampled_emit(self):
+        bus = EventBus(sample_every={"vad.speech": 3})
+        kept = [bus.sample("vad.speech") for _ in range(6)]
+        assert kept == [True, False, False, True, False, False]
+        assert bus.emit("vad.speech", {}, sampled=True) is not None
+        assert bus.emit_stats()["sampled_out"] == 4
+
+    def test_disable_sampling(self):
+        bus = EventBus(sample_every={"vad.speech": 5})
+        bus.set_sampling("vad.speech", 1)
+        for _ in range(3):
+            bus.emit("vad.speech", {})
+        assert len(bus.get_recent_events()) == 3
+
+
+class TestRecords:
+    def test_run_event_has_slots(self):
+        event = RunEvent(event_type="run.start")
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = 1
+
+    def test_event_type_interned(self):
+        bus = EventBus()
+        name = "".join(["run.", "start"])
+        event = bus.emit(name, {})
+        assert event.event_type is bus.emit("run.start", {}).event_type
@@ -0,0 +1,63 @@
+"""Tests for the per-run event index in EventBus."""
+
+from wanda_voice_core.event_bus import EventBus
+
+
+class TestRunIndex:
+    def test_events_survive_rolling_history(self):
+        bus = EventBus(max_history=5)
+        for i in range(20):
+            bus.emit("run.step", {"i": i}, run_id="a")
+            bus.emit("run.step", {"i": i}, run_id="b")
+        events = bus.get_events_for_run("a")
+        assert [e.data["i"] for e in events] == list(range(20))
+        assert all(e.run_id == "a" for e in events)
+
+    def test_unknown_run(self):
+        bus = EventBus()
+        bus.emit("run.step", {}, run_id="a")
+        assert bus.get_events_for_run("missing") == []
+
+    def test_events_without_run_id_not_indexed(self):
+        bus = EventBus()
+        bus.emit("provider.health", {})
+        assert bus.run_index_stats()["runs"] == 0
+
+    def test_per_run_cap_keeps_newest(self):
+        bus = EventBus(max_events_per_run=3)
+        for i in range(10):
+            bus.emit("run.step", {"i": i}, run_id="a")
+        assert [e.data["i"] for e in bus.get_events_for_run("a")] == [7, 8, 9]
+
+    def test_lru_eviction_by_run_count(self):
+        bus = EventBus(max_runs=2)
+        bus.emit("run.step", {}, run_id="a")
+        bus.emit("run.step", {}, run_id="b")
+        bus.get_events_for_run("a")  # touch: b is now least recently used
+        bus.emit("run.step", {}, run_id="c")
+        assert bus.get_events_for_run("b") == []
+        assert len(bus.get_events_for_run("a")) == 1
+        assert len(bus.get_events_for_run("c")) == 1
+
+    def test_eviction_by_memory_cap(self):
+        bus = EventBus(max_run_bytes=2000)
+        for run in range(10):
+            bus.emit("run.step", {"text": "x" * 500}, run_id=str(run))
+        stats = bus.run_index_stats()
+        assert stats["bytes_est"] <= 2000
+        assert stats["runs"] < 10
+        assert len(bus.get_events_for_run("9")) == 1
+        assert bus.get_events_for_run("0") == []
+
+    def test_returns_copy(self):
+        bus = EventBus()
+        bus.emit("run.step", {}, run_id="a")
+        bus.get_events_for_run("a").clear()
+        assert len(bus.get_events_for_run("a")) == 1
+
+    def test_clear_resets_index(self):
+        bus = EventBus()
+        bus.emit("run.step", {}, run_id="a")
+        bus.clear()
+        assert bus.get_events_for_run("a") == []
+        assert bus.run_index_stats() == {"runs": 0, "events": 0, "bytes_est": 0}
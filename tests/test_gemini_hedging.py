@@ -0,0 +1,178 @@
+"""Tests for latency tracking and hedged requests in the Gemini CLI provider."""
+
+import asyncio
+import pytest
+
+from wanda_voice_core.event_bus import EventBus
+from wanda_voice_core.latency import LatencyStats, LatencyTracker
+from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
+
+
+@pytest.fixture
+def provider():
+    p = GeminiCLIProvider(
+        model="flash",
+        timeout=5,
+        max_retries=0,
+        fallback_model="pro",
+        local_fallback=False,
+        hedge_initial_delay=0.05,
+        hedge_min_delay=0.01,
+    )
+    p.event_bus = EventBus()
+    return p
+
+
+class TestLatencyTracker:
+    def test_percentiles(self):
+        stats = LatencyStats()
+        for v in range(1, 11):
+            stats.add(float(v))
+        assert stats.percentile(0.5) == 5.0
+        assert stats.percentile(0.9) == 9.0
+        assert stats.percentile(1.0) == 10.0
+
+    def test_ewma(self):
+        stats = LatencyStats(alpha=0.5)
+        stats.add(2.0)
+        stats.add(4.0)
+        assert stats.ewma == 3.0
+
+    def test_min_samples(self):
+        tracker = LatencyTracker()
+        tracker.record("flash", 1.0)
+        assert tracker.percentile("flash", 0.9, min_samples=5) is None
+        assert tracker.percentile("flash", 0.9) == 1.0
+        assert tracker.percentile("missing", 0.9) is None
+
+    def test_censored_samples_count_towards_percentiles(self):
+        tracker = LatencyTracker()
+        for _ in range(8):
+            tracker.record("flash", 2.0)
+        tracker.record("flash", 90.0, censored=True)
+        tracker.record("flash", 90.0, censored=True)
+        assert tracker.percentile("flash", 0.9) == 90.0
+        assert tracker.get("flash").to_dict()["censored"] == 2
+
+
+class TestHedgeDelay:
+    def test_initial_delay_without_samples(self, provider):
+        delay, reason = provider.hedge_delay()
+        assert delay == 0.05
+        assert reason == "initial"
+
+    def test_uses_observed_p90(self, provider):
+        for v in (1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 2.0, 2.0, 4.0):
+            provider.latency.record("flash", v)
+        delay, reason = provider.hedge_delay()
+        assert delay == 2.0
+        assert reason == "p90"
+
+    def test_clamped_to_timeout(self, provider):
+        for _ in range(10):
+            provider.latency.record("flash", 60.0)
+        delay, _ = provider.hedge_delay()
+        assert delay == provider.timeout
+
+    @pytest.mark.asyncio
+    async def test_timeouts_raise_the_hedge_delay(self, provider, tmp_path):
+        script = tmp_path / "gemini"
+        script.write_text("#!/bin/sh\nexec sleep 5\n")
+        script.chmod(0o755)
+        provider.gemini_path = str(script)
+        for _ in range(5):
+            provider.latency.record("flash", 0.1)
+        for _ in range(2):
+            assert await provider._call_gemini("flash", "hi", 0.3) is None
+        stats = provider.latency.get("flash")
+        assert (stats.count, stats.censored) == (7, 2)
+        assert provider.hedge_delay() == (0.3, "p90")
+
+
+class TestHedgedSend:
+    @pytest.mark.asyncio
+    async def test_fast_primary_no_hedge(self, provider):
+        calls = []
+
+        async def fake_call(model, prompt, timeout):
+            calls.append(model)
+            return "primary answer"
+
+        provider._call_gemini = fake_call
+        events = []
+        provider.event_bus.subscribe("provider.hedge", events.append)
+
+        assert await provider.send("hi") == "primary answer"
+        assert calls == ["flash"]
+        assert events == []
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_hedge(self, provider):
+        cancelled = []
+
+        async def fake_call(model, prompt, timeout):
+            if model == "flash":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(model)
+                    raise
+                return "slow"
+            return "hedge answer"
+
+        provider._call_gemini = fake_call
+        hedges, results = [], []
+        provider.event_bus.subscribe("provider.hedge", hedges.append)
+        provider.event_bus.subscribe("provider.hedge_result", results.append)
+
+        result = await asyncio.wait_for(provider.send("hi"), timeout=2)
+
+        assert result == "hedge answer"
+        assert cancelled == ["flash"]
+        assert hedges[0].data["decision"] == "hedge"
+        assert hedges[0].data["hedge_to"] == "pro"
+        assert results[0].data["winner"] == "hedge"
+        assert results[0].data["cancelled"] == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_primary_wins_after_hedge(self, provider):
+        async def fake_call(model, prompt, timeout):
+            if model == "flash":
+                await asyncio.sleep(0.1)
+                return "primary answer"
+            await asyncio.sleep(5)
+            return "slow hedge"
+
+        provider._call_gemini = fake_call
+        results = []
+        provider.event_bus.subscribe("provider.hedge_result", results.append)
+
+        result = await asyncio.wait_for(provider.send("hi"), timeout=2)
+
+        assert result == "primary answer"
+        assert results[0].data["winner"] == "primary"
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_goes_straight_to_fallback(self, provider):
+        calls = []
+
+        async def fake_call(model, prompt, timeout):
+            calls.append(model)
+            return None if model == "flash" else "fallback answer"
+
+        provider._call_gemini = fake_call
+        provider.hedge_initial_delay = 10.0
+
+        result = await asyncio.wait_for(provider.send("hi"), timeout=2)
+
+        assert result == "fallback answer"
+        assert calls == ["flash", "pro"]
+
+    @pytest.mark.asyncio
+    async def test_all_fail(self, provider):
+        async def fake_call(model, prompt, timeout):
+            return None
+
+        provider._call_gemini = fake_call
+        result = await provider.send("hi")
+        assert "nicht erreichbar" in result
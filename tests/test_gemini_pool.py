@@ -0,0 +1,116 @@
+"""Tests for the warm Gemini CLI process pool."""
+
+import asyncio
+import stat
+import pytest
+
+from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
+from wanda_voice_core.providers.gemini_pool import GeminiProcessPool
+
+
+@pytest.fixture
+def fake_gemini(tmp_path):
+    """A stand-in CLI that echoes stdin back (ignores model and '-')."""
+    script = tmp_path / "gemini"
+    script.write_text("#!/bin/sh\nexec cat\n")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+class TestGeminiProcessPool:
+    @pytest.mark.asyncio
+    async def test_warm_worker_is_used(self, fake_gemini):
+        pool = GeminiProcessPool(gemini_path=fake_gemini, size=1)
+        await pool.warm("flash")
+        assert pool.stats()["idle"]["flash"] == 1
+
+        result = await pool.run("flash", b"hallo", timeout=5)
+
+        assert result.returncode == 0
+        assert result.stdout == b"hallo"
+        assert result.warm is True
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cold_spawn_when_empty_then_replenished(self, fake_gemini):
+        pool = GeminiProcessPool(gemini_path=fake_gemini, size=1)
+
+        result = await pool.run("flash", b"eins", timeout=5)
+        assert result.warm is False
+        assert pool.latency.get("cold_first_byte").count == 1
+
+        # Replacement worker was spawned in the background
+        await asyncio.gather(*list(pool._tasks))
+        result = await pool.run("flash", b"zwei", timeout=5)
+        assert result.warm is True
+        assert result.saved_s is not None
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_size_bounded(self, fake_gemini):
+        pool = GeminiProcessPool(gemini_path=fake_gemini, size=2)
+        await pool.warm("flash")
+        await pool.warm("flash")
+        assert pool.stats()["idle"]["flash"] == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_drops_dead_workers(self, fake_gemini):
+        pool = GeminiProcessPool(gemini_path=fake_gemini, size=1)
+        await pool.warm("flash")
+        worker = pool._idle["flash"][0]
+        worker.proc.kill()
+        await worker.proc.wait()
+
+        assert pool.health_check() == 1
+        await asyncio.gather(*list(pool._tasks))
+        assert pool._idle["flash"][0] is not worker
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_recycles_stale_workers(self, fake_gemini):
+        pool = GeminiProcessPool(gemini_path=fake_gemini, size=1, max_idle_s=0)
+        await pool.warm("flash")
+        assert pool.health_check() == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_background_health_check_replaces_stale_workers(
+        self, fake_gemini
+    ):
+        pool = GeminiProcessPool(
+            gemini_path=fake_gemini, size=1, max_idle_s=0.05, health_interval_s=0.02
+        )
+        await pool.warm("flash")
+        first = pool._idle["flash"][0]
+        await asyncio.sleep(0.3)
+        assert first.proc.returncode is not None
+        assert pool._idle["flash"] and pool._idle["flash"][0] is not first
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self, tmp_path):
+        script = tmp_path / "gemini"
+        # Child process keeps the pipes open unless the whole group is killed
+        script.write_text("#!/bin/sh\nsleep 30\n")
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        pool = GeminiProcessPool(gemini_path=str(script), size=0)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run("flash", b"hallo", timeout=0.2)
+        await asyncio.wait_for(pool.close(), timeout=5)
+        assert not pool._procs
+
+
+class TestProviderWithPool:
+    @pytest.mark.asyncio
+    async def test_send_uses_pool(self, fake_gemini):
+        provider = GeminiCLIProvider(
+            gemini_path=fake_gemini, pool_size=1, hedge=False, local_fallback=False
+        )
+        await provider.warm_pool()
+
+        result = await provider.send("Wie spät ist es?")
+
+        assert result.endswith("User: Wie spät ist es?")
+        await provider.close()
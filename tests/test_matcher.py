@@ -0,0 +1,181 @@
+"""Tests for the compiled command matcher and its call sites."""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+import pytest
+
+from wanda_voice_core import matcher
+from wanda_voice_core.confirmation import detect_confirmation_command
+from wanda_voice_core.matcher import (
+    BKTree,
+    CommandMatcher,
+    koelner_phonetik,
+    levenshtein,
+)
+from wanda_voice_core.router import COMMAND_KEYWORDS, IntentRouter
+from wanda_voice_core.schemas import ConfirmationState
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "wanda-voice"))
+
+from audio.wake_word import SimpleWakeWordDetector  # noqa: E402
+from conversation.command_detector import ConversationalCommandDetector  # noqa: E402
+from conversation.state_machine import StateMachine, WandaMode  # noqa: E402
+
+
+class TestPrimitives:
+    def test_levenshtein(self):
+        assert levenshtein("wanda", "wanda") == 0
+        assert levenshtein("wanda", "vanda") == 1
+        assert levenshtein("abschicken", "abschike") == 2
+        assert levenshtein("", "abc") == 3
+
+    @pytest.mark.parametrize(
+        "word, code",
+        [
+            ("Müller-Lüdenscheidt", "65752682"),
+            ("Wanda", "362"),
+            ("Vanda", "362"),
+            ("Wunder", "3627"),
+            ("Christoph", "47823"),
+            ("Xaver", "4837"),
+        ],
+    )
+    def test_koelner_phonetik(self, word, code):
+        assert koelner_phonetik(word) == code
+
+    def test_bk_tree_matches_brute_force(self):
+        rng = random.Random(7)
+        words = {
+            "".join(rng.choices("abcdef", k=rng.randint(2, 8))) for _ in range(300)
+        }
+        tree = BKTree(words)
+        assert tree.size == len(words)
+        for _ in range(50):
+            query = "".join(rng.choices("abcdef", k=rng.randint(2, 8)))
+            for radius in (1, 2):
+                expected = {w for w in words if levenshtein(query, w) <= radius}
+                assert {w for _, w in tree.search(query, radius)} == expected
+
+
+class TestCommandMatcher:
+    TABLE = {
+        "send": ["abschicken", "schick ab", "ja"],
+        "cancel": ["abbrechen", "nein"],
+        "readback": ["lies mir vor", "vorlesen"],
+    }
+
+    def test_kinds(self):
+        m = CommandMatcher(self.TABLE)
+        assert m.find("Ja!").kind == "exact"
+        assert m.find("schick ab bitte", ("prefix",)).label == "send"
+        assert m.find("bitte schick ab", ("prefix",)) is None
+        assert m.find("bitte schick ab", ("suffix",)).kind == "suffix"
+        assert m.find("kannst du mir das vorlesen bitte", ("contains",)).label == (
+            "readback"
+        )
+        # Whole tokens only
+        assert m.find("januar", ("prefix", "contains")) is None
+
+    def test_fuzzy(self):
+        m = CommandMatcher(self.TABLE)
+        assert m.find("abschiken", ("fuzzy",)).keyword == "abschicken"
+        assert m.find("ok abbrechn", ("fuzzy_word",), min_score=0.85).label == (
+            "cancel"
+        )
+        # Short tokens never match fuzzily
+        assert m.find("je", ("fuzzy_word",)) is None
+
+    def test_first_listed_wins(self):
+        m = CommandMatcher(self.TABLE)
+        match = m.find("nein ja", ("prefix", "suffix"))
+        assert (match.label, match.keyword) == ("send", "ja")
+        assert m.find("nein ja", ("prefix", "suffix"), labels={"cancel"}).label == (
+            "cancel"
+        )
+
+    def test_phonetic(self):
+        m = CommandMatcher({"wanda": ["wanda", "wunder"]}, phonetic=True)
+        assert m.find("fanda", ("phonetic",)).keyword == "wanda"
+        assert m.find("fanda", ("phonetic",), phonetic_min_score=0.9) is None
+        assert CommandMatcher({"wanda": ["wanda"]}).find("fanda", ("phonetic",)) is None
+
+    def test_router_parity_with_keyword_loops(self):
+        """Same result as the per-keyword loop the router used to run."""
+
+        def reference(text):
+            for name, keywords in COMMAND_KEYWORDS.items():
+                for kw in keywords:
+                    if (
+                        text == kw
+                        or text.startswith(kw + " ")
+                        or text.endswith(" " + kw)
+                    ):
+                        return name, kw
+            return None
+
+        phrases = [kw for kws in COMMAND_KEYWORDS.values() for kw in kws]
+        filler = ["bitte", "das", "jetzt", "text", "noch", "mal"]
+        rng = random.Random(3)
+        router = IntentRouter()
+        for _ in range(500):
+            words = rng.choices(phrases + filler, k=rng.randint(1, 4))
+            text = " ".join(words)
+            result = router._check_commands(text)
+            got = result and (result.command["name"], result.command["keyword"])
+            assert got == reference(text), text
+
+    def test_cost_does_not_scale_with_keywords(self, monkeypatch):
+        rng = random.Random(5)
+        table = {
+            i: ["".join(rng.choices(string.ascii_lowercase, k=8)) for _ in range(5)]
+            for i in range(2000)
+        }
+        m = CommandMatcher(table)
+        text = " ".join(rng.choices(["eins", "zwei", "drei"], k=40))
+        calls = []
+        monkeypatch.setattr(
+            matcher, "levenshtein", lambda a, b: calls.append(1) or levenshtein(a, b)
+        )
+        assert m.find(text, ("exact", "contains", "fuzzy")) is None
+        # Exact and token lookups are dict probes; long input skips fuzzy
+        assert calls == []
+
+
+class TestCallSites:
+    @pytest.mark.parametrize(
+        "text, state",
+        [
+            ("Ja.", ConfirmationState.SEND),
+            ("abschiken", ConfirmationState.SEND),
+            ("okay dann bitte abbrechen", ConfirmationState.CANCEL),
+            ("ich will das verändern", ConfirmationState.EDIT),
+            ("Das ist ein normaler Satz", None),
+        ],
+    )
+    def test_confirmation(self, text, state):
+        assert detect_confirmation_command(text) == state
+
+    def test_command_detector(self):
+        detector = ConversationalCommandDetector()
+        assert detector.detect_command("Lies mir vor!") == "preview"
+        assert detector.detect_command("ja genau") == "send"
+        assert detector.detect_command("Januar war kalt") is None
+        assert detector.detect_command("das ist gesund") is None
+
+    def test_state_machine(self):
+        sm = StateMachine()
+        assert sm.detect_mode_command("Wanda, pause bitte") == WandaMode.PAUSED
+        assert sm.detect_mode_command("bist du da") is None
+        assert sm.detect_mode_command("mach alles") == WandaMode.AUTONOMOUS
+        sm.mode = WandaMode.PAUSED
+        assert sm.detect_mode_command("Hallo Wanda!") == WandaMode.AKTIV
+
+    def test_wake_word_similarity(self):
+        detector = SimpleWakeWordDetector()
+        for word in ("wanda", "vanda", "wanta", "wunder"):
+            assert detector._is_phonetically_similar_to_wanda(word), word
+        for word in ("hello", "water", "wind", "computer"):
+            assert not detector._is_phonetically_similar_to_wanda(word), word
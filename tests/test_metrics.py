@@ -0,0 +1,124 @@
+"""Tests for the metrics registry and GET /v1/metrics."""
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from wanda_voice_core.api import WandaAPI
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.metrics import (
+    PROVIDER_SECONDS,
+    ROUTES_TOTAL,
+    STAGE_SECONDS,
+    Histogram,
+    MetricsRegistry,
+)
+from wanda_voice_core.providers.base import ProviderBase
+
+
+class StubProvider(ProviderBase):
+    name = "stub"
+
+    async def send(self, prompt, context=None):
+        return "antwort"
+
+    def is_available(self):
+        return True
+
+
+class TestHistogram:
+    def test_percentiles_interpolated_within_bucket(self):
+        hist = Histogram((0.1, 0.2, 0.5, 1.0))
+        for _ in range(50):
+            hist.observe(0.05)
+        for _ in range(50):
+            hist.observe(0.7)
+        assert hist.percentile(0.5) == pytest.approx(0.1)
+        assert 0.5 < hist.percentile(0.99) <= 1.0
+
+    def test_overflow_bucket(self):
+        hist = Histogram((0.1, 1.0))
+        hist.observe(50.0)
+        assert hist.counts[-1] == 1
+        assert hist.percentile(0.5) == 1.0
+
+    def test_empty(self):
+        assert Histogram().percentile(0.5) is None
+
+
+class TestRegistry:
+    def test_prometheus_format(self):
+        m = MetricsRegistry(buckets=(0.1, 1.0))
+        m.describe("wanda_stage_duration_seconds", "Stage time")
+        m.observe("wanda_stage_duration_seconds", 0.05, stage="safety")
+        m.observe("wanda_stage_duration_seconds", 0.5, stage="safety")
+        m.inc("wanda_routes_total", route="direct")
+        text = m.render_prometheus()
+        assert "# HELP wanda_stage_duration_seconds Stage time" in text
+        assert "# TYPE wanda_stage_duration_seconds histogram" in text
+        assert 'wanda_stage_duration_seconds_bucket{stage="safety",le="0.1"} 1' in text
+        assert 'wanda_stage_duration_seconds_bucket{stage="safety",le="+Inf"} 2' in text
+        assert 'wanda_stage_duration_seconds_count{stage="safety"} 2' in text
+        assert "# TYPE wanda_routes_total counter" in text
+        assert 'wanda_routes_total{route="direct"} 1' in text
+
+    def test_label_escaping(self):
+        m = MetricsRegistry()
+        m.inc("x_total", reason='a "b"\n')
+        assert 'x_total{reason="a \\"b\\"\\n"} 1' in m.render_prometheus()
+
+    def test_timer_and_collector(self):
+        m = MetricsRegistry()
+        with m.timer("t_seconds", stage="x") as t:
+            pass
+        assert t.elapsed >= 0
+        assert m.histogram("t_seconds", stage="x").count == 1
+        m.register_collector(lambda: [("c_total", {"cache": "y"}, 7)])
+        assert m.snapshot()["counters"]["c_total"] == {"cache=y": 7}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = WandaVoiceEngine()
+    engine.run_manager.runs_dir = tmp_path
+    engine.set_providers(StubProvider())
+    engine.set_refiner_enabled(False)
+    return engine
+
+
+class TestEngineMetrics:
+    @pytest.mark.asyncio
+    async def test_stages_recorded(self, engine):
+        await engine.process_text("Erkläre mir bitte Photosynthese", skip_confirmation=True)
+        m = engine.metrics
+        for stage in ("safety", "route", "total"):
+            assert m.histogram(STAGE_SECONDS, stage=stage).count == 1
+        routes = m.snapshot()["counters"][ROUTES_TOTAL]
+        assert sum(routes.values()) == 1
+
+    @pytest.mark.asyncio
+    async def test_provider_histogram(self, engine):
+        await engine._send_to_provider("hi", "run")
+        assert _provider_count(engine, provider="stub", outcome="ok") == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self, engine):
+        await engine.process_text("Erkläre mir bitte Photosynthese", skip_confirmation=True)
+        client = TestClient(TestServer(WandaAPI(engine).create_app()))
+        await client.start_server()
+        try:
+            resp = await client.get("/v1/metrics")
+            assert resp.status == 200
+            assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            text = await resp.text()
+            assert 'wanda_stage_duration_seconds_count{stage="total"} 1' in text
+            resp = await client.get("/v1/metrics?format=json")
+            data = await resp.json()
+            total = data["histograms"][STAGE_SECONDS]["stage=total"]
+            assert total["p50_ms"] is not None
+        finally:
+            await client.close()
+
+
+def _provider_count(engine, **labels):
+    hist = engine.metrics.histogram(PROVIDER_SECONDS, **labels)
+    return hist.count if hist else 0
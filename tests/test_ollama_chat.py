@@ -0,0 +1,124 @@
+"""Tests for multi-turn /api/chat sessions in the Ollama provider."""
+
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from wanda_voice_core.providers.base import release_delta_sink, use_delta_sink
+from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
+from wanda_voice_core.providers.ollama import OllamaProvider
+
+
+@pytest.fixture
+async def ollama_server():
+    requests = []
+
+    async def chat(request):
+        body = await request.json()
+        requests.append(body)
+        turn = sum(1 for m in body["messages"] if m["role"] == "user")
+        if not body.get("stream"):
+            return web.json_response(
+                {"message": {"role": "assistant", "content": f"antwort {turn}"}}
+            )
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        for piece in ("ant", "wort ", str(turn)):
+            chunk = {"message": {"role": "assistant", "content": piece}, "done": False}
+            await resp.write((json.dumps(chunk) + "\n").encode())
+        await resp.write(b'{"message": {"content": ""}, "done": true}\n')
+        await resp.write_eof()
+        return resp
+
+    async def tags(request):
+        return web.json_response({"models": []})
+
+    app = web.Application()
+    app.router.add_post("/api/chat", chat)
+    app.router.add_get("/api/tags", tags)
+    server = TestServer(app)
+    await server.start_server()
+    server.requests = requests
+    yield server
+    await server.close()
+
+
+def _url(server):
+    return f"http://{server.host}:{server.port}"
+
+
+class TestOllamaChat:
+    @pytest.mark.asyncio
+    async def test_prefix_is_stable_across_turns(self, ollama_server):
+        provider = OllamaProvider(api_url=_url(ollama_server), keep_alive="10m")
+
+        assert await provider.send("erste frage") == "antwort 1"
+        assert await provider.send("zweite frage") == "antwort 2"
+
+        first, second = ollama_server.requests
+        assert second["messages"][: len(first["messages"])] == first["messages"]
+        assert second["messages"][-1] == {"role": "user", "content": "zweite frage"}
+        assert second["keep_alive"] == "10m"
+
+    @pytest.mark.asyncio
+    async def test_conversations_are_separate(self, ollama_server):
+        provider = OllamaProvider(api_url=_url(ollama_server))
+        await provider.send("a", conversation_id="one")
+        await provider.send("b", conversation_id="two")
+        assert len(ollama_server.requests[1]["messages"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_trim_drops_half_at_once(self, ollama_server):
+        provider = OllamaProvider(api_url=_url(ollama_server), max_turns=4)
+        for i in range(5):
+            await provider.send(f"frage {i}")
+        history = provider._conversations["default"]
+        assert len(history) == 4
+        assert history[0]["role"] == "user"
+
+    @pytest.mark.asyncio
+    async def test_streams_deltas_to_bound_sink(self, ollama_server):
+        provider = OllamaProvider(api_url=_url(ollama_server))
+        deltas = []
+        token = use_delta_sink(deltas.append)
+        try:
+            assert await provider.send("frage") == "antwort 1"
+        finally:
+            release_delta_sink(token)
+        assert deltas == ["ant", "wort ", "1"]
+        assert ollama_server.requests[0]["stream"] is True
+        # Without a sink the reply comes in one piece
+        await provider.send("noch eine")
+        assert ollama_server.requests[1]["stream"] is False
+
+    @pytest.mark.asyncio
+    async def test_failed_turn_not_recorded(self):
+        provider = OllamaProvider(api_url="http://127.0.0.1:9", timeout=1)
+        result = await provider.send("hallo")
+        assert "nicht erreichbar" in result
+        assert provider.last_send_ok is False
+        assert provider._conversations["default"] == []
+
+
+class TestGeminiLocalFallback:
+    @pytest.mark.asyncio
+    async def test_local_fallback_sends_history_as_messages(self, ollama_server):
+        gemini = GeminiCLIProvider(local_fallback=True)
+        gemini._local_provider = OllamaProvider(api_url=_url(ollama_server))
+        gemini._update_history("q1", "a1")
+
+        result = await gemini._try_local_fallback("q2", context="System")
+
+        assert result == "antwort 2"
+        messages = ollama_server.requests[0]["messages"]
+        assert messages[0] == {"role": "system", "content": "System"}
+        assert messages[-1] == {"role": "user", "content": "q2"}
+
+    def test_gemini_keeps_full_history_window(self):
+        gemini = GeminiCLIProvider()
+        for i in range(13):
+            gemini._update_history(f"q{i}", f"a{i}")
+        assert len(gemini.history) == 24
+        assert gemini.history[0] == {"role": "user", "content": "q1"}
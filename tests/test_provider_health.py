@@ -0,0 +1,171 @@
+"""Tests for circuit breakers and health-aware provider routing."""
+
+import asyncio
+import pytest
+
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.health import CircuitBreaker, ProviderHealthMonitor
+from wanda_voice_core.providers.base import ProviderBase
+from wanda_voice_core.schemas import CircuitState
+
+
+class FlakyProvider(ProviderBase):
+    def __init__(self, name, fail=False, healthy=True):
+        self.name = name
+        self.fail = fail
+        self.healthy = healthy
+        self.calls = 0
+
+    async def send(self, prompt, context=None):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("down")
+        return f"{self.name} ok"
+
+    def is_available(self):
+        return self.healthy
+
+    async def check_health(self):
+        return self.healthy
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        cb = CircuitBreaker(failure_threshold=2, reset_timeout_s=60)
+        cb.record_failure("x")
+        assert cb.state == CircuitState.CLOSED
+        cb.record_failure("x")
+        assert cb.state == CircuitState.OPEN
+        assert cb.allow_request() is False
+
+    def test_half_open_allows_single_trial(self):
+        cb = CircuitBreaker(failure_threshold=1, reset_timeout_s=0)
+        cb.record_failure()
+        assert cb.allow_request() is True
+        assert cb.state == CircuitState.HALF_OPEN
+        assert cb.allow_request() is False
+
+    def test_half_open_failure_reopens(self):
+        cb = CircuitBreaker(failure_threshold=1, reset_timeout_s=0)
+        cb.record_failure()
+        cb.allow_request()
+        assert cb.record_failure() == CircuitState.OPEN
+
+    def test_success_closes(self):
+        cb = CircuitBreaker(failure_threshold=1, reset_timeout_s=0)
+        cb.record_failure()
+        cb.allow_request()
+        assert cb.record_success() == CircuitState.CLOSED
+
+    def test_probe_success_does_not_reset_request_failures(self):
+        cb = CircuitBreaker(failure_threshold=3, reset_timeout_s=60)
+        for _ in range(2):
+            cb.record_failure("timeout")
+            assert cb.record_probe(True) == CircuitState.CLOSED
+        assert cb.failures == 2
+        assert cb.record_failure("timeout") == CircuitState.OPEN
+        assert cb.record_probe(True) == CircuitState.HALF_OPEN
+
+    def test_probe_success_only_half_opens(self):
+        cb = CircuitBreaker(failure_threshold=1, reset_timeout_s=60)
+        cb.record_failure("timeout")
+        assert cb.record_probe(True) == CircuitState.HALF_OPEN
+        assert cb.record_probe(True) == CircuitState.HALF_OPEN
+        assert cb.allow_request() is True
+        assert cb.allow_request() is False
+        assert cb.record_success() == CircuitState.CLOSED
+
+    def test_probe_failures_counted_separately(self):
+        cb = CircuitBreaker(failure_threshold=2, reset_timeout_s=60)
+        cb.record_failure("timeout")
+        assert cb.record_probe(False, "probe failed") == CircuitState.CLOSED
+        assert cb.to_dict()["failures"] == 1
+        assert cb.record_probe(False, "probe failed") == CircuitState.OPEN
+
+
+class TestHealthMonitor:
+    @pytest.mark.asyncio
+    async def test_probe_failures_open_circuit(self):
+        monitor = ProviderHealthMonitor(failure_threshold=2)
+        dead = FlakyProvider("gemini_cli", healthy=False)
+        monitor.register(dead)
+        await monitor.probe_all()
+        await monitor.probe_all()
+        assert monitor.status()["gemini_cli"]["state"] == "open"
+        assert monitor.is_healthy("gemini_cli") is False
+
+    @pytest.mark.asyncio
+    async def test_passing_probes_do_not_mask_request_timeouts(self):
+        monitor = ProviderHealthMonitor(failure_threshold=3)
+        monitor.register(FlakyProvider("gemini_cli", healthy=True))
+        for _ in range(2):
+            monitor.record_failure("gemini_cli", "timeout (90s)")
+            assert await monitor.probe("gemini_cli") is True
+        monitor.record_failure("gemini_cli", "timeout (90s)")
+        assert monitor.status()["gemini_cli"]["state"] == "open"
+        assert monitor.allow("gemini_cli") is False
+        await monitor.probe("gemini_cli")
+        assert monitor.status()["gemini_cli"]["state"] == "half_open"
+        assert monitor.allow("gemini_cli") is True
+        assert monitor.allow("gemini_cli") is False
+        monitor.record_success("gemini_cli")
+        assert monitor.is_healthy("gemini_cli") is True
+
+    @pytest.mark.asyncio
+    async def test_probe_timeout_counts_as_failure(self):
+        class Hanging(FlakyProvider):
+            async def check_health(self):
+                await asyncio.sleep(5)
+                return True
+
+        monitor = ProviderHealthMonitor(failure_threshold=1, probe_timeout_s=0.05)
+        monitor.register(Hanging("slow"))
+        assert await monitor.probe("slow") is False
+        assert monitor.status()["slow"]["last_error"] == "probe timeout"
+
+    @pytest.mark.asyncio
+    async def test_background_task_start_stop(self):
+        monitor = ProviderHealthMonitor(interval_s=0.01)
+        monitor.register(FlakyProvider("ok"))
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+        assert monitor.status()["ok"]["last_probe"] is not None
+
+
+class TestEngineRouting:
+    @pytest.mark.asyncio
+    async def test_open_primary_is_skipped(self):
+        engine = WandaVoiceEngine()
+        primary = FlakyProvider("gemini_cli", fail=True)
+        fallback = FlakyProvider("ollama")
+        engine.set_providers(primary, fallback)
+        threshold = engine.health.failure_threshold
+
+        for _ in range(threshold):
+            assert await engine._send_to_provider("hi", "run") == "ollama ok"
+        assert primary.calls == threshold
+
+        skipped = []
+        engine.event_bus.subscribe("provider.skipped", skipped.append)
+        assert await engine._send_to_provider("hi", "run") == "ollama ok"
+        assert primary.calls == threshold
+        assert skipped[0].data["provider"] == "gemini_cli"
+
+    @pytest.mark.asyncio
+    async def test_failure_message_triggers_fallback(self):
+        class SoftFail(FlakyProvider):
+            async def send(self, prompt, context=None):
+                self.last_send_ok = False
+                return "Gemini ist gerade nicht erreichbar."
+
+        engine = WandaVoiceEngine()
+        engine.set_providers(SoftFail("gemini_cli"), FlakyProvider("ollama"))
+        assert await engine._send_to_provider("hi", "run") == "ollama ok"
+
+    @pytest.mark.asyncio
+    async def test_all_failed(self):
+        engine = WandaVoiceEngine()
+        engine.set_providers(FlakyProvider("gemini_cli", fail=True))
+        result = await engine._send_to_provider("hi", "run")
+        assert "nicht erreichbar" in result
@@ -39,6 +39,45 @@ class DummyVAD:
         return None
 
 
+class CountingVAD(DummyVAD):
+    def __init__(self, speaking=False):
+        super().__init__(silence=False, speaking=speaking)
+        self.queries = 0
+
+    def is_user_speaking(self):
+        self.queries += 1
+        return self._speaking
+
+
+def test_frame_events_skip_vad_when_unobserved():
+    from wanda_voice_core.event_bus import EventBus
+
+    vad = CountingVAD()
+    recorder = AudioRecorder(vad=vad)
+    recorder.set_event_bus(EventBus(no_history=["vad.speech", "vad.silence"]))
+    for _ in range(5):
+        recorder._emit_frame(0.1)
+    assert vad.queries == 0
+
+
+def test_frame_events_skip_vad_when_sampled_out():
+    from wanda_voice_core.event_bus import EventBus
+
+    vad = CountingVAD(speaking=True)
+    bus = EventBus(
+        sample_every={"vad.speech": 10, "vad.silence": 10},
+        no_history=["vad.speech", "vad.silence"],
+    )
+    received = []
+    bus.subscribe("*", received.append)
+    recorder = AudioRecorder(vad=vad)
+    recorder.set_event_bus(bus)
+    for _ in range(30):
+        recorder._emit_frame(0.1)
+    assert vad.queries == 3
+    assert [e.event_type for e in received] == ["vad.speech"] * 3
+
+
 def test_vad_auto_stop_reason():
     recorder = AudioRecorder(sample_rate=16000, max_seconds=60, vad=DummyVAD())
     recorder.is_recording = True
@@ -0,0 +1,168 @@
+"""Tests for the SQLite run catalogue."""
+
+import os
+import time
+
+import pytest
+
+from wanda_voice_core.run_catalog import RunCatalog
+from wanda_voice_core.run_manager import RunManager
+from wanda_voice_core.schemas import RunEvent
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    cat = RunCatalog(tmp_path / "catalog.sqlite3")
+    yield cat
+    cat.close()
+
+
+def _add(catalog, run_id, started_at, **kw):
+    catalog.record({"run_id": run_id, "started_at": started_at, **kw})
+
+
+class TestQueries:
+    def test_lazy_open(self, tmp_path):
+        RunCatalog(tmp_path / "sub" / "catalog.sqlite3")
+        assert not (tmp_path / "sub").exists()
+
+    def test_slowest(self, catalog):
+        for i, latency in enumerate([100, 900, 300, None]):
+            _add(catalog, f"r{i}", 1000 + i, latency_ms=latency)
+        assert [r["run_id"] for r in catalog.slowest(2)] == ["r1", "r2"]
+
+    def test_errors_since(self, catalog):
+        now = time.time()
+        _add(catalog, "old", now - 7200, error="boom")
+        _add(catalog, "new", now - 60, error="timeout")
+        _add(catalog, "ok", now - 30)
+        assert [r["run_id"] for r in catalog.errors(since_s=3600)] == ["new"]
+
+    def test_by_route(self, catalog):
+        _add(catalog, "a", 1, route="command")
+        _add(catalog, "b", 2, route="refine")
+        _add(catalog, "c", 3, route="command")
+        assert [r["run_id"] for r in catalog.by_route("command")] == ["c", "a"]
+
+    def test_record_replaces(self, catalog):
+        _add(catalog, "a", 1, provider="gemini")
+        _add(catalog, "a", 1, provider="ollama")
+        assert catalog.get("a")["provider"] == "ollama"
+        assert catalog.stats()["runs"] == 1
+
+
+class TestRetention:
+    def test_expire_by_age(self, catalog):
+        now = time.time()
+        _add(catalog, "old", now - 3 * 86400)
+        _add(catalog, "new", now)
+        assert catalog.expire(max_age_s=86400) == ["old"]
+        assert catalog.get("new") is not None
+
+    def test_expire_by_count(self, catalog):
+        for i in range(5):
+            _add(catalog, f"r{i}", i)
+        assert sorted(catalog.expire(max_runs=2)) == ["r0", "r1", "r2"]
+        assert catalog.stats()["runs"] == 2
+
+    def test_expire_by_size(self, catalog):
+        for i in range(5):
+            _add(catalog, f"r{i}", i, size_bytes=100)
+        # Newest three fit in 300 bytes
+        assert sorted(catalog.expire(max_bytes=300)) == ["r0", "r1"]
+
+    def test_nothing_to_expire(self, catalog):
+        _add(catalog, "a", time.time())
+        assert catalog.expire(max_runs=5, max_age_s=3600) == []
+        assert catalog.expire() == []
+
+
+class TestRunManagerIntegration:
+    def test_end_run_records_and_retention_deletes(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+        ids = []
+        for i in range(3):
+            ids.append(rm.start_run())
+            rm.end_run({"route": "refine", "provider": "gemini", "latency_ms": i})
+            time.sleep(0.01)
+        assert rm.flush()
+
+        row = rm.catalog.get(ids[0])
+        assert row["provider"] == "gemini"
+        assert row["size_bytes"] > 0
+        assert all((tmp_path / run_id).is_dir() for run_id in ids)
+
+        rm.cleanup_old_runs(max_runs=1)
+        assert not (tmp_path / ids[0]).exists()
+        assert not (tmp_path / ids[1]).exists()
+        assert (tmp_path / ids[2]).is_dir()
+        rm.close()
+
+    def test_preexisting_run_dirs_are_catalogued_and_expired(self, tmp_path):
+        old = tmp_path / "run_1000_legacy"
+        old.mkdir()
+        (old / "events.jsonl").write_text("{}\n")
+        bare = tmp_path / "run_1001_bare"
+        bare.mkdir()
+        (old / "summary.json").write_text(
+            '{"started_at": 1000.0, "duration_s": 2.0, "route": "refine"}'
+        )
+        os.utime(bare, (1001.0, 1001.0))
+
+        rm = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+        new = rm.start_run()
+        rm.end_run()
+        assert rm.flush()
+
+        rm.cleanup_old_runs(max_runs=1)
+        assert not old.exists()
+        assert not bare.exists()
+        assert (tmp_path / new).is_dir()
+        assert rm.catalog.known(["run_1000_legacy", new]) == {new}
+        rm.close()
+
+    def test_backfill_reads_summary_and_skips_open_runs(self, tmp_path):
+        old = tmp_path / "run_1000_legacy"
+        old.mkdir()
+        (old / "summary.json").write_text(
+            '{"started_at": 1000.0, "duration_s": 2.0, "route": "refine"}'
+        )
+        rm = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+        open_run = rm.start_run()
+        rm.log_event(RunEvent(event_type="run.start", run_id=open_run))
+        assert rm.flush()
+
+        assert rm.backfill_catalog() == 1
+        row = rm.catalog.get("run_1000_legacy")
+        assert (row["started_at"], row["route"], row["duration_ms"]) == (
+            1000.0,
+            "refine",
+            2000.0,
+        )
+        assert rm.catalog.get(open_run) is None
+        assert rm.backfill_catalog() == 0
+        rm.end_run()
+        rm.close()
+
+    def test_failed_catalog_write_is_retried(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+        rm.cleanup_old_runs(max_runs=10)  # initial scan done
+        record = rm.catalog.record
+        rm.catalog.record = lambda entry: 1 / 0
+        run_id = rm.start_run()
+        rm.end_run({"route": "refine"})
+        assert rm.flush()
+        assert rm.catalog.get(run_id) is None
+
+        rm.catalog.record = record
+        rm.cleanup_old_runs(max_runs=10)
+        assert rm.catalog.get(run_id)["route"] == "refine"
+        rm.close()
+
+    def test_catalog_disabled(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, catalog=False)
+        rm.start_run()
+        rm.end_run()
+        assert rm.flush()
+        assert not (tmp_path / "catalog.sqlite3").exists()
+        rm.close()
@@ -0,0 +1,112 @@
+"""Tests for the background RunManager writer."""
+
+import json
+import time
+
+import pytest
+
+from wanda_voice_core.run_manager import RunManager, RunWriter
+from wanda_voice_core.schemas import RunEvent
+
+
+@pytest.fixture
+def manager(tmp_path):
+    rm = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+    yield rm
+    rm.close()
+
+
+def _event(run_id, i=0):
+    return RunEvent(event_type="run.step", data={"i": i}, run_id=run_id)
+
+
+class TestRunManager:
+    def test_start_run_creates_no_directory(self, manager, tmp_path):
+        run_id = manager.start_run()
+        assert not (tmp_path / run_id).exists()
+
+    def test_events_and_summary_written_at_end_run(self, manager, tmp_path):
+        run_id = manager.start_run()
+        for i in range(5):
+            manager.log_event(_event(run_id, i))
+        manager.end_run({"result": "ok"})
+        assert manager.flush()
+
+        lines = (tmp_path / run_id / "events.jsonl").read_text().splitlines()
+        assert [json.loads(line)["data"]["i"] for line in lines] == list(range(5))
+        summary = json.loads((tmp_path / run_id / "summary.json").read_text())
+        assert summary["event_count"] == 5
+        assert summary["result"] == "ok"
+        # One batch for the whole run
+        assert manager.writer.batches_written == 1
+
+    def test_events_buffered_until_threshold(self, manager, tmp_path):
+        run_id = manager.start_run()
+        manager.log_event(_event(run_id))
+        time.sleep(0.05)
+        assert not (tmp_path / run_id / "events.jsonl").exists()
+
+    def test_size_threshold_flushes(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, flush_bytes=100, flush_interval_s=60)
+        run_id = rm.start_run()
+        for i in range(10):
+            rm.log_event(_event(run_id, i))
+        deadline = time.time() + 2
+        path = tmp_path / run_id / "events.jsonl"
+        while time.time() < deadline and not path.exists():
+            time.sleep(0.01)
+        assert path.exists()
+        rm.close()
+
+    def test_time_threshold_flushes(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, flush_interval_s=0.05)
+        run_id = rm.start_run()
+        rm.log_event(_event(run_id))
+        path = tmp_path / run_id / "events.jsonl"
+        deadline = time.time() + 2
+        while time.time() < deadline and not path.exists():
+            time.sleep(0.01)
+        assert path.read_text().strip()
+        rm.close()
+
+    def test_save_artifact(self, manager, tmp_path):
+        run_id = manager.start_run()
+        path = manager.save_artifact("data.json", {"a": 1})
+        manager.save_artifact("raw.bin", b"\x00\x01")
+        assert manager.flush()
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert (tmp_path / run_id / "raw.bin").read_bytes() == b"\x00\x01"
+
+    def test_no_run_no_writes(self, manager, tmp_path):
+        manager.log_event(RunEvent(event_type="run.step"))
+        assert manager.save_artifact("x.txt", "x") is None
+        assert manager.flush()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDurability:
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            RunWriter(durability="sometimes")
+
+    def test_fsync_mode(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(
+            "wanda_voice_core.run_manager.os.fsync", lambda fd: synced.append(fd)
+        )
+        rm = RunManager(runs_dir=tmp_path, durability="fsync")
+        run_id = rm.start_run()
+        rm.log_event(_event(run_id))
+        rm.end_run()
+        assert rm.flush()
+        # events batch + summary
+        assert len(synced) == 2
+        rm.close()
+
+    def test_none_mode_written_on_close(self, tmp_path):
+        rm = RunManager(runs_dir=tmp_path, durability="none")
+        run_id = rm.start_run()
+        rm.log_event(_event(run_id))
+        rm.end_run()
+        rm.close()
+        assert (tmp_path / run_id / "events.jsonl").read_text().strip()
@@ -0,0 +1,178 @@
+"""Tests for session-scoped conversation state."""
+
+import asyncio
+
+import pytest
+
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.providers.base import ProviderBase
+from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
+from wanda_voice_core.run_manager import RunManager
+from wanda_voice_core.schemas import UtteranceRequest, ValidationError
+from wanda_voice_core.sessions import (
+    SessionStore,
+    current_session,
+    release_session,
+    use_session,
+)
+
+
+class RecordingProvider(ProviderBase):
+    """Answers with the number of history messages it can see."""
+
+    def __init__(self, name="gemini_cli"):
+        self.name = name
+        self.contexts = []
+
+    async def send(self, prompt, context=None):
+        self.contexts.append(context)
+        session = current_session()
+        await asyncio.sleep(0)
+        return f"{prompt} ({len(session.history) if session else 0})"
+
+    def is_available(self):
+        return True
+
+
+def _engine(tmp_path, *providers):
+    engine = WandaVoiceEngine()
+    engine.run_manager = RunManager(runs_dir=tmp_path, flush_interval_s=60)
+    engine.set_providers(*providers)
+    engine.set_refiner_enabled(False)
+    return engine
+
+
+class TestSessionStore:
+    def test_get_creates_and_touches(self):
+        store = SessionStore(max_sessions=2)
+        a = store.get("a")
+        store.get("b")
+        assert store.get("a") is a
+        store.get("c")  # evicts b, the least recently used
+        assert store.peek("b") is None
+        assert store.peek("a") is a
+        assert store.evicted == 1
+
+    def test_default_session(self):
+        store = SessionStore()
+        assert store.get().session_id == "default"
+        assert store.get(None) is store.get("default")
+
+    def test_idle_ttl(self, monkeypatch):
+        store = SessionStore(idle_ttl_s=10)
+        clock = [1000.0]
+        monkeypatch.setattr("wanda_voice_core.sessions.time.monotonic", lambda: clock[0])
+        store.get("old")
+        clock[0] += 5
+        store.get("fresh")
+        clock[0] += 6
+        assert store.expire_idle() == 1
+        assert store.peek("old") is None
+        assert store.peek("fresh") is not None
+
+    def test_trim_folds_into_summary(self):
+        store = SessionStore(max_turns=2)
+        session = store.get("s")
+        for i in range(3):
+            store.record_turn(session, f"frage {i}", f"antwort {i}")
+        # Oldest half dropped at once: max_turns messages remain
+        assert [m["content"] for m in session.history] == ["frage 2", "antwort 2"]
+        assert "frage 0" in session.summary
+        assert "antwort 1" in session.summary
+
+    def test_memory_cap_evicts_other_sessions(self):
+        store = SessionStore(max_bytes=3000)
+        a = store.get("a")
+        store.record_turn(a, "x" * 1000, "y" * 500)
+        b = store.get("b")
+        store.record_turn(b, "x" * 1000, "y" * 500)
+        assert store.peek("a") is None
+        assert store.peek("b") is b
+        assert store.size_bytes == b.size_bytes <= 3000
+
+    def test_size_accounting_matches_sessions(self):
+        store = SessionStore(max_turns=2)
+        session = store.get("s")
+        for i in range(10):
+            store.record_turn(session, "frage " * i, "antwort")
+        assert store.size_bytes == session.size_bytes
+        store.drop("s")
+        assert store.size_bytes == 0
+
+
+class TestEngineSessions:
+    @pytest.mark.asyncio
+    async def test_sessions_do_not_share_history(self, tmp_path):
+        provider = RecordingProvider()
+        engine = _engine(tmp_path, provider)
+        await engine.process_text("a1", skip_confirmation=True, session_id="alice")
+        await engine.process_text("a2", skip_confirmation=True, session_id="alice")
+        result = await engine.process_text("b1", skip_confirmation=True, session_id="bob")
+        assert result.response_text == "b1 (0)"
+        alice = engine.sessions.peek("alice")
+        assert [m["content"] for m in alice.history] == ["a1", "a1 (0)", "a2", "a2 (2)"]
+        assert len(engine.sessions.peek("bob").history) == 2
+        engine.run_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions(self, tmp_path):
+        engine = _engine(tmp_path, RecordingProvider())
+        await asyncio.gather(*(
+            engine.process_text(f"q{i}", skip_confirmation=True, session_id=f"s{i}")
+            for i in range(5)
+        ))
+        for i in range(5):
+            history = engine.sessions.peek(f"s{i}").history
+            assert [m["content"] for m in history] == [f"q{i}", f"q{i} (0)"]
+        engine.run_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_summary_passed_as_context(self, tmp_path):
+        provider = RecordingProvider()
+        engine = _engine(tmp_path, provider)
+        engine.sessions.max_turns = 1
+        for i in range(3):
+            await engine.process_text(f"q{i}", skip_confirmation=True, session_id="s")
+        assert provider.contexts[0] is None
+        assert "q0" in provider.contexts[-1]
+        engine.run_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_provider_affinity(self, tmp_path):
+        primary = RecordingProvider("gemini_cli")
+        fallback = RecordingProvider("ollama")
+        engine = _engine(tmp_path, primary, fallback)
+        engine.sessions.record_turn(engine.sessions.get("s"), "q", "a", provider="ollama")
+        await engine.process_text("next", skip_confirmation=True, session_id="s")
+        assert len(fallback.contexts) == 1
+        assert primary.contexts == []
+        await engine.process_text("other", skip_confirmation=True, session_id="t")
+        assert len(primary.contexts) == 1
+        engine.run_manager.close()
+
+
+class TestProviderHistory:
+    def test_gemini_prompt_uses_session_history(self):
+        provider = GeminiCLIProvider(hedge=False, local_fallback=False)
+        provider.history = [{"role": "user", "content": "global"}]
+        store = SessionStore()
+        session = store.get("s")
+        store.record_turn(session, "mine", "reply")
+        token = use_session(session)
+        try:
+            prompt = provider._build_prompt("frage")
+            provider._update_history("frage", "antwort")
+        finally:
+            release_session(token)
+        assert "mine" in prompt and "global" not in prompt
+        assert provider.history == [{"role": "user", "content": "global"}]
+
+
+class TestSessionIdValidation:
+    def test_valid(self):
+        UtteranceRequest(text="hi", session_id="user-1:desk").validate()
+
+    @pytest.mark.parametrize("session_id", ["", "a b", "x" * 129, "../etc"])
+    def test_invalid(self, session_id):
+        with pytest.raises(ValidationError):
+            UtteranceRequest(text="hi", session_id=session_id).validate()
@@ -0,0 +1,84 @@
+"""Tests for lazy startup imports and the startup profiler."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+VOICE_DIR = ROOT / "wanda-voice"
+
+HEAVY = ["torch", "faster_whisper", "sounddevice", "gi", "telegram", "edge_tts"]
+
+
+def _modules_after(code):
+    """Run code in a fresh interpreter and return its sys.modules keys."""
+    code += "\nimport sys, json; print(json.dumps(list(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=VOICE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(json.loads(out.strip().splitlines()[-1]))
+
+
+class TestLazyImports:
+    def test_main_module_imports_no_heavy_subsystems(self):
+        loaded = _modules_after("import main")
+        assert not loaded & set(HEAVY)
+        assert "wanda_voice_core.engine" not in loaded
+        assert "requests" not in loaded
+
+    def test_control_client_skips_engine(self):
+        loaded = _modules_after(
+            f"import sys; sys.path.insert(0, {str(ROOT)!r})\n"
+            "import wanda_voice_core.control"
+        )
+        assert "wanda_voice_core.engine" not in loaded
+
+    def test_engine_still_exported(self):
+        import wanda_voice_core
+        from wanda_voice_core.engine import WandaVoiceEngine
+
+        assert wanda_voice_core.WandaVoiceEngine is WandaVoiceEngine
+        with pytest.raises(AttributeError):
+            wanda_voice_core.NoSuchThing
+
+    def test_energy_vad_without_torch(self):
+        loaded = _modules_after(
+            "from audio.silero_vad import get_vad\nget_vad('energy')"
+        )
+        assert "torch" not in loaded
+
+
+class TestStartupProfiler:
+    def _profiler(self):
+        sys.path.insert(0, str(VOICE_DIR))
+        try:
+            from system.startup import StartupProfiler
+        finally:
+            sys.path.remove(str(VOICE_DIR))
+        return StartupProfiler(enabled=True)
+
+    def test_records_imports_and_inits(self):
+        profiler = self._profiler()
+        with profiler.measure("import", "json"):
+            import json  # noqa: F401
+        with profiler.measure("init", "stt model"):
+            pass
+        report = profiler.report()
+        assert "import:" in report and "init:" in report
+        assert "json" in report and "stt model" in report
+        assert "total:" in report
+
+    def test_failed_step_is_recorded(self):
+        profiler = self._profiler()
+        with pytest.raises(ImportError):
+            with profiler.measure("import", "missing"):
+                import does_not_exist  # noqa: F401
+        assert profiler.records[0][3] == "ModuleNotFoundError"
+        assert "(ModuleNotFoundError)" in profiler.report()
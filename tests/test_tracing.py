@@ -0,0 +1,130 @@
+"""Tests for contextvars span tracing and trace.json output."""
+
+import asyncio
+import json
+
+import pytest
+
+from wanda_voice_core.engine import WandaVoiceEngine
+from wanda_voice_core.providers.base import ProviderBase
+from wanda_voice_core.tracing import (
+    current_trace,
+    end_trace,
+    instant,
+    span,
+    start_trace,
+)
+
+
+class SlowProvider(ProviderBase):
+    name = "stub"
+
+    async def send(self, prompt, context=None):
+        with span("stub.work", cat="provider"):
+            await asyncio.sleep(0.01)
+        return "antwort"
+
+    def is_available(self):
+        return True
+
+
+def _complete(trace):
+    return [e for e in trace.to_chrome()["traceEvents"] if e["ph"] == "X"]
+
+
+class TestSpans:
+    def test_noop_without_trace(self):
+        assert current_trace() is None
+        with span("x") as sp:
+            sp.set(a=1)
+        instant("y")
+        assert span("x") is span("z")
+
+    def test_records_nested_spans(self):
+        token = start_trace("run_1")
+        with span("outer", cat="stage", n=1):
+            with span("inner") as sp:
+                sp.set(ok=True)
+        trace = end_trace(token)
+        events = {e["name"]: e for e in _complete(trace)}
+        assert events["inner"]["args"] == {"ok": True}
+        assert events["outer"]["args"] == {"n": 1}
+        assert events["outer"]["ts"] <= events["inner"]["ts"]
+        assert events["outer"]["dur"] >= events["inner"]["dur"]
+        assert current_trace() is None
+
+    def test_exception_marked(self):
+        token = start_trace("run_1")
+        with pytest.raises(ValueError):
+            with span("boom"):
+                raise ValueError("x")
+        trace = end_trace(token)
+        assert _complete(trace)[0]["args"]["error"] == "ValueError"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_get_own_tracks(self):
+        token = start_trace("run_1")
+
+        async def work(name):
+            with span(name):
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            asyncio.create_task(work("a"), name="task-a"),
+            asyncio.create_task(work("b"), name="task-b"),
+        )
+        def in_thread():
+            with span("thread"):
+                pass
+
+        await asyncio.to_thread(in_thread)
+        trace = end_trace(token)
+        tids = {e["name"]: e["tid"] for e in _complete(trace)}
+        assert len({tids["a"], tids["b"], tids["thread"]}) == 3
+        names = {
+            e["args"]["name"]
+            for e in trace.to_chrome()["traceEvents"]
+            if e["name"] == "thread_name"
+        }
+        assert {"task-a", "task-b"} <= names
+
+    def test_event_cap(self):
+        token = start_trace("run_1")
+        trace = current_trace()
+        trace.max_events = 3
+        for _ in range(5):
+            with span("s"):
+                pass
+        end_trace(token)
+        assert len(_complete(trace)) == 3
+        assert trace.to_chrome()["otherData"]["dropped_events"] == 2
+
+
+class TestEngineTrace:
+    @pytest.mark.asyncio
+    async def test_trace_json_written(self, tmp_path):
+        engine = WandaVoiceEngine()
+        engine.tracing_enabled = True
+        engine.run_manager.runs_dir = tmp_path
+        engine.set_providers(SlowProvider())
+        engine.set_refiner_enabled(False)
+
+        result = await engine.process_text(
+            "Erkläre mir bitte Photosynthese", skip_confirmation=True
+        )
+        assert engine.run_manager.flush()
+
+        data = json.loads((tmp_path / result.run_id / "trace.json").read_text())
+        names = {e["name"] for e in data["traceEvents"] if e["ph"] == "X"}
+        assert {"safety", "route", "provider", "provider.stub", "stub.work"} <= names
+        assert data["otherData"]["run_id"] == result.run_id
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, tmp_path):
+        engine = WandaVoiceEngine()
+        engine.run_manager.runs_dir = tmp_path
+        engine.set_providers(SlowProvider())
+        engine.set_refiner_enabled(False)
+        result = await engine.process_text("Hallo", skip_confirmation=True)
+        assert engine.run_manager.flush()
+        assert not (tmp_path / result.run_id / "trace.json").exists()
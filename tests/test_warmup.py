@@ -0,0 +1,113 @@
+"""Tests for the parallel warm-up orchestrator."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "wanda-voice"))
+
+from system.startup import StartupProfiler  # noqa: E402
+from system.warmup import WarmupError, WarmupOrchestrator  # noqa: E402
+
+
+def _slow(value, delay=0.2):
+    def load():
+        time.sleep(delay)
+        return value
+
+    return load
+
+
+class TestWarmupOrchestrator:
+    def test_loads_run_concurrently(self):
+        warmup = WarmupOrchestrator()
+        start = time.perf_counter()
+        for name in ("stt", "vad", "tts", "wake_word"):
+            warmup.add(name, _slow(name))
+        assert warmup.wait_all(timeout=5)
+        assert time.perf_counter() - start < 0.6  # not 4 x 0.2s
+        assert warmup.wait("tts") == "tts"
+        assert all(s["state"] == "ready" for s in warmup.status().values())
+
+    def test_readiness_is_per_component(self):
+        warmup = WarmupOrchestrator()
+        release = threading.Event()
+        warmup.add("recorder", lambda: "mic")
+        warmup.add("stt", lambda: release.wait(5) and "whisper")
+        assert warmup.wait("recorder", timeout=1) == "mic"
+        assert not warmup.is_ready("stt")
+        assert warmup.pending() == ["stt"]
+        with pytest.raises(TimeoutError):
+            warmup.wait("stt", timeout=0.05)
+        release.set()
+        assert warmup.wait("stt", timeout=1) == "whisper"
+
+    def test_dependencies(self):
+        warmup = WarmupOrchestrator()
+        order = []
+        warmup.add("stt", lambda: time.sleep(0.1) or order.append("stt"))
+        warmup.add("wake_word", lambda: order.append("wake_word"), depends_on=["stt"])
+        warmup.wait_all(timeout=2)
+        assert order == ["stt", "wake_word"]
+        with pytest.raises(KeyError):
+            warmup.add("telegram", lambda: None, depends_on=["tts"])
+
+    def test_failure_propagates(self):
+        warmup = WarmupOrchestrator()
+
+        def broken():
+            raise OSError("no CUDA")
+
+        warmup.add("stt", broken)
+        warmup.add("wake_word", lambda: "ok", depends_on=["stt"])
+        warmup.wait_all(timeout=2)
+        with pytest.raises(WarmupError, match="no CUDA"):
+            warmup.wait("stt")
+        assert warmup.status()["wake_word"]["state"] == "failed"
+        with pytest.raises(WarmupError):
+            warmup.proxy("stt").transcribe
+
+    def test_on_ready_callbacks(self):
+        warmup = WarmupOrchestrator()
+        seen = []
+        warmup.add("vad", _slow("silero", 0.05), on_ready=seen.append)
+        warmup.wait_all(timeout=2)
+        warmup.on_ready("vad", lambda v: seen.append(v.upper()))
+        assert seen == ["silero", "SILERO"]
+
+    def test_duplicate_name(self):
+        warmup = WarmupOrchestrator()
+        warmup.add("stt", lambda: None)
+        with pytest.raises(ValueError):
+            warmup.add("stt", lambda: None)
+
+
+class TestReadyProxy:
+    def test_blocks_until_loaded(self):
+        class FakeSTT:
+            mode = "short"
+
+            def transcribe(self, audio, language="de"):
+                return f"{len(audio)} samples"
+
+        warmup = WarmupOrchestrator()
+        stt = warmup.proxy("stt")
+        warmup.add("stt", _slow(FakeSTT(), 0.1))
+        # Audio captured before the model is ready is transcribed once it is
+        assert stt.transcribe([0.0] * 3) == "3 samples"
+        stt.mode = "full"
+        assert warmup.wait("stt").mode == "full"
+        assert "ready" in repr(stt)
+
+    def test_profiler_records_inits_and_milestones(self):
+        profiler = StartupProfiler()
+        warmup = WarmupOrchestrator(profiler=profiler)
+        warmup.add("tts", lambda: "piper")
+        warmup.wait_all(timeout=2)
+        kinds = {(kind, name) for kind, name, _, _ in profiler.records}
+        assert ("init", "tts") in kinds
+        assert ("ready", "tts ready") in kinds
+        assert "ready:" in profiler.report()
@@ -51,6 +51,7 @@ class AudioRecorder:
         self._stop_lock = threading.Lock()
         self._stop_reason = None
         self._last_audio = None
+        self.event_bus = None
 
         print(
             f"[Audio] Recorder initialized ({sample_rate}Hz, max {max_seconds}s, silence {silence_timeout}s)"
@@ -71,6 +72,8 @@ class AudioRecorder:
                         pass
                 if energy >= self.silence_threshold and not self.vad:
                     self._last_voice = time.time()
+                if self.event_bus is not None:
+                    self._emit_frame(energy)
             except Exception:
                 pass
             # Copy data to avoid overwrite
@@ -256,6 +259,28 @@ class AudioRecorder:
         """Attach or replace VAD instance."""
         self.vad = vad
 
+    def set_event_bus(self, event_bus: Optional[object]) -> None:
+        """Attach an EventBus for per-frame vad.speech/vad.silence events."""
+        self.event_bus = event_bus
+
+    def _emit_frame(self, energy: float) -> None:
+        # Runs once per audio block. Observation and sampling are decided
+        # before the VAD query, so unobserved or sampled-out frames cost two
+        # lookups; the payload is only built if the event is kept.
+        bus = self.event_bus
+        keep = [
+            t for t in ("vad.speech", "vad.silence") if bus.wants(t) and bus.sample(t)
+        ]
+        if not keep:
+            return
+        if self.vad:
+            speaking = self.vad.is_user_speaking()
+        else:
+            speaking = energy >= self.silence_threshold
+        event_type = "vad.speech" if speaking else "vad.silence"
+        if event_type in keep:
+            bus.emit(event_type, lambda: {"energy": round(energy, 5)}, sampled=True)
+
 
 # Hotkey handler (evdev-based, for global hotkey)
 class HotkeyHandler:
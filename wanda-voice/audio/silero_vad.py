@@ -4,15 +4,14 @@
 import time
 import threading
 import queue
+import importlib.util
 from typing import Optional
 
-try:
-    import torch
-    import numpy as np
-
-    SILERO_AVAILABLE = True
-except ImportError:
-    SILERO_AVAILABLE = False
+# torch is imported when a SileroVAD is created, not at module load
+# (it costs seconds at startup and isn't needed for the energy fallback)
+torch = None
+SILERO_AVAILABLE = importlib.util.find_spec("torch") is not None
+if not SILERO_AVAILABLE:
     print("[VAD] Warning: torch not installed, using energy-based fallback")
 
 
@@ -54,7 +53,10 @@ class SileroVAD:
 
     def _load_model(self):
         """Load Silero VAD model."""
+        global torch
         try:
+            import torch
+
             self.model, _ = torch.hub.load(
                 repo_or_dir="snakers4/silero-vad",
                 model="silero_vad",
@@ -81,13 +83,15 @@ class SileroVAD:
 
     def _process_chunk(self, chunk: "np.ndarray"):
         """Process audio chunk."""
-        if self.model and SILERO_AVAILABLE:
+        if self.model:
             # Silero VAD
             audio_tensor = torch.from_numpy(chunk).float()
             speech_prob = self.model(audio_tensor, self.sampling_rate).item()
             voice_detected = speech_prob > self.threshold
         else:
             # Energy-based fallback
+            import numpy as np
+
             energy = np.abs(chunk).mean()
             voice_detected = energy > 0.01
 
@@ -6,6 +6,8 @@ import time
 import numpy as np
 from typing import Optional, Callable, List
 
+from wanda_voice_core.matcher import CommandMatcher
+
 
 class WakeWordDetector:
     """
@@ -180,7 +182,24 @@ class SimpleWakeWordDetector:
         "vanda",
     ]
 
+    SIMILAR_WORDS = [
+        "wanda",
+        "wander",
+        "wanderer",
+        "waller",
+        "wonder",
+        "wunder",
+        "wonda",
+        "vanda",
+        "wala",
+    ]
+
     PHONETIC_SIMILARITY_THRESHOLD = 0.7
+    # Same Kölner Phonetik code counts with a slightly lower edit similarity
+    PHONETIC_MIN_SCORE = 0.65
+
+    _PHRASE_MATCHER = CommandMatcher({"wanda": WAKE_PHRASES})
+    _SIMILAR_MATCHER = CommandMatcher({"wanda": SIMILAR_WORDS}, phonetic=True)
 
     def __init__(self, on_wake: Optional[Callable[[], None]] = None, stt_engine=None):
         """
@@ -242,22 +261,18 @@ class SimpleWakeWordDetector:
                 text = self.stt.transcribe(audio.flatten(), language="de")
                 text_lower = text.lower().strip()
 
-                # Check for wake phrases (exact match or phonetic similarity)
-                detected = False
-                for phrase in self.WAKE_PHRASES:
-                    if phrase in text_lower:
-                        print(f"[WakeWord] Detected: '{phrase}'")
-                        detected = True
-                        break
-
-                # Also check for phonetically similar words using fuzzy matching
-                if not detected:
-                    words = text_lower.split()
-                    for word in words:
-                        if self._is_phonetically_similar_to_wanda(word):
-                            print(f"[WakeWord] Phonetic match: '{word}' -> 'wanda'")
-                            detected = True
-                            break
+                # Check for wake phrases, then for phonetically similar words
+                match = self._PHRASE_MATCHER.find(text_lower, ("contains",))
+                if match is not None:
+                    print(f"[WakeWord] Detected: '{match.keyword}'")
+                else:
+                    match = self._find_similar(text_lower)
+                    if match is not None:
+                        print(
+                            f"[WakeWord] Phonetic match: '{match.keyword}' "
+                            f"({match.kind}, {match.score:.2f})"
+                        )
+                detected = match is not None
 
                 if detected and self.on_wake:
                     self.on_wake()
@@ -266,27 +281,16 @@ class SimpleWakeWordDetector:
         except Exception as e:
             print(f"[WakeWord] Error: {e}")
 
+    def _find_similar(self, text: str):
+        return self._SIMILAR_MATCHER.find(
+            text,
+            ("exact", "fuzzy_word", "phonetic"),
+            min_score=self.PHONETIC_SIMILARITY_THRESHOLD,
+            phonetic_min_score=self.PHONETIC_MIN_SCORE,
+        )
+
     def _is_phonetically_similar_to_wanda(self, word: str) -> bool:
-        import difflib
-
-        similar_words = [
-            "wanda",
-            "wander",
-            "wanderer",
-            "waller",
-            "wonder",
-            "wunder",
-            "wonda",
-            "vanda",
-            "wala",
-        ]
-        if word in similar_words:
-            return True
-        for similar in similar_words:
-            ratio = difflib.SequenceMatcher(None, word, similar).ratio()
-            if ratio >= self.PHONETIC_SIMILARITY_THRESHOLD:
-                return True
-        return False
+        return self._find_similar(word) is not None
 
 
 def get_wake_word_detector(
@@ -1,13 +1,19 @@
 # Wanda Voice Assistant - Config Module
-"""Configuration management for Wanda."""
+"""Configuration management for Wanda.
+
+Backed by the same compiled snapshot as wanda_voice_core, so lookups are
+a single dict access and the file can be watched and reloaded live.
+"""
 
 import os
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from wanda_voice_core.config import LiveConfig
+
 
-class Config:
+class Config(LiveConfig):
     """Configuration loader and manager."""
 
     DEFAULT_CONFIG = {
@@ -54,6 +60,7 @@ class Config:
         "history": {"max_turns": 12, "persist": False},
         "adapters": {"target": "gemini_cli", "gemini_model": "flash"},
         "security": {"redact_secrets": False},
+        "live_reload": {"enabled": True},
     }
 
     def __init__(self, config_path: Optional[Path] = None):
@@ -66,7 +73,7 @@ class Config:
             config_path = Path(config_path)
 
         self.config_path = config_path
-        self.config = self._load_config()
+        super().__init__(config_path, self._load_config())
 
     def _load_config(self) -> Dict[str, Any]:
         """Load config from YAML file, create default if not exists."""
@@ -76,8 +83,7 @@ class Config:
             return self.DEFAULT_CONFIG.copy()
 
         try:
-            with open(self.config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = self._read(self.config_path)
             print(f"[Config] Loaded from {self.config_path}")
             return config
         except Exception as e:
@@ -96,17 +102,6 @@ class Config:
         except Exception as e:
             print(f"[Config] Error saving default config: {e}")
 
-    def get(self, key: str, default=None):
-        """Get config value by key."""
-        keys = key.split(".")
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-        return value if value is not None else default
-
     @property
     def stt(self) -> Dict[str, Any]:
         """Get STT config."""
@@ -4,6 +4,8 @@
 from typing import Optional
 import re
 
+from wanda_voice_core.matcher import CommandMatcher
+
 
 class ConversationalCommandDetector:
     """Detects natural commands with exact and fuzzy matching."""
@@ -63,6 +65,8 @@ class ConversationalCommandDetector:
         ],
     }
 
+    _MATCHER = CommandMatcher(COMMANDS)
+
     def detect_command(self, text: str) -> Optional[str]:
         """
         Detect command in natural speech.
@@ -76,23 +80,17 @@ class ConversationalCommandDetector:
         text_lower = self._normalize(text)
 
         # Exact match first (highest priority)
-        for command, keywords in self.COMMANDS.items():
-            if text_lower in keywords:
-                return command
+        match = self._MATCHER.find(text_lower, ("exact",))
 
         # Start/end match (avoid false positives in longer sentences)
-        for command, keywords in self.COMMANDS.items():
-            for keyword in keywords:
-                if text_lower.startswith(keyword) or text_lower.endswith(keyword):
-                    return command
-
-        # Fuzzy match for very short inputs
-        if len(text_lower) < 20:
-            for command, keywords in self.COMMANDS.items():
-                if any(kw in text_lower for kw in keywords):
-                    return command
-
-        return None  # No command = user continues speaking
+        if match is None:
+            match = self._MATCHER.find(text_lower, ("prefix", "suffix"))
+
+        # Anywhere in very short inputs
+        if match is None and len(text_lower) < 20:
+            match = self._MATCHER.find(text_lower, ("contains",))
+
+        return match.label if match else None  # No command = user continues speaking
 
     def _normalize(self, text: str) -> str:
         text = text.lower().strip()
@@ -6,6 +6,8 @@ import re
 from typing import Optional, Callable
 import time
 
+from wanda_voice_core.matcher import CommandMatcher
+
 
 class WandaMode(Enum):
     """Wanda operating modes."""
@@ -65,6 +67,15 @@ class StateMachine:
         "mach alles",
     ]
 
+    _MATCHER = CommandMatcher(
+        {
+            WandaMode.PAUSED: PAUSE_COMMANDS,
+            WandaMode.AKTIV: RESUME_COMMANDS,
+            WandaMode.AUTONOMOUS: AUTONOMOUS_TRIGGERS,
+        }
+    )
+    _NOT_PAUSED = (WandaMode.PAUSED, WandaMode.AUTONOMOUS)
+
     def __init__(self, on_mode_change: Optional[Callable] = None):
         self.mode = WandaMode.AKTIV
         self.previous_mode = None
@@ -79,23 +90,10 @@ class StateMachine:
         """Detect mode change command in text."""
         text_lower = self._normalize(text)
 
-        # Check pause
-        for cmd in self.PAUSE_COMMANDS:
-            if cmd in text_lower or text_lower == cmd:
-                return WandaMode.PAUSED
-
-        # Check resume (only if paused)
-        if self.mode == WandaMode.PAUSED:
-            for cmd in self.RESUME_COMMANDS:
-                if cmd in text_lower or text_lower == cmd:
-                    return WandaMode.AKTIV
-
-        # Check autonomous
-        for cmd in self.AUTONOMOUS_TRIGGERS:
-            if cmd in text_lower:
-                return WandaMode.AUTONOMOUS
-
-        return None
+        # Resume commands only count while paused
+        labels = None if self.mode == WandaMode.PAUSED else self._NOT_PAUSED
+        match = self._MATCHER.find(text_lower, ("contains",), labels=labels)
+        return match.label if match else None
 
     def _normalize(self, text: str) -> str:
         text = text.lower().strip()
@@ -16,83 +16,47 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Core imports
-from config.config import Config
-from audio.recorder import AudioRecorder, HotkeyHandler
-from stt.faster_whisper_engine import FasterWhisperEngine
-
-# TTS Engines
-try:
-    from tts.edge_tts_engine import EdgeTTSEngine
-
-    EDGE_TTS_AVAILABLE = True
-except ImportError:
-    EDGE_TTS_AVAILABLE = False
-
-from tts.piper_engine import PiperEngine
-
-# Wanda Voice Core (v2.0 engine)
-CORE_AVAILABLE = False
-try:
-    from wanda_voice_core.engine import WandaVoiceEngine
-    from wanda_voice_core.config import VoiceCoreConfig
-    from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
-    from wanda_voice_core.providers.ollama import OllamaProvider
-    from wanda_voice_core.schemas import ConfirmationState, RouteType
-
-    CORE_AVAILABLE = True
-except ImportError as e:
-    print(f"[Wanda] Core engine not available: {e}")
-
-# Wanda Phase 2+3 imports (optional UI/mode components)
+# Thin client: hand CLI commands to the running assistant over its control
+# socket before any model, audio or GUI module is imported
+if __name__ == "__main__":
+    try:
+        from wanda_voice_core.control import forward_cli
+    except ImportError:
+        forward_cli = None
+    if forward_cli is not None:
+        _exit_code = forward_cli(sys.argv[1:])
+        if _exit_code is not None:
+            sys.exit(_exit_code)
+
+from system.startup import PROFILER
+from system.warmup import WarmupOrchestrator
+
+# Only light, pure-Python modules are imported here. Audio, STT, TTS, VAD,
+# GUI, wake word, Telegram and the v2.0 engine are imported where they are
+# initialized, and only when their config flag enables them.
+with PROFILER.measure("import", "config"):
+    from config.config import Config
+
+# Wanda Phase 2+3 imports (optional mode/conversation components)
 FULL_MODE = False
-GTK_AVAILABLE = False
-WAKE_WORD_AVAILABLE = False
-MOBILE_AVAILABLE = False
-
-try:
-    from audio.silero_vad import get_vad
-    from audio.interrupt_controller import InterruptController
-    from conversation.command_detector import ConversationalCommandDetector
-    from conversation.wanda_prompts import get_wanda_prompt
-    from conversation.state_machine import StateMachine, WandaMode
-    from conversation.context_manager import ContextManager
-    from conversation.briefing import BriefingGenerator
-    from conversation.intelligence import WorkflowEngine
-    from adapters.ollama_manager import OllamaManager, create_ollama_manager
-    from adapters.cli_proxy import CLIProxy
-    from modes.autonomous import AutonomousController
-    from modes.daily_init import DailyInitializer
-    from preprocess.guardrails import Guardrails
-    from ui.sounds import SoundFeedback
-    from ui.orb import WandaOrb, run_gtk_main, quit_gtk, GTK_AVAILABLE
-
-    FULL_MODE = True
-except ImportError as e:
-    print(f"[Wanda] Full mode modules missing: {e}")
-
-try:
-    from ui.log_window import LogWindow
-
-    LOG_WINDOW_AVAILABLE = GTK_AVAILABLE
-except ImportError:
-    LOG_WINDOW_AVAILABLE = False
-
-try:
-    from audio.wake_word import get_wake_word_detector
-
-    WAKE_WORD_AVAILABLE = True
-except ImportError:
-    WAKE_WORD_AVAILABLE = False
-
-try:
-    from mobile.telegram_bot import create_telegram_bot
-    from mobile.notifier import WandaNotifier
-    from mobile.project_init import ProjectInitializer
-
-    MOBILE_AVAILABLE = True
-except ImportError:
-    MOBILE_AVAILABLE = False
+with PROFILER.measure("import", "phase 2+3 modules"):
+    try:
+        from audio.interrupt_controller import InterruptController
+        from conversation.command_detector import ConversationalCommandDetector
+        from conversation.wanda_prompts import get_wanda_prompt
+        from conversation.state_machine import StateMachine, WandaMode
+        from conversation.context_manager import ContextManager
+        from conversation.briefing import BriefingGenerator
+        from conversation.intelligence import WorkflowEngine
+        from adapters.cli_proxy import CLIProxy
+        from modes.autonomous import AutonomousController
+        from modes.daily_init import DailyInitializer
+        from preprocess.guardrails import Guardrails
+        from ui.sounds import SoundFeedback
+
+        FULL_MODE = True
+    except ImportError as e:
+        print(f"[Wanda] Full mode modules missing: {e}")
 
 BaseCommandDetector = None
 COMMAND_DETECTOR_AVAILABLE = False
@@ -160,13 +124,14 @@ def acquire_single_instance() -> bool:
 class WandaVoiceAssistant:
     """Wanda Voice Assistant - v2.0 with WandaVoiceEngine integration."""
 
-    def __init__(self, config_path=None, daemon=False):
+    def __init__(self, config_path=None, daemon=False, simple=False):
         print("=" * 70)
         print("  WANDA - SOVEREIGN AI VOICE ASSISTANT v2.0")
         print("=" * 70)
 
         self.config = Config(config_path)
         self.daemon = daemon
+        self.simple = simple
         self.stt_tts_only = self.config.get("pipeline.stt_tts_only", False)
         self.speak_transcript = self.config.get("pipeline.speak_transcript", True)
         self.transcript_prefix = self.config.get("pipeline.transcript_prefix", "")
@@ -174,12 +139,24 @@ class WandaVoiceAssistant:
         self.last_response = None
         self.refiner_enabled = self.config.get("refiner.enabled", True)
 
+        # Slow loads (STT, VAD, TTS, Ollama, wake word) run concurrently;
+        # self.stt/self.tts/self.vad are proxies that block until ready
+        self.warmup = WarmupOrchestrator(profiler=PROFILER)
+        self._wake_lock = threading.Lock()
+        self._wake_started = False
+
+        # State
+        self.running = False
+        self.is_recording = False
+        self._shutting_down = False
+        self._processing = False
+
         # Core audio/STT/TTS (stays in frontend - platform-specific)
         self._init_core()
 
         # WandaVoiceEngine (v2.0 pipeline)
         self.engine = None
-        if CORE_AVAILABLE and not self.stt_tts_only:
+        if not self.stt_tts_only:
             self._init_engine()
 
         # Defaults for optional components
@@ -196,6 +173,7 @@ class WandaVoiceAssistant:
         self.daily_init = None
         self.orb = None
         self.log_window = None
+        self.gtk_thread = None
 
         class _DisabledOllama:
             available = False
@@ -210,18 +188,27 @@ class WandaVoiceAssistant:
             self._init_wanda()
             self._init_phase3()
 
-        # State
-        self.running = False
-        self.is_recording = False
-        self._shutting_down = False
-        self._processing = False
-
         # Async event loop for engine calls
         self._loop = asyncio.new_event_loop()
         self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
         self._loop_thread.start()
 
-        # Hotkey
+        # Pre-spawn Gemini CLI workers and start provider health probes
+        # on the loop that will use them
+        if self.engine:
+            asyncio.run_coroutine_threadsafe(
+                self._gemini_provider.warm_pool(), self._loop
+            )
+            self._loop.call_soon_threadsafe(self.engine.start_health_monitor)
+
+        # Control socket for thin CLI clients (--send-text, --status, ...)
+        self.control = None
+        if self.config.get("control.enabled", True):
+            self._start_control_server()
+
+        # Hotkey (audio.recorder is already imported by _init_core)
+        from audio.recorder import HotkeyHandler
+
         self.hotkey = HotkeyHandler(
             key=self.config.get("trigger.key", "rightctrl"),
             mode=self.config.get("trigger.mode", "toggle"),
@@ -230,79 +217,191 @@ class WandaVoiceAssistant:
             on_release=self.stop_recording,
         )
 
+        # Live config: re-tune thresholds and toggles without a restart
+        self.config.subscribe("*", self._on_config_change)
+        if self.config.get("live_reload.enabled", True):
+            self.config.watch()
+            if self.engine:
+                self.engine.config.watch()
+
         print("\n[Wanda] Fully initialized")
 
+    def _start_control_server(self):
+        try:
+            from wanda_voice_core.control import ControlServer
+        except ImportError as e:
+            print(f"[Wanda] Control socket unavailable: {e}")
+            return
+        server = ControlServer(self.config.get("control.socket_path"))
+        server.register("send_text", self._control_send_text)
+        server.register("stt_file", self._control_stt_file)
+        server.register("status", self._control_status)
+        server.register("refiner", self._control_refiner)
+        try:
+            asyncio.run_coroutine_threadsafe(server.start(), self._loop).result(
+                timeout=5
+            )
+            self.control = server
+        except Exception as e:
+            print(f"[Wanda] Control socket unavailable: {e}")
+
+    async def _control_send_text(self, args):
+        if not self.engine:
+            raise RuntimeError("Engine not available")
+        result = await self.engine.process_text(
+            args["text"], skip_confirmation=True, session_id=args.get("session_id")
+        )
+        return {
+            "run_id": result.run_id,
+            "response_text": result.response_text,
+            "error": result.error,
+        }
+
+    def _control_stt_file(self, args):
+        return {"text": self.stt.transcribe_file(args["path"], language="de")}
+
+    def _control_status(self, args):
+        status = {
+            "pid": os.getpid(),
+            "running": self.running,
+            "recording": self.is_recording,
+            "processing": self._processing,
+            "refiner_enabled": self.refiner_enabled,
+            "engine": self.engine is not None,
+            "warmup": self.warmup.status(),
+        }
+        if self.engine:
+            status["providers"] = self.engine.health.status()
+            status["admission"] = self.engine.admission.stats()
+        return status
+
+    def _control_refiner(self, args):
+        self._toggle_refiner(bool(args.get("enabled", True)))
+        return {"refiner_enabled": self.refiner_enabled}
+
     def _init_core(self):
         """Core MVP components (audio, STT, TTS)."""
-        self.recorder = AudioRecorder(
-            sample_rate=self.config.audio_config.get("sample_rate", 16000),
-            max_seconds=self.config.audio_config.get("max_seconds", 60),
-            silence_timeout=self.config.audio_config.get("silence_timeout", 1.2),
-            silence_threshold=self.config.audio_config.get("silence_threshold", 0.01),
-            min_seconds=self.config.audio_config.get("min_seconds", 1.0),
-            min_speech_ms=self.config.audio_config.get("min_speech_ms", 200),
-            hangover_frames=self.config.audio_config.get("hangover_frames", 5),
-            on_auto_stop=self._auto_stop,
-        )
-        self.stt = FasterWhisperEngine(
+        with PROFILER.measure("import", "audio.recorder"):
+            from audio.recorder import AudioRecorder
+        with PROFILER.measure("init", "recorder"):
+            self.recorder = AudioRecorder(
+                sample_rate=self.config.audio_config.get("sample_rate", 16000),
+                max_seconds=self.config.audio_config.get("max_seconds", 60),
+                silence_timeout=self.config.audio_config.get("silence_timeout", 1.2),
+                silence_threshold=self.config.audio_config.get(
+                    "silence_threshold", 0.01
+                ),
+                min_seconds=self.config.audio_config.get("min_seconds", 1.0),
+                min_speech_ms=self.config.audio_config.get("min_speech_ms", 200),
+                hangover_frames=self.config.audio_config.get("hangover_frames", 5),
+                on_auto_stop=self._auto_stop,
+            )
+        PROFILER.mark("recorder ready")
+        self.warmup.add("stt", self._load_stt)
+        self.warmup.add("tts", self._load_tts)
+        self.stt = self.warmup.proxy("stt")
+        self.tts = self.warmup.proxy("tts")
+
+    def _load_stt(self):
+        with PROFILER.measure("import", "stt.faster_whisper_engine"):
+            from stt.faster_whisper_engine import FasterWhisperEngine
+        return FasterWhisperEngine(
             model_name=self.config.stt.get("model", "large-v3-turbo"),
             device=self.config.stt.get("device", "auto"),
         )
+
+    def _load_tts(self):
+        """Edge TTS if configured and installed, Piper otherwise."""
         tts_engine = self.config.tts.get("engine", "edge")
         tts_voice = self.config.tts.get("voice", "katja")
         tts_mode = self.config.tts.get("mode", "short")
 
-        if tts_engine == "edge" and EDGE_TTS_AVAILABLE:
-            self.tts = EdgeTTSEngine(voice=tts_voice)
-            self.tts.mode = tts_mode
-        else:
-            piper_voice = self.config.tts.get("voice", "de_DE-kerstin-low")
-            if not piper_voice.startswith("de_DE"):
-                piper_voice = "de_DE-kerstin-low"
-            self.tts = PiperEngine(voice=piper_voice, mode=tts_mode)
+        if tts_engine == "edge":
+            try:
+                with PROFILER.measure("import", "tts.edge_tts_engine"):
+                    from tts.edge_tts_engine import EdgeTTSEngine
+            except ImportError:
+                EdgeTTSEngine = None
+            if EdgeTTSEngine is not None:
+                tts = EdgeTTSEngine(voice=tts_voice)
+                tts.mode = tts_mode
+                return tts
+        with PROFILER.measure("import", "tts.piper_engine"):
+            from tts.piper_engine import PiperEngine
+        piper_voice = self.config.tts.get("voice", "de_DE-kerstin-low")
+        if not piper_voice.startswith("de_DE"):
+            piper_voice = "de_DE-kerstin-low"
+        return PiperEngine(voice=piper_voice, mode=tts_mode)
 
     def _init_engine(self):
         """Initialize WandaVoiceEngine with providers."""
-        core_config = VoiceCoreConfig()
-        self.engine = WandaVoiceEngine(core_config)
+        try:
+            with PROFILER.measure("import", "wanda_voice_core"):
+                from wanda_voice_core.engine import WandaVoiceEngine
+                from wanda_voice_core.config import VoiceCoreConfig
+                from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
+                from wanda_voice_core.providers.ollama import OllamaProvider
+        except ImportError as e:
+            print(f"[Wanda] Core engine not available: {e}")
+            return
 
-        # Setup providers
-        primary = GeminiCLIProvider(
-            model=self.config.get("adapters.gemini_model", "flash"),
-            timeout=self.config.get("adapters.timeout", 90),
-        )
-        fallback = None
-        if self.config.get("ollama.enabled", False):
-            ollama_model = self.config.get("ollama.model", "qwen3:8b")
-            fallback = OllamaProvider(model=ollama_model)
+        with PROFILER.measure("init", "engine + providers"):
+            core_config = VoiceCoreConfig()
+            self.engine = WandaVoiceEngine(core_config)
+
+            # Setup providers (all settings from the wanda-voice "adapters" section)
+            primary = GeminiCLIProvider(
+                model=self.config.get("adapters.gemini_model", "flash"),
+                timeout=self.config.get("adapters.timeout", 90),
+                hedge=self.config.get("adapters.gemini_hedge", True),
+                hedge_percentile=self.config.get(
+                    "adapters.gemini_hedge_percentile", 0.9
+                ),
+                hedge_initial_delay=self.config.get(
+                    "adapters.gemini_hedge_initial_delay", 20.0
+                ),
+                hedge_min_delay=self.config.get("adapters.gemini_hedge_min_delay", 3.0),
+                hedge_min_samples=self.config.get(
+                    "adapters.gemini_hedge_min_samples", 5
+                ),
+                pool_size=self.config.get("adapters.gemini_pool_size", 1),
+                pool_max_idle_s=self.config.get("adapters.gemini_pool_max_idle_s", 600),
+            )
+            self._gemini_provider = primary
+            fallback = None
+            if self.config.get("ollama.enabled", False):
+                ollama_model = self.config.get("ollama.model", "qwen3:8b")
+                fallback = OllamaProvider(
+                    model=ollama_model,
+                    keep_alive=self.config.get("ollama.keep_alive", "30m"),
+                )
 
-        self.engine.set_providers(primary, fallback)
+            self.engine.set_providers(primary, fallback)
 
-        # Apply refiner default
-        self.engine.set_refiner_enabled(self.refiner_enabled)
+            # Apply refiner default
+            self.engine.set_refiner_enabled(self.refiner_enabled)
 
-        # Wire TTS/STT for confirmation flow
-        self.engine.set_io(
-            tts_speak=lambda text: self._speak(text),
-            stt_listen=lambda: self._listen_short(),
-        )
+            # Wire TTS/STT for confirmation flow
+            self.engine.set_io(
+                tts_speak=lambda text: self._speak(text),
+                stt_listen=lambda: self._listen_short(),
+            )
+
+            # Subscribe to EventBus for Orb/LogWindow updates (own delivery
+            # thread, so GTK updates never run inside the engine pipeline)
+            self.engine.event_bus.subscribe(
+                "*", self._on_engine_event, dispatch="async", overflow="drop_oldest"
+            )
 
-        # Subscribe to EventBus for Orb/LogWindow updates
-        self.engine.event_bus.subscribe("*", self._on_engine_event)
+            self.recorder.set_event_bus(self.engine.event_bus)
 
         print("[Wanda] Engine v2.0 initialized")
 
     def _init_wanda(self):
         """Phase 2 Wanda components."""
-        vad_engine = self.config.audio_config.get("vad_engine", "silero")
-        self.vad = get_vad(
-            vad_engine,
-            silence_duration=self.config.audio_config.get("silence_timeout", 1.2),
-        )
-        try:
-            self.recorder.set_vad(self.vad)
-        except Exception:
-            pass
+        # The recorder uses its energy threshold until the VAD is loaded
+        self.warmup.add("vad", self._load_vad, on_ready=self.recorder.set_vad)
+        self.vad = self.warmup.proxy("vad")
         self.interrupt = InterruptController(self.vad, self.tts)
         self.commands = ConversationalCommandDetector()
         self.guardrails = Guardrails(
@@ -312,6 +411,17 @@ class WandaVoiceAssistant:
             enabled=self.config.get("output.sounds_enabled", True)
         )
 
+    def _load_vad(self):
+        vad_engine = self.config.audio_config.get("vad_engine", "silero")
+        if self.simple:
+            vad_engine = "energy"  # simple mode never loads torch
+        with PROFILER.measure("import", "audio.silero_vad"):
+            from audio.silero_vad import get_vad
+        return get_vad(
+            vad_engine,
+            silence_duration=self.config.audio_config.get("silence_timeout", 1.2),
+        )
+
     def _init_phase3(self):
         """Phase 3 Multi-Mode components."""
         self.state = StateMachine(on_mode_change=self._on_mode_change)
@@ -325,9 +435,13 @@ class WandaVoiceAssistant:
         if ollama_enabled:
             ollama_model = self.config.get("ollama.model", "")
             if ollama_model:
+                with PROFILER.measure("import", "adapters.ollama_manager"):
+                    from adapters.ollama_manager import OllamaManager
                 self.ollama = OllamaManager(
                     model=ollama_model, auto_unload=True, unload_timeout=120
                 )
+                if self.config.get("ollama.preload", True):
+                    self.warmup.add("ollama", self.ollama.load_model)
             else:
                 self.ollama = type("DisabledOllama", (), {"available": False})()
         else:
@@ -346,16 +460,52 @@ class WandaVoiceAssistant:
 
         self.workflows = WorkflowEngine()
 
-        # Visual Orb Indicator
-        self.orb = None
-        if GTK_AVAILABLE:
+        # Visual Orb Indicator and LogWindow (GTK); never in simple mode
+        if not self.simple:
+            self._init_gui()
+
+        self.daily_init = DailyInitializer(
+            briefing=self.briefing,
+            ollama=self.ollama if self.ollama.available else None,
+            speak_callback=lambda msg: self._speak(msg),
+            orb_callback=lambda state: self.orb.set_state(state) if self.orb else None,
+        )
+
+        self.wake_word = None
+        if self.config.get("wake_word.enabled", False):
+            self.warmup.add(
+                "wake_word", self._load_wake_word, on_ready=self._on_wake_word_ready
+            )
+
+        self.notifier = None
+        self.project_init = None
+        self.telegram_bot = None
+        if self.config.get("notifications.enabled", False) or self.config.get(
+            "telegram.enabled", False
+        ):
+            self._init_mobile()
+
+    def _init_gui(self):
+        """GTK orb and LogWindow; GTK is only imported here."""
+        with PROFILER.measure("import", "ui.orb (gtk)"):
+            from ui.orb import WandaOrb, run_gtk_main, GTK_AVAILABLE
+        if not GTK_AVAILABLE:
+            return
+
+        with PROFILER.measure("init", "gtk start"):
             self.orb = WandaOrb(size=60, on_click=self._on_orb_click)
             self.gtk_thread = threading.Thread(target=run_gtk_main, daemon=True)
             self.gtk_thread.start()
 
         # LogWindow (new in v2.0)
-        self.log_window = None
-        if LOG_WINDOW_AVAILABLE and self.config.get("ui.log_window", True):
+        if not self.config.get("ui.log_window", True):
+            return
+        try:
+            with PROFILER.measure("import", "ui.log_window"):
+                from ui.log_window import LogWindow
+        except ImportError:
+            return
+        with PROFILER.measure("init", "log window"):
             self.log_window = LogWindow(
                 on_send=lambda: self._confirmation_override("send"),
                 on_edit=lambda: self._confirmation_override("edit"),
@@ -368,54 +518,73 @@ class WandaVoiceAssistant:
                 refiner_enabled=self.refiner_enabled,
             )
 
-        self.daily_init = DailyInitializer(
-            briefing=self.briefing,
-            ollama=self.ollama if self.ollama.available else None,
-            speak_callback=lambda msg: self._speak(msg),
-            orb_callback=lambda state: self.orb.set_state(state) if self.orb else None,
+    def _load_wake_word(self):
+        with PROFILER.measure("import", "audio.wake_word"):
+            from audio.wake_word import get_wake_word_detector
+        return get_wake_word_detector(
+            on_wake=self._on_wake_word,
+            stt_engine=self.stt,
+            wake_words=self.config.get("wake_word.words", None),
+            threshold=self.config.get("wake_word.threshold", 0.5),
         )
 
-        self.wake_word = None
-        if WAKE_WORD_AVAILABLE and self.config.get("wake_word.enabled", False):
-            wake_words = self.config.get("wake_word.words", None)
-            threshold = self.config.get("wake_word.threshold", 0.5)
-            self.wake_word = get_wake_word_detector(
-                on_wake=self._on_wake_word,
-                stt_engine=self.stt,
-                wake_words=wake_words,
-                threshold=threshold,
-            )
+    def _on_wake_word_ready(self, detector):
+        self.wake_word = detector
+        self._start_wake_word()
 
-        self.notifier = None
-        self.project_init = None
-        self.telegram_bot = None
+    def _start_wake_word(self):
+        """Start the detector once both it and the main loop are up."""
+        with self._wake_lock:
+            if self._wake_started or not self.running or self._shutting_down:
+                return
+            if self.wake_word and self.wake_word.available:
+                self.wake_word.start()
+                self._wake_started = True
 
-        if MOBILE_AVAILABLE:
-            if self.config.get("notifications.enabled", False):
-                self.notifier = WandaNotifier(
-                    topic=self.config.get("notifications.topic", "wanda-private"),
-                    server=self.config.get("notifications.server", "https://ntfy.sh"),
-                    enabled=True,
-                )
-            self.project_init = ProjectInitializer(
-                ollama=self.ollama if self.ollama.available else None,
+    def _init_mobile(self):
+        """Push notifications and the Telegram bot (each behind its flag)."""
+        try:
+            with PROFILER.measure("import", "mobile"):
+                from mobile.notifier import WandaNotifier
+                from mobile.project_init import ProjectInitializer
+        except ImportError as e:
+            print(f"[Wanda] Mobile modules missing: {e}")
+            return
+        if self.config.get("notifications.enabled", False):
+            self.notifier = WandaNotifier(
+                topic=self.config.get("notifications.topic", "wanda-private"),
+                server=self.config.get("notifications.server", "https://ntfy.sh"),
+                enabled=True,
+            )
+        self.project_init = ProjectInitializer(
+            ollama=self.ollama if self.ollama.available else None,
+            notifier=self.notifier,
+        )
+        if not self.config.get("telegram.enabled", False):
+            return
+        try:
+            with PROFILER.measure("import", "mobile.telegram_bot"):
+                from mobile.telegram_bot import create_telegram_bot
+        except ImportError as e:
+            print(f"[Wanda] Telegram unavailable: {e}")
+            return
+        with PROFILER.measure("init", "telegram"):
+            self.telegram_bot = create_telegram_bot(
+                self.config.to_dict(),
+                stt_engine=self.stt,
+                tts_engine=self.tts,
+                gemini_adapter=None,
+                ollama_adapter=self.ollama,
+                project_init=self.project_init,
                 notifier=self.notifier,
             )
-            if self.config.get("telegram.enabled", False):
-                self.telegram_bot = create_telegram_bot(
-                    self.config._config,
-                    stt_engine=self.stt,
-                    tts_engine=self.tts,
-                    gemini_adapter=None,
-                    ollama_adapter=self.ollama,
-                    project_init=self.project_init,
-                    notifier=self.notifier,
-                )
 
     def _confirmation_override(self, action: str):
         """Handle confirmation override from LogWindow buttons."""
         if not self.engine:
             return
+        from wanda_voice_core.schemas import ConfirmationState
+
         mapping = {
             "send": ConfirmationState.SEND,
             "edit": ConfirmationState.EDIT,
@@ -427,6 +596,52 @@ class WandaVoiceAssistant:
             self.engine.override_confirmation(state)
             print(f"[Wanda] UI override: {action}")
 
+    # Read once at startup; changing them needs a restart
+    RESTART_KEYS = (
+        "stt",
+        "tts.engine",
+        "tts.voice",
+        "trigger",
+        "audio.sample_rate",
+        "audio.vad_engine",
+        "pipeline.stt_tts_only",
+        "wake_word.enabled",
+        "wake_word.words",
+        "ollama",
+        "adapters",
+        "control",
+    )
+
+    def _on_config_change(self, snapshot, changed):
+        """Apply a reloaded config file to the running components."""
+        get = snapshot.get
+        for attr, default in (
+            ("max_seconds", 60),
+            ("silence_timeout", 1.2),
+            ("silence_threshold", 0.01),
+            ("min_seconds", 1.0),
+            ("min_speech_ms", 200),
+            ("hangover_frames", 5),
+        ):
+            setattr(self.recorder, attr, get(f"audio.{attr}", default))
+        if self.warmup.is_ready("vad"):
+            self.vad.silence_duration = get("audio.silence_timeout", 1.2)
+        if self.wake_word is not None:
+            self.wake_word.threshold = get("wake_word.threshold", 0.5)
+        if "refiner.enabled" in changed:
+            self._toggle_refiner(get("refiner.enabled", True))
+        self.speak_transcript = get("pipeline.speak_transcript", True)
+        self.transcript_prefix = get("pipeline.transcript_prefix", "")
+        self.always_listening = get("listening.always_on", False)
+
+        restart = sorted(
+            key
+            for key in changed
+            if any(key == p or key.startswith(f"{p}.") for p in self.RESTART_KEYS)
+        )
+        if restart:
+            print(f"[Wanda] Restart needed to apply: {', '.join(restart)}")
+
     def _toggle_refiner(self, enabled: bool) -> None:
         if not self.engine:
             return
@@ -532,7 +747,9 @@ class WandaVoiceAssistant:
         """Main processing pipeline - delegates to WandaVoiceEngine."""
         self._processing = True
         try:
-            # 1. Transcribe
+            # 1. Transcribe (holds the audio until the STT model is loaded)
+            if not self.warmup.is_ready("stt"):
+                print("[Wanda] STT model still loading, holding audio...")
             text = self.stt.transcribe(audio, language="de")
             if not text:
                 print("[Wanda] No speech detected")
@@ -581,8 +798,10 @@ class WandaVoiceAssistant:
 
             # Use WandaVoiceEngine for the rest of the pipeline
             if self.engine:
+                from wanda_voice_core.schemas import ConfirmationState
+
                 future = asyncio.run_coroutine_threadsafe(
-                    self.engine.process_text(text), self._loop
+                    self.engine.process_text(text, audio=audio), self._loop
                 )
                 result = future.result(timeout=180)
 
@@ -692,7 +911,8 @@ class WandaVoiceAssistant:
         if not self.config.get("output.speak", True):
             return
         mode = mode or self.config.tts.get("mode", "short")
-        if FULL_MODE:
+        # No barge-in until the VAD has loaded
+        if FULL_MODE and self.warmup.is_ready("vad"):
             self.interrupt.speak_with_interrupt(text, mode)
         else:
             self.tts.speak(text, mode)
@@ -737,27 +957,32 @@ class WandaVoiceAssistant:
         if self.log_window:
             self.log_window.show()
 
-        if FULL_MODE:
-            briefing_text = self.briefing.generate()
-            print(f"\n[Briefing] {briefing_text}")
-            self._speak(briefing_text)
+        # The hotkey goes live as soon as the recorder is up; audio recorded
+        # before STT has loaded waits for it in _process
+        self.hotkey.start()
+        self.running = True
+        PROFILER.mark("hotkey ready")
+        self._start_wake_word()
 
         print("\n" + "=" * 70)
         print("  WANDA READY!")
         print("=" * 70)
         wake_status = (
-            "[Wake Word]" if (self.wake_word and self.wake_word.available) else ""
+            "[Wake Word]" if self.config.get("wake_word.enabled", False) else ""
         )
         print(f"  Orb = Daily Start | RIGHT CTRL = Record {wake_status}")
-        print(f"  'Wanda Pause' / 'Hey Wanda' = Sleep/Wake | 'Vollautonom' = Auto\n")
+        print(f"  'Wanda Pause' / 'Hey Wanda' = Sleep/Wake | 'Vollautonom' = Auto")
+        pending = self.warmup.pending()
+        if pending:
+            print(f"  Still loading: {', '.join(pending)}")
+        print()
 
-        if FULL_MODE and self.wake_word and self.wake_word.available:
-            self.wake_word.start()
-
-        self.hotkey.start()
-        self.running = True
+        if FULL_MODE:
+            # Marked as processing so always-on listening doesn't record it
+            self._processing = True
+            threading.Thread(target=self._speak_briefing, daemon=True).start()
 
-        if self.always_listening and not self.is_recording:
+        if self.always_listening and not self.is_recording and not self._processing:
             self.toggle_recording()
 
         try:
@@ -774,6 +999,16 @@ class WandaVoiceAssistant:
         finally:
             self._cleanup()
 
+    def _speak_briefing(self):
+        try:
+            briefing_text = self.briefing.generate()
+            print(f"\n[Briefing] {briefing_text}")
+            self._speak(briefing_text)
+        except Exception as e:
+            print(f"[Wanda] Briefing failed: {e}")
+        finally:
+            self._processing = False
+
     def _cleanup(self):
         """Cleanup all resources."""
         if self._shutting_down:
@@ -781,16 +1016,36 @@ class WandaVoiceAssistant:
         self._shutting_down = True
         print("[Wanda] Cleaning up...")
 
+        self.config.stop_watching()
+        if self.engine:
+            self.engine.config.stop_watching()
+
         if self.ollama and hasattr(self.ollama, "cleanup"):
             self.ollama.cleanup()
 
+        if self.engine:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.engine.stop_health_monitor(), self._loop
+                ).result(timeout=5)
+                asyncio.run_coroutine_threadsafe(
+                    self._gemini_provider.close(), self._loop
+                ).result(timeout=5)
+            except Exception:
+                pass
+            self.engine.run_manager.close()
+        if self.control:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.control.stop(), self._loop
+                ).result(timeout=2)
+            except Exception:
+                pass
         self._loop.call_soon_threadsafe(self._loop.stop)
 
         if FULL_MODE:
-            try:
+            if self.warmup.is_ready("vad"):
                 self.vad.stop()
-            except Exception:
-                pass
             try:
                 self.cli_proxy.close_all()
             except Exception:
@@ -809,10 +1064,13 @@ class WandaVoiceAssistant:
                     self.orb.destroy()
                 except Exception:
                     pass
-            try:
-                quit_gtk()
-            except Exception:
-                pass
+            if self.gtk_thread:
+                from ui.orb import quit_gtk
+
+                try:
+                    quit_gtk()
+                except Exception:
+                    pass
             if self.wake_word:
                 try:
                     self.wake_word.stop()
@@ -834,12 +1092,48 @@ def main():
     )
     parser.add_argument("--send-text", help="Send text directly to provider (no mic)")
     parser.add_argument("--stt-file", help="Transcribe a WAV file and exit")
+    # Handled by the thin client (wanda_voice_core.control.forward_cli)
+    parser.add_argument(
+        "--status", action="store_true", help="Show status of the running assistant"
+    )
+    parser.add_argument(
+        "--refiner", choices=("on", "off"), help="Toggle the running assistant's refiner"
+    )
+    parser.add_argument("--session", help="Conversation session for --send-text")
+    parser.add_argument("--socket", help="Control socket path")
+    parser.add_argument(
+        "--client", action="store_true", help="Fail instead of loading models locally"
+    )
+    parser.add_argument(
+        "--local", action="store_true", help="Never forward to a running assistant"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report per-module import and per-component init times",
+    )
     args = parser.parse_args()
+    PROFILER.enabled = args.profile_startup
+
+    if args.status or args.refiner:
+        # Only reachable when the control client could not be loaded
+        print("[Wanda] Control client unavailable (wanda_voice_core missing)")
+        sys.exit(1)
 
     if not acquire_single_instance():
         sys.exit(1)
 
-    wanda = WandaVoiceAssistant(config_path=args.config, daemon=args.daemon)
+    with PROFILER.measure("init", "assistant (total)"):
+        wanda = WandaVoiceAssistant(
+            config_path=args.config, daemon=args.daemon, simple=args.simple
+        )
+    if PROFILER.enabled:
+
+        def _report():
+            wanda.warmup.wait_all()
+            print(PROFILER.report())
+
+        threading.Thread(target=_report, daemon=True).start()
 
     if args.no_refine:
         wanda._toggle_refiner(False)
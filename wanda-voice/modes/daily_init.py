@@ -6,14 +6,16 @@ import time
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, TYPE_CHECKING
 
 try:
     from conversation.briefing import BriefingGenerator
-    from adapters.ollama_adapter import OllamaAdapter
 except ImportError:
     BriefingGenerator = None
-    OllamaAdapter = None
+
+if TYPE_CHECKING:
+    # Annotation only; importing it would pull in requests at startup
+    from adapters.ollama_adapter import OllamaAdapter
 
 
 class DailyInitializer:
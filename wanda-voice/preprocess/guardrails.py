@@ -1,9 +1,10 @@
 # Wanda Voice Assistant - Guardrails
 """Redact sensitive information before sending to AI."""
 
-import re
 from typing import List, Dict, Optional
 
+from wanda_voice_core.redaction import RedactionRule, Redactor
+
 
 class Guardrails:
     """Redact sensitive information before sending to AI."""
@@ -13,44 +14,59 @@ class Guardrails:
         "openai_key": r"(sk-proj-[a-zA-Z0-9_-]{20,})",
         "password": r"(password|passwd|pwd|passwort)\s*[:=]\s*\S+",
         "bearer": r"(Bearer\s+[a-zA-Z0-9_-]{20,})",
-        "email": r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
+        "email": r"(?<![a-zA-Z0-9_.+-])[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
         "ip_address": r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b",
         "credit_card": r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b",
         "private_key": r"-----BEGIN (RSA |EC |)PRIVATE KEY-----",
         "aws_key": r"AKIA[0-9A-Z]{16}",
     }
     
+    # Prefilter: a pattern is only scanned if one of these occurs in the text
+    LITERALS = {
+        "api_key": ("sk-",),
+        "openai_key": ("sk-proj-",),
+        "password": ("passw", "pwd"),
+        "bearer": ("bearer",),
+        "email": ("@",),
+        "private_key": ("-----begin",),
+        "aws_key": ("akia",),
+    }
+    
     def __init__(self, enabled: bool = True, custom_patterns: Optional[Dict[str, str]] = None):
         self.enabled = enabled
         self.patterns = self.DEFAULT_PATTERNS.copy()
         if custom_patterns:
             self.patterns.update(custom_patterns)
+        self._compile()
+    
+    def _compile(self):
+        rules = []
+        for name, pattern in self.patterns.items():
+            # Prefilter literals only hold for the built-in patterns
+            default = self.DEFAULT_PATTERNS.get(name) == pattern
+            literals = self.LITERALS.get(name, ()) if default else ()
+            rules.append(
+                RedactionRule(
+                    name, pattern, f"[REDACTED:{name}]", literals, ignore_case=True
+                )
+            )
+        self._redactor = Redactor(rules)
     
     def redact(self, text: str) -> str:
         """Redact sensitive strings."""
         if not self.enabled:
             return text
         
-        for name, pattern in self.patterns.items():
-            text = re.sub(
-                pattern, 
-                f"[REDACTED:{name}]", 
-                text, 
-                flags=re.IGNORECASE
-            )
-        
-        return text
+        return self._redactor.redact(text)
     
     def has_sensitive_data(self, text: str) -> bool:
         """Check if text contains sensitive data."""
-        for pattern in self.patterns.values():
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return self._redactor.search(text) is not None
     
     def add_pattern(self, name: str, pattern: str):
         """Add custom pattern."""
         self.patterns[name] = pattern
+        self._compile()
 
 
 if __name__ == "__main__":
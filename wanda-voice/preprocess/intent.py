@@ -1,9 +1,19 @@
 # Wanda Voice Assistant - Intent Detection & Prompt Preprocessing
 """Intent detection and prompt rewriting."""
 
-import re
 from typing import Dict, Tuple
 
+from wanda_voice_core.redaction import RedactionRule, Redactor
+
+_SECRET_REDACTOR = Redactor(
+    [
+        # sk-... (OpenAI style)
+        RedactionRule("key", r"\bsk-[a-zA-Z0-9]{32,}\b", "[REDACTED_KEY]", ("sk-",)),
+        # Long hex strings (potential tokens)
+        RedactionRule("token", r"\b[a-f0-9]{40,}\b", "[REDACTED_TOKEN]"),
+    ]
+)
+
 
 class IntentDetector:
     """Detect user intent from transcript and rewrite prompt."""
@@ -111,14 +121,8 @@ User: {prompt}""",
         if not redact_secrets:
             return text
         
-        # Simple regex-based redaction (can be extended)
         # Redact things that look like API keys, tokens, etc.
-        
-        # Example: sk-... (OpenAI style)
-        text = re.sub(r'\bsk-[a-zA-Z0-9]{32,}\b', '[REDACTED_KEY]', text)
-        
-        # Example: long hex strings (potential tokens)
-        text = re.sub(r'\b[a-f0-9]{40,}\b', '[REDACTED_TOKEN]', text)
+        text = _SECRET_REDACTOR.redact(text)
         
         return text
 
@@ -0,0 +1,78 @@
+# Wanda Voice Assistant - Startup Profiler
+"""Import, init and readiness timings for `main.py --profile-startup`.
+
+Timings are always collected (two perf_counter calls per step); the
+report is only printed when profiling is enabled.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+# Modules that dominate startup when they get imported
+HEAVY_MODULES = (
+    "torch",
+    "faster_whisper",
+    "ctranslate2",
+    "sounddevice",
+    "gi",
+    "cairo",
+    "telegram",
+    "openwakeword",
+    "edge_tts",
+    "aiohttp",
+)
+
+
+class StartupProfiler:
+    """Records how long each import and component init takes."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.records: List[Tuple[str, str, float, Optional[str]]] = []
+
+    @contextmanager
+    def measure(self, kind: str, name: str):
+        """Time a block; kind is "import" or "init"."""
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.records.append((kind, name, time.perf_counter() - start, error))
+
+    def mark(self, name: str) -> None:
+        """Record a milestone (e.g. "hotkey ready") as time since start."""
+        self.records.append(("ready", name, self.total(), None))
+
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def report(self) -> str:
+        lines = ["", "=" * 70, "  STARTUP PROFILE", "=" * 70]
+        for kind in ("import", "init", "ready"):
+            rows = sorted(
+                (r for r in self.records if r[0] == kind),
+                # Milestones in the order they were reached, the rest slowest first
+                key=lambda r: r[2] if kind == "ready" else -r[2],
+            )
+            if not rows:
+                continue
+            lines.append(f"  {kind}:")
+            for _, name, seconds, error in rows:
+                suffix = f"  ({error})" if error else ""
+                lines.append(f"    {seconds * 1000:8.1f} ms  {name}{suffix}")
+        loaded = [m for m in HEAVY_MODULES if m in sys.modules]
+        lines.append(f"  heavy modules loaded: {', '.join(loaded) or 'none'}")
+        lines.append(f"  total: {self.total() * 1000:.1f} ms")
+        lines.append("=" * 70)
+        return "\n".join(lines)
+
+
+# Shared by main.py and the components it initializes
+PROFILER = StartupProfiler()
@@ -0,0 +1,185 @@
+# Wanda Voice Assistant - Warm-up Orchestrator
+"""Parallel component loading with per-component readiness.
+
+Slow, independent loads (STT model, VAD model, TTS voice, Ollama
+preload, wake-word model) each run on their own thread as soon as they
+are added. Code that needs a component either waits for it explicitly
+or holds a ReadyProxy, which blocks on first use until the component is
+loaded. That lets the hotkey go live as soon as the recorder is up:
+audio captured early simply waits in the processing thread for STT.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class WarmupError(RuntimeError):
+    """A component failed to load (or a dependency of it did)."""
+
+
+class _Component:
+    def __init__(
+        self, name: str, loader: Callable[[], Any], depends_on: Sequence[str]
+    ):
+        self.name = name
+        self.loader = loader
+        self.depends_on = tuple(depends_on)
+        self.state = PENDING
+        self.value: Any = None
+        self.error: Optional[str] = None
+        self.seconds: Optional[float] = None
+        self.done = threading.Event()
+        self.callbacks: List[Callable[[Any], None]] = []
+
+
+class WarmupOrchestrator:
+    """Starts component loaders concurrently and tracks their readiness."""
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        self.started = time.perf_counter()
+        self._components: Dict[str, _Component] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        depends_on: Sequence[str] = (),
+        on_ready: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """Register a component and start loading it right away.
+
+        The loader's return value becomes the component; on_ready is
+        called with it on the loader thread once it is available.
+        Dependencies must be registered first; the loader waits for them.
+        """
+        component = _Component(name, loader, depends_on)
+        if on_ready is not None:
+            component.callbacks.append(on_ready)
+        with self._lock:
+            if name in self._components:
+                raise ValueError(f"Component already registered: {name}")
+            for dep in component.depends_on:
+                self._get(dep)
+            self._components[name] = component
+        threading.Thread(
+            target=self._load, args=(component,), name=f"warmup-{name}", daemon=True
+        ).start()
+
+    def _load(self, component: _Component) -> None:
+        try:
+            for dep in component.depends_on:
+                self.wait(dep)
+            component.state = LOADING
+            start = time.perf_counter()
+            if self.profiler is not None:
+                with self.profiler.measure("init", component.name):
+                    value = component.loader()
+            else:
+                value = component.loader()
+            component.seconds = time.perf_counter() - start
+        except Exception as e:
+            component.error = f"{type(e).__name__}: {e}"
+            component.state = FAILED
+            component.done.set()
+            print(f"[Warmup] {component.name} failed: {component.error}")
+            return
+
+        with self._lock:
+            component.value = value
+            component.state = READY
+            callbacks, component.callbacks = component.callbacks, []
+        if self.profiler is not None:
+            self.profiler.mark(f"{component.name} ready")
+        print(f"[Warmup] {component.name} ready ({component.seconds:.2f}s)")
+        # Callbacks run before waiters wake, so a waiter sees it wired up
+        for callback in callbacks:
+            try:
+                callback(value)
+            except Exception as e:
+                print(f"[Warmup] {component.name} on_ready error: {e}")
+        component.done.set()
+
+    def on_ready(self, name: str, callback: Callable[[Any], None]) -> None:
+        """Call callback with the component once loaded (now, if it is)."""
+        component = self._get(name)
+        with self._lock:
+            if component.state != READY:
+                component.callbacks.append(callback)
+                return
+        callback(component.value)
+
+    def is_ready(self, name: str) -> bool:
+        component = self._components.get(name)
+        return component is not None and component.state == READY
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> Any:
+        """Block until the component is loaded and return it."""
+        component = self._get(name)
+        if component.state == READY:
+            return component.value
+        if not component.done.wait(timeout):
+            raise TimeoutError(f"{name} still loading after {timeout}s")
+        if component.state == FAILED:
+            raise WarmupError(f"{name} failed to load: {component.error}")
+        return component.value
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every registered component to finish (loaded or failed)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for component in list(self._components.values()):
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            if not component.done.wait(remaining):
+                return False
+        return True
+
+    def proxy(self, name: str) -> "ReadyProxy":
+        return ReadyProxy(self, name)
+
+    def pending(self) -> List[str]:
+        return [c.name for c in self._components.values() if not c.done.is_set()]
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            c.name: {"state": c.state, "seconds": c.seconds, "error": c.error}
+            for c in self._components.values()
+        }
+
+    def _get(self, name: str) -> _Component:
+        try:
+            return self._components[name]
+        except KeyError:
+            raise KeyError(f"Unknown warm-up component: {name}") from None
+
+
+class ReadyProxy:
+    """Stand-in for a component that may still be loading.
+
+    Attribute access blocks until the component is ready, then forwards
+    to it. Raises WarmupError if the component failed to load.
+    """
+
+    __slots__ = ("_warmup", "_name")
+
+    def __init__(self, warmup: WarmupOrchestrator, name: str):
+        object.__setattr__(self, "_warmup", warmup)
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._warmup.wait(self._name), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._warmup.wait(self._name), attr, value)
+
+    def __repr__(self) -> str:
+        state = self._warmup.status().get(self._name, {}).get("state")
+        return f"<ReadyProxy {self._name} ({state})>"
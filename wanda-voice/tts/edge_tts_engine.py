@@ -19,6 +19,14 @@ except ImportError:
     EDGE_TTS_AVAILABLE = False
     print("[TTS] edge-tts nicht installiert: pip install edge-tts")
 
+try:
+    from wanda_voice_core.tracing import span
+except ImportError:  # used without the core package: no tracing
+    from contextlib import nullcontext
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
 
 # Deutsche Neural Voices - nur tatsächlich verfügbare
 GERMAN_VOICES = {
@@ -169,6 +177,10 @@ class EdgeTTSEngine:
             text: Text to speak
             mode: "short" (first sentences) or "full" (everything)
         """
+        with span("tts.edge", cat="tts", chars=len(text), mode=mode):
+            self._speak(text, mode)
+
+    def _speak(self, text: str, mode: str):
         if not self.available:
             print(f"[TTS] (unavailable) {text[:100]}...")
             return
@@ -185,7 +197,8 @@ class EdgeTTSEngine:
                 text = text[:300] + "..."
 
         # Generate audio
-        audio_path = self.generate(text)
+        with span("tts.edge.generate", cat="tts", chars=len(text)):
+            audio_path = self.generate(text)
         if not audio_path:
             return
 
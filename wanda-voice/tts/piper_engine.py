@@ -6,6 +6,14 @@ import threading
 from pathlib import Path
 from typing import Optional
 
+try:
+    from wanda_voice_core.tracing import span
+except ImportError:  # used without the core package: no tracing
+    from contextlib import nullcontext
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
 
 class PiperEngine:
     """TTS engine using piper with interrupt support."""
@@ -41,6 +49,10 @@ class PiperEngine:
     
     def speak(self, text: str, mode: Optional[str] = None) -> bool:
         """Speak text (stoppable)."""
+        with span("tts.piper", cat="tts", chars=len(text or "")):
+            return self._speak(text, mode)
+
+    def _speak(self, text: str, mode: Optional[str]) -> bool:
         if not text or not text.strip() or not self.piper_cmd:
             return False
         
@@ -7,6 +7,7 @@ Implements the allowlist/denylist/confirmlist from TERMINAL_POLICY.md.
 import re
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 class SafetyLevel(Enum):
@@ -62,6 +63,29 @@ class SafetyChecker:
         r"^(eslint|prettier|black|mypy)(\s|$)",
     ]
 
+    # Tiers of the compiled scanner, most severe first
+    _TIERS = ("DENYLIST", "CONFIRMLIST", "ALLOWLIST")
+
+    def __init__(self, cache_size: int = 1024):
+        # One alternation of zero-width lookaheads: a single scan finds, at
+        # every position, the most severe pattern matching there
+        parts = []
+        for tier, name in enumerate(self._TIERS):
+            for index, pattern in enumerate(getattr(self, name)):
+                parts.append(f"(?=(?P<t{tier}_{index}>{pattern}))")
+        self._scanner = re.compile("|".join(parts), re.IGNORECASE)
+        self._match = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _scan(self, command: str) -> tuple[int, int] | None:
+        best = None
+        for m in self._scanner.finditer(command):
+            tier, index = map(int, m.lastgroup[1:].split("_"))
+            if best is None or (tier, index) < best:
+                best = (tier, index)
+                if best == (0, 0):
+                    break
+        return best
+
     def check(self, command: str) -> SafetyResult:
         """
         Check a command against security policies.
@@ -73,30 +97,33 @@ class SafetyChecker:
             SafetyResult with level and optional message
         """
         command = command.strip()
+        tier, index = self._match(command) or (None, None)
 
         # Check DENYLIST first
-        for pattern in self.DENYLIST:
-            if re.search(pattern, command, re.IGNORECASE):
-                return SafetyResult(
-                    level=SafetyLevel.DENY,
-                    message=f"BLOCKED: This command is on the denylist ({pattern})"
-                )
+        if tier == 0:
+            pattern = self.DENYLIST[index]
+            return SafetyResult(
+                level=SafetyLevel.DENY,
+                message=f"BLOCKED: This command is on the denylist ({pattern})"
+            )
 
         # Check CONFIRMLIST
-        for pattern in self.CONFIRMLIST:
-            if re.search(pattern, command, re.IGNORECASE):
-                return SafetyResult(
-                    level=SafetyLevel.CONFIRM,
-                    message=f"This command requires confirmation: {command}"
-                )
+        if tier == 1:
+            return SafetyResult(
+                level=SafetyLevel.CONFIRM,
+                message=f"This command requires confirmation: {command}"
+            )
 
         # Check ALLOWLIST
-        for pattern in self.ALLOWLIST:
-            if re.search(pattern, command, re.IGNORECASE):
-                return SafetyResult(level=SafetyLevel.ALLOW)
+        if tier == 2:
+            return SafetyResult(level=SafetyLevel.ALLOW)
 
         # Default: require confirmation for unknown commands
         return SafetyResult(
             level=SafetyLevel.CONFIRM,
             message=f"Unknown command, please confirm: {command}"
         )
+
+    def check_many(self, commands: list[str]) -> list[SafetyResult]:
+        """Check every step of a multi-step plan in one call."""
+        return [self.check(command) for command in commands]
@@ -2,6 +2,14 @@
 
 __version__ = "2.0.0"
 
-from wanda_voice_core.engine import WandaVoiceEngine
-
 __all__ = ["WandaVoiceEngine", "__version__"]
+
+
+def __getattr__(name):
+    """Import the engine on first use so light submodules (control, config)
+    don't pull in the whole pipeline."""
+    if name == "WandaVoiceEngine":
+        from wanda_voice_core.engine import WandaVoiceEngine
+
+        return WandaVoiceEngine
+    raise AttributeError(f"module 'wanda_voice_core' has no attribute '{name}'")
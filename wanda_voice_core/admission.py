@@ -0,0 +1,101 @@
+"""Admission control and per-key concurrency limits for WANDA Voice Core."""
+
+from __future__ import annotations
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from wanda_voice_core.schemas import OverloadedError
+from wanda_voice_core.tracing import span
+
+
+class AdmissionController:
+    """Runs at most max_concurrent pipelines; up to max_queue more may wait.
+
+    A request arriving when every slot is busy and the queue is full is
+    rejected immediately with OverloadedError (HTTP 429) instead of piling
+    up behind slow provider calls.
+    """
+
+    def __init__(self, max_concurrent: int = 4, max_queue: int = 16):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.running = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.max_concurrent)
+        if self.running >= self.max_concurrent and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise OverloadedError(
+                f"{self.running} runs active, {self.waiting} queued"
+            )
+        self.waiting += 1
+        try:
+            await self._sem.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self._sem.release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class KeyedLimiter:
+    """One semaphore per key (e.g. provider name) with per-key limits.
+
+    Time spent waiting for a slot shows up as a "<name>.wait" span.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limits: Optional[dict[str, int]] = None,
+        default: int = 2,
+    ):
+        self.name = name
+        self.limits = dict(limits or {})
+        self.default = default
+        self._sems: dict[str, asyncio.Semaphore] = {}
+        self._active: dict[str, int] = {}
+
+    def limit(self, key: str) -> int:
+        return max(1, int(self.limits.get(key, self.default)))
+
+    @asynccontextmanager
+    async def acquire(self, key: str) -> AsyncIterator[None]:
+        sem = self._sems.get(key)
+        if sem is None:
+            sem = self._sems[key] = asyncio.Semaphore(self.limit(key))
+        with span(f"{self.name}.wait", cat=self.name, key=key):
+            await sem.acquire()
+        self._active[key] = self._active.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            self._active[key] -= 1
+            sem.release()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            key: {"active": self._active.get(key, 0), "limit": self.limit(key)}
+            for key in self._sems
+        }
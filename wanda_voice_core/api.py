@@ -4,11 +4,17 @@ from __future__ import annotations
 import asyncio
 import json
 import time
-from typing import Optional
+from typing import Any, Callable, Optional
 
+from wanda_voice_core.broadcaster import EventBroadcaster, EventFilter
 from wanda_voice_core.config import VoiceCoreConfig
 from wanda_voice_core.engine import WandaVoiceEngine
-from wanda_voice_core.schemas import UtteranceRequest, ValidationError
+from wanda_voice_core.schemas import (
+    OverloadedError,
+    UtteranceRequest,
+    ValidationError,
+    validate_session_id,
+)
 
 try:
     from aiohttp import web
@@ -20,10 +26,22 @@ except ImportError:
 class WandaAPI:
     """REST API server for WANDA Voice Core."""
 
-    def __init__(self, engine: WandaVoiceEngine, config: Optional[VoiceCoreConfig] = None):
+    def __init__(
+        self,
+        engine: WandaVoiceEngine,
+        config: Optional[VoiceCoreConfig] = None,
+        stt_engine: Any = None,
+        stt_loader: Optional[Callable[[], Any]] = None,
+    ):
         self.engine = engine
         self.config = config or engine.config
+        # STT for GET /v1/audio (object with .transcribe(audio, language)),
+        # or a loader called once on the first audio connection
+        self.stt_engine = stt_engine
+        self._stt_loader = stt_loader
+        self._stt_lock = asyncio.Lock()
         self._start_time = time.time()
+        self.broadcaster: Optional[EventBroadcaster] = None
 
     def create_app(self) -> web.Application:
         if not AIOHTTP_AVAILABLE:
@@ -31,9 +49,14 @@ class WandaAPI:
 
         app = web.Application()
         app.router.add_post("/v1/utterance", self.handle_utterance)
+        app.router.add_post("/v1/utterance/stream", self.handle_utterance_stream)
+        app.router.add_post("/v1/utterances", self.handle_utterances)
         app.router.add_get("/v1/health", self.handle_health)
         app.router.add_get("/v1/status", self.handle_status)
         app.router.add_get("/v1/stream", self.handle_stream)
+        app.router.add_get("/v1/metrics", self.handle_metrics)
+        app.router.add_get("/v1/audio", self.handle_audio)
+        app.on_cleanup.append(self._on_cleanup)
         return app
 
     async def handle_utterance(self, request: web.Request) -> web.Response:
@@ -44,29 +67,185 @@ class WandaAPI:
             return web.json_response({"error": "Invalid JSON"}, status=400)
 
         try:
-            req = UtteranceRequest(
-                text=body.get("text", ""),
-                mode=body.get("mode", "text"),
-                context=body.get("context"),
+            req = self._parse_utterance(body)
+        except ValidationError as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        try:
+            result = await self.engine.process_text(
+                req.text, skip_confirmation=True, session_id=req.session_id
             )
-            req.validate()
+        except OverloadedError as e:
+            return self._overloaded(e)
+
+        return web.json_response(self._result_body(result, req))
+
+    async def handle_utterance_stream(
+        self, request: web.Request
+    ) -> web.StreamResponse:
+        """POST /v1/utterance/stream - One utterance as SSE.
+
+        Pipeline events of the run are sent as they happen (event: <type>),
+        then the answer (event: response) and the full result (event: result).
+        """
+        try:
+            body = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response({"error": "Invalid JSON"}, status=400)
+        try:
+            req = self._parse_utterance(body)
         except ValidationError as e:
             return web.json_response({"error": str(e)}, status=400)
 
-        result = await self.engine.process_text(
-            req.text, skip_confirmation=True
+        run_id = self.engine.run_manager.new_run_id()
+        broadcaster = self._broadcaster()
+        cursor = broadcaster.last_id
+        task = asyncio.create_task(
+            self.engine.process_text(
+                req.text,
+                skip_confirmation=True,
+                session_id=req.session_id,
+                run_id=run_id,
+            )
         )
+        # The run's events come from the shared broadcaster ring, so a slow
+        # client costs no memory beyond the ring itself
+        frames = broadcaster.follow(EventFilter(run_id=run_id), task, cursor)
+        resp: Optional[web.StreamResponse] = None
+        try:
+            first = await anext(frames, None)
+            if first is None and isinstance(task.exception(), OverloadedError):
+                # Rejected before the run started: plain 429, no stream
+                return self._overloaded(task.exception())
 
-        return web.json_response({
+            resp = web.StreamResponse(
+                status=200,
+                reason="OK",
+                headers={
+                    "Content-Type": "text/event-stream",
+                    "Cache-Control": "no-cache",
+                },
+            )
+            await resp.prepare(request)
+            if first is not None:
+                await resp.write(first)
+                async for frame in frames:
+                    await resp.write(frame)
+
+            result = task.result()
+            if result.response_text:
+                await resp.write(
+                    _sse("response", {"run_id": run_id, "text": result.response_text})
+                )
+            await resp.write(_sse("result", self._result_body(result, req)))
+            await resp.write_eof()
+        except ConnectionResetError:
+            pass
+        finally:
+            await frames.aclose()
+            if not task.done():
+                task.cancel()
+        return resp
+
+    async def handle_utterances(self, request: web.Request) -> web.StreamResponse:
+        """POST /v1/utterances - Batch of utterances, streamed back as NDJSON.
+
+        Body: a JSON array of utterance objects (or {"utterances": [...]}).
+        Items run concurrently, at most as many at once as the engine
+        admits, and each result is written as one line as soon as it
+        completes, tagged with its index (and "id" if the item had one).
+        """
+        try:
+            body = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response({"error": "Invalid JSON"}, status=400)
+        items = body.get("utterances") if isinstance(body, dict) else body
+        if not isinstance(items, list):
+            return web.json_response(
+                {"error": "expected a JSON array of utterances"}, status=400
+            )
+        max_batch = self.config.get("api.max_batch", 1000)
+        if len(items) > max_batch:
+            return web.json_response(
+                {"error": f"batch too large ({len(items)} > {max_batch})"},
+                status=413,
+            )
+
+        resp = web.StreamResponse(
+            status=200,
+            reason="OK",
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        await resp.prepare(request)
+
+        # Leave the admission queue to other clients: never hold more
+        # batch items in flight than the engine runs at once
+        limit = asyncio.Semaphore(self.engine.admission.max_concurrent)
+
+        async def run_item(index: int, item: Any) -> dict[str, Any]:
+            line: dict[str, Any] = {"index": index}
+            if isinstance(item, dict) and "id" in item:
+                line["id"] = item["id"]
+            try:
+                req = self._parse_utterance(item)
+            except ValidationError as e:
+                return {**line, "status": 400, "error": str(e)}
+            async with limit:
+                try:
+                    result = await self.engine.process_text(
+                        req.text, skip_confirmation=True, session_id=req.session_id
+                    )
+                except OverloadedError as e:
+                    return {**line, "status": 429, "error": f"Too many requests: {e}"}
+            return {**line, "status": 200, **self._result_body(result, req)}
+
+        tasks = [
+            asyncio.create_task(run_item(i, item)) for i, item in enumerate(items)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                line = await next_done
+                await resp.write(
+                    json.dumps(line, ensure_ascii=False).encode() + b"\n"
+                )
+            await resp.write_eof()
+        except ConnectionResetError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+        return resp
+
+    def _parse_utterance(self, body: Any) -> UtteranceRequest:
+        if not isinstance(body, dict):
+            raise ValidationError("utterance must be a JSON object")
+        return UtteranceRequest(
+            text=body.get("text", ""),
+            mode=body.get("mode", "text"),
+            context=body.get("context"),
+            session_id=body.get("session_id"),
+        ).validate()
+
+    def _result_body(self, result: Any, req: UtteranceRequest) -> dict[str, Any]:
+        return {
             "final_text": result.improved_text or result.transcript,
             "response_text": result.response_text,
             "actions": [],
             "events_summary": [
-                e.event_type for e in self.engine.event_bus.get_events_for_run(result.run_id or "")
+                e.event_type
+                for e in self.engine.event_bus.get_events_for_run(result.run_id or "")
             ],
             "run_id": result.run_id,
+            "session_id": req.session_id,
             "error": result.error,
-        })
+        }
+
+    def _overloaded(self, error: Exception) -> web.Response:
+        return web.json_response(
+            {"error": f"Too many requests: {error}"},
+            status=429,
+            headers={"Retry-After": "1"},
+        )
 
     async def handle_health(self, request: web.Request) -> web.Response:
         """GET /v1/health - Health check."""
@@ -80,8 +259,9 @@ class WandaAPI:
         provider_name = "none"
         provider_available = False
         if self.engine._primary_provider:
+            # Last known state from the health monitor: never probe on the loop
             provider_name = self.engine._primary_provider.name
-            provider_available = self.engine._primary_provider.is_available()
+            provider_available = self.engine.health.is_healthy(provider_name)
 
         return web.json_response({
             "state": "running",
@@ -89,14 +269,44 @@ class WandaAPI:
                 "name": provider_name,
                 "available": provider_available,
             },
+            "providers": self.engine.health.status(),
+            "admission": self.engine.admission.stats(),
+            "provider_limits": self.engine.provider_limits.stats(),
+            "active_runs": len(self.engine.run_manager.active_runs),
+            "sessions": self.engine.sessions.stats(),
+            "stream": self.broadcaster.stats() if self.broadcaster else None,
             "config_profile": self.config.get("profile", "gui"),
             "recent_events": [
                 e.to_dict() for e in self.engine.event_bus.get_recent_events(10)
             ],
         })
 
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        """GET /v1/metrics - Prometheus text format (?format=json for percentiles)."""
+        if request.query.get("format") == "json":
+            return web.json_response(self.engine.metrics.snapshot())
+        return web.Response(
+            body=self.engine.metrics.render_prometheus().encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
     async def handle_stream(self, request: web.Request) -> web.StreamResponse:
-        """GET /v1/stream - SSE for real-time events."""
+        """GET /v1/stream - SSE for real-time events.
+
+        Query: types=run.start,provider.* and run_id=... filter server-side.
+        Reconnecting clients resume via the Last-Event-ID header (or
+        ?last_event_id=).
+        """
+        types = [t.strip() for t in request.query.get("types", "").split(",")]
+        flt = EventFilter(types, run_id=request.query.get("run_id") or None)
+        last_id = request.headers.get("Last-Event-ID") or request.query.get(
+            "last_event_id"
+        )
+        try:
+            last_event_id = int(last_id) if last_id else None
+        except ValueError:
+            return web.json_response({"error": "Invalid Last-Event-ID"}, status=400)
+
         resp = web.StreamResponse(
             status=200,
             reason="OK",
@@ -106,29 +316,144 @@ class WandaAPI:
                 "Connection": "keep-alive",
             },
         )
+        # Fix the start position before the client sees the headers
+        broadcaster = self._broadcaster()
+        if last_event_id is None:
+            last_event_id = broadcaster.last_id
         await resp.prepare(request)
 
-        queue: asyncio.Queue = asyncio.Queue()
+        try:
+            async for frame in broadcaster.stream(flt, last_event_id):
+                await resp.write(frame)
+        except ConnectionResetError:
+            pass
 
-        def on_event(event):
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                pass
+        return resp
 
-        self.engine.event_bus.subscribe("*", on_event)
+    async def handle_audio(self, request: web.Request) -> web.WebSocketResponse:
+        """GET /v1/audio - WebSocket audio ingestion.
 
+        Client -> server: an optional JSON "start" message
+        ({"type": "start", "sample_rate": 16000, "session_id": ...}), then
+        binary frames of 16 kHz mono signed 16-bit little-endian PCM, and
+        {"type": "end"} to close the current utterance (the server also
+        endpoints on silence). Server -> client: JSON messages of type
+        "vad", "transcript" (final=false for partials), "event" (pipeline
+        events of the run) and "result", plus "end" once an "end" request
+        has been handled. One connection may carry any number of
+        utterances.
+        """
+        from wanda_voice_core.audio_stream import AudioStreamSession, Endpointer
+
+        ws = web.WebSocketResponse(max_msg_size=1024 * 1024)
+        await ws.prepare(request)
+        stt_engine = await self._stt()
+        if stt_engine is None:
+            await ws.send_json({"type": "error", "error": "No STT engine configured"})
+            await ws.close()
+            return ws
+
+        sample_rate = self.config.get("audio.sample_rate", 16000)
+
+        async def send(message: dict[str, Any]) -> None:
+            if not ws.closed:
+                await ws.send_str(json.dumps(message, ensure_ascii=False))
+
+        def new_session(session_id: Optional[str]) -> AudioStreamSession:
+            return AudioStreamSession(
+                self.engine,
+                stt_engine,
+                send,
+                session_id=session_id,
+                language=self.config.get("stt.language", "de"),
+                sample_rate=sample_rate,
+                partial_interval_s=self.config.get("audio.partial_interval_s", 1.0),
+                endpointer=Endpointer(
+                    sample_rate=sample_rate,
+                    threshold=self.config.get("audio.silence_threshold", 0.01),
+                    silence_timeout_s=self.config.get("audio.silence_timeout", 1.2),
+                    max_seconds=self.config.get("audio.max_seconds", 60),
+                ),
+            )
+
+        async def finish(stream: AudioStreamSession) -> None:
+            await stream.finish()
+            await send({"type": "end"})
+
+        # Endpointing is cheap; STT and the pipeline run in the sessions'
+        # own tasks so this loop keeps reading frames and control messages
+        stream = new_session(None)
+        pending: set[asyncio.Task] = set()
         try:
-            while True:
-                event = await asyncio.wait_for(queue.get(), timeout=30)
-                data = json.dumps(event.to_dict(), ensure_ascii=False)
-                await resp.write(f"data: {data}\n\n".encode())
-        except (asyncio.TimeoutError, ConnectionResetError):
-            pass
+            async for msg in ws:
+                if msg.type == web.WSMsgType.BINARY:
+                    await stream.feed(msg.data)
+                elif msg.type == web.WSMsgType.TEXT:
+                    try:
+                        control = json.loads(msg.data)
+                    except json.JSONDecodeError:
+                        await send({"type": "error", "error": "Invalid JSON"})
+                        continue
+                    kind = control.get("type") if isinstance(control, dict) else None
+                    if kind == "start":
+                        if control.get("sample_rate", sample_rate) != sample_rate:
+                            await send({
+                                "type": "error",
+                                "error": f"sample_rate must be {sample_rate}",
+                            })
+                            break
+                        try:
+                            session_id = validate_session_id(
+                                control.get("session_id")
+                            )
+                        except ValidationError as e:
+                            await send({"type": "error", "error": str(e)})
+                            break
+                        # Utterances already cut still get their results
+                        await stream.close(cancel_pending=False)
+                        stream = new_session(session_id)
+                        await send({"type": "ready", "sample_rate": sample_rate})
+                    elif kind == "end":
+                        task = asyncio.create_task(finish(stream))
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                    else:
+                        await send({"type": "error", "error": f"Unknown message: {kind}"})
+                elif msg.type == web.WSMsgType.ERROR:
+                    break
         finally:
-            self.engine.event_bus.unsubscribe("*", on_event)
+            for task in pending:
+                task.cancel()
+            await stream.close()
+        return ws
 
-        return resp
+    async def _stt(self) -> Any:
+        """STT engine for /v1/audio, loading it on first use."""
+        if self.stt_engine is None and self._stt_loader is not None:
+            async with self._stt_lock:
+                loader, self._stt_loader = self._stt_loader, None
+                if loader is not None:  # a failed load is not retried
+                    self.stt_engine = await asyncio.to_thread(loader)
+        return self.stt_engine
+
+    def _broadcaster(self) -> EventBroadcaster:
+        if self.broadcaster is None:
+            self.broadcaster = EventBroadcaster(
+                self.engine.event_bus,
+                capacity=self.config.get("api.stream_buffer", 1024),
+                keepalive_s=self.config.get("api.stream_keepalive_s", 15.0),
+            )
+        self.broadcaster.attach()
+        return self.broadcaster
+
+    async def _on_cleanup(self, app: web.Application) -> None:
+        if self.broadcaster is not None:
+            self.broadcaster.detach()
+
+
+def _sse(event: str, data: dict[str, Any]) -> bytes:
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n".encode()
 
 
 def run_api(config: Optional[VoiceCoreConfig] = None) -> None:
@@ -139,18 +464,46 @@ def run_api(config: Optional[VoiceCoreConfig] = None) -> None:
 
     config = config or VoiceCoreConfig()
     engine = WandaVoiceEngine(config)
+    if config.get("live_reload.enabled", True):
+        config.watch()
 
     # Auto-setup providers
     from wanda_voice_core.providers.gemini_cli import GeminiCLIProvider
     primary = GeminiCLIProvider(
         model=config.get("providers.gemini_model", "flash"),
         timeout=config.get("providers.gemini_timeout", 90),
+        hedge=config.get("providers.gemini_hedge", True),
+        hedge_percentile=config.get("providers.gemini_hedge_percentile", 0.9),
+        hedge_initial_delay=config.get("providers.gemini_hedge_initial_delay", 20.0),
+        hedge_min_delay=config.get("providers.gemini_hedge_min_delay", 3.0),
+        hedge_min_samples=config.get("providers.gemini_hedge_min_samples", 5),
+        pool_size=config.get("providers.gemini_pool_size", 1),
+        pool_max_idle_s=config.get("providers.gemini_pool_max_idle_s", 600),
     )
     engine.set_providers(primary)
 
-    api = WandaAPI(engine, config)
+    from wanda_voice_core.stt import load_stt
+
+    # The Whisper model is loaded by the first /v1/audio connection
+    stt_loader = None
+    if config.get("api.audio_enabled", True):
+        stt_loader = lambda: load_stt(config)  # noqa: E731
+    api = WandaAPI(engine, config, stt_loader=stt_loader)
     app = api.create_app()
 
+    async def _warm_providers(app: web.Application) -> None:
+        await primary.warm_pool()
+        engine.start_health_monitor()
+
+    async def _close_providers(app: web.Application) -> None:
+        await engine.stop_health_monitor()
+        await primary.close()
+        engine.run_manager.close()
+        config.stop_watching()
+
+    app.on_startup.append(_warm_providers)
+    app.on_cleanup.append(_close_providers)
+
     host = config.get("api.host", "127.0.0.1")
     port = config.get("api.port", 8370)
     print(f"[API] Starting on {host}:{port}")
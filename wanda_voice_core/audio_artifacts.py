@@ -0,0 +1,129 @@
+"""Compressed audio artifacts for WANDA Voice Core runs.
+
+Input audio is stored per run for regression replay. Samples are encoded
+to FLAC (lossless, ~4x smaller than float32) or Opus (lossy, ~30x) when
+libsndfile is available through soundfile, and to 16-bit WAV otherwise.
+"""
+
+from __future__ import annotations
+import io
+import wave
+from pathlib import Path
+from typing import Any, Optional
+
+# Optional encoder; falls back to 16-bit PCM WAV from the standard library
+try:
+    import soundfile as sf
+except Exception:
+    sf = None
+
+CODEC_FLAC = "flac"
+CODEC_OPUS = "opus"
+CODEC_WAV = "wav"
+
+_EXTENSIONS = {CODEC_FLAC: ".flac", CODEC_OPUS: ".opus", CODEC_WAV: ".wav"}
+
+
+def resolve_codec(codec: str) -> str:
+    """Return the best available codec, preferring the requested one."""
+    if codec not in _EXTENSIONS:
+        raise ValueError(f"Unknown audio codec: {codec}")
+    if sf is None:
+        return CODEC_WAV
+    if codec == CODEC_OPUS and "OPUS" not in sf.available_subtypes("OGG"):
+        return CODEC_FLAC
+    return codec
+
+
+def extension(codec: str) -> str:
+    return _EXTENSIONS[codec]
+
+
+def to_samples(audio: Any) -> Any:
+    """View audio as a flat float32 numpy array, copying only if needed.
+
+    Accepts numpy arrays, raw float32 buffers (bytes, bytearray,
+    memoryview) and WAV file bytes.
+    """
+    import numpy as np
+
+    if isinstance(audio, np.ndarray):
+        return np.asarray(audio, dtype=np.float32).reshape(-1)
+    view = memoryview(audio)
+    if view[:4] == b"RIFF":
+        return _decode_wav(io.BytesIO(view))[0]
+    return np.frombuffer(view, dtype=np.float32)
+
+
+def encode_audio(
+    samples: Any,
+    sample_rate: int,
+    codec: str,
+    max_bytes: Optional[int] = None,
+) -> Optional[bytes]:
+    """Encode mono float32 samples; trims the tail to fit max_bytes.
+
+    Returns None if not even a trimmed clip fits.
+    """
+    encoded = _encode(samples, sample_rate, codec)
+    if max_bytes is None or len(encoded) <= max_bytes:
+        return encoded
+    if max_bytes <= 0:
+        return None
+    # Bitrate is roughly constant, so one proportional trim gets close
+    keep = int(len(samples) * max_bytes / len(encoded) * 0.95)
+    if keep <= 0:
+        return None
+    encoded = _encode(samples[:keep], sample_rate, codec)
+    return encoded if len(encoded) <= max_bytes else None
+
+
+def _encode(samples: Any, sample_rate: int, codec: str) -> bytes:
+    import numpy as np
+
+    buf = io.BytesIO()
+    if codec == CODEC_WAV:
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(sample_rate)
+            w.writeframes(pcm.tobytes())
+    elif codec == CODEC_OPUS:
+        sf.write(buf, samples, sample_rate, format="OGG", subtype="OPUS")
+    else:
+        sf.write(buf, samples, sample_rate, format="FLAC", subtype="PCM_16")
+    return buf.getvalue()
+
+
+def load_audio(path: Path) -> tuple[Any, int]:
+    """Decode a stored audio artifact to (float32 samples, sample_rate)."""
+    path = Path(path)
+    if path.suffix == ".wav":
+        with open(path, "rb") as f:
+            return _decode_wav(f)
+    if sf is None:
+        raise RuntimeError(f"soundfile is required to decode {path.name}")
+    samples, sample_rate = sf.read(str(path), dtype="float32")
+    return samples, sample_rate
+
+
+def _decode_wav(f: Any) -> tuple[Any, int]:
+    import numpy as np
+
+    with wave.open(f, "rb") as w:
+        sample_rate = w.getframerate()
+        width = w.getsampwidth()
+        channels = w.getnchannels()
+        frames = w.readframes(w.getnframes())
+    if width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648.0
+    elif width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width}")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples, sample_rate
@@ -0,0 +1,299 @@
+"""Streaming audio ingestion for WANDA Voice Core.
+
+Remote clients (satellites, the OVOS bridge) send raw 16 kHz PCM in small
+frames. Endpointer runs an energy VAD over the frames and cuts them into
+utterances; AudioStreamSession transcribes each utterance incrementally
+while it is being spoken, then runs the final transcript through the
+engine and reports events and the result back through a send callback.
+"""
+
+from __future__ import annotations
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+import numpy as np
+
+SPEECH_START = "speech_start"
+SPEECH_END = "speech_end"
+
+
+@dataclass
+class EndpointEvent:
+    kind: str  # SPEECH_START or SPEECH_END
+    reason: Optional[str] = None  # "silence", "max_length" or "flush"
+    audio: Optional[np.ndarray] = None  # the utterance, on SPEECH_END
+
+
+class Endpointer:
+    """Frame-level energy VAD with silence endpointing.
+
+    Speech starts after min_speech_ms of frames above threshold and ends
+    after silence_timeout_s below it (or at max_seconds). pre_roll_ms of
+    audio before the start is kept so the first syllable isn't clipped.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        threshold: float = 0.01,
+        min_speech_ms: int = 150,
+        silence_timeout_s: float = 1.2,
+        max_seconds: float = 60.0,
+        pre_roll_ms: int = 300,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_len = sample_rate * frame_ms // 1000
+        self.threshold = threshold
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.silence_frames = max(1, int(silence_timeout_s * 1000) // frame_ms)
+        self.max_frames = int(max_seconds * 1000) // frame_ms
+        self._pre_roll: deque[np.ndarray] = deque(maxlen=max(1, pre_roll_ms // frame_ms))
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._frames: list[np.ndarray] = []
+        self._voiced_run = 0
+        self._silent_run = 0
+        self.speaking = False
+
+    @property
+    def utterance_samples(self) -> int:
+        return len(self._frames) * self.frame_len
+
+    def utterance(self) -> np.ndarray:
+        """Audio of the utterance so far (copy)."""
+        if not self._frames:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(self._frames)
+
+    def push(self, samples: np.ndarray) -> list[EndpointEvent]:
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+        n_frames = len(samples) // self.frame_len
+        self._pending = samples[n_frames * self.frame_len:]
+        events: list[EndpointEvent] = []
+        for i in range(n_frames):
+            frame = samples[i * self.frame_len:(i + 1) * self.frame_len]
+            event = self._frame(frame)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> Optional[EndpointEvent]:
+        """End the current utterance now (client said it is done)."""
+        if not self.speaking:
+            self._reset()
+            return None
+        return self._end("flush")
+
+    def _frame(self, frame: np.ndarray) -> Optional[EndpointEvent]:
+        voiced = float(np.sqrt(np.mean(frame * frame))) >= self.threshold
+        if not self.speaking:
+            self._pre_roll.append(frame)
+            self._voiced_run = self._voiced_run + 1 if voiced else 0
+            if self._voiced_run < self.min_speech_frames:
+                return None
+            self.speaking = True
+            self._frames = list(self._pre_roll)
+            self._pre_roll.clear()
+            self._silent_run = 0
+            return EndpointEvent(SPEECH_START)
+
+        self._frames.append(frame)
+        self._silent_run = 0 if voiced else self._silent_run + 1
+        if self._silent_run >= self.silence_frames:
+            return self._end("silence")
+        if len(self._frames) >= self.max_frames:
+            return self._end("max_length")
+        return None
+
+    def _end(self, reason: str) -> EndpointEvent:
+        event = EndpointEvent(SPEECH_END, reason=reason, audio=self.utterance())
+        self._reset()
+        return event
+
+    def _reset(self) -> None:
+        self.speaking = False
+        self._frames = []
+        self._voiced_run = 0
+        self._silent_run = 0
+        self._pre_roll.clear()
+
+
+def pcm16_to_float(data: bytes) -> np.ndarray:
+    """Little-endian signed 16-bit PCM to float32 in [-1, 1)."""
+    return np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+
+
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class AudioStreamSession:
+    """One client's audio stream: endpointing, incremental STT, pipeline.
+
+    feed() takes raw PCM bytes as they arrive. While an utterance is being
+    spoken, the audio so far is re-transcribed in a worker thread every
+    partial_interval_s (at most one pass in flight) and sent as a partial
+    transcript. At the endpoint the whole utterance is transcribed once
+    more and processed by the engine in a background task (utterances in
+    order, one at a time), so feed() returns as soon as the frames are
+    endpointed; the run's events and the result are sent back on the same
+    channel.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        stt_engine: Any,
+        send: Send,
+        session_id: Optional[str] = None,
+        language: str = "de",
+        sample_rate: int = 16000,
+        partial_interval_s: float = 1.0,
+        endpointer: Optional[Endpointer] = None,
+    ):
+        self.engine = engine
+        self.stt_engine = stt_engine
+        self.send = send
+        self.session_id = session_id
+        self.language = language
+        self.sample_rate = sample_rate
+        self.endpointer = endpointer or Endpointer(sample_rate=sample_rate)
+        self.partial_samples = int(partial_interval_s * sample_rate)
+        self.utterances = 0
+        self._carry = b""
+        self._partial_at = 0
+        self._partial_task: Optional[asyncio.Task] = None
+        self._work: Optional[asyncio.Task] = None  # last queued utterance
+        self._generation = 0
+
+    async def feed(self, data: bytes) -> None:
+        if self._carry:
+            data = self._carry + data
+        usable = len(data) - len(data) % 2
+        self._carry = data[usable:]
+        for event in self.endpointer.push(pcm16_to_float(data[:usable])):
+            await self._handle(event)
+        self._maybe_partial()
+
+    async def finish(self) -> None:
+        """Process whatever utterance is still open and wait for results."""
+        event = self.endpointer.flush()
+        if event is not None:
+            await self._handle(event)
+        await self.drain()
+
+    async def drain(self) -> None:
+        """Wait until every queued utterance has been processed."""
+        if self._work is not None:
+            await asyncio.gather(self._work, return_exceptions=True)
+
+    async def close(self, cancel_pending: bool = True) -> None:
+        self._generation += 1
+        if self._partial_task is not None:
+            self._partial_task.cancel()
+        if cancel_pending and self._work is not None:
+            self._work.cancel()
+
+    async def _handle(self, event: EndpointEvent) -> None:
+        if event.kind == SPEECH_START:
+            self._partial_at = 0
+            await self.send({"type": "vad", "state": "speech"})
+            return
+        self._generation += 1  # late partials of this utterance are stale
+        await self.send({"type": "vad", "state": "silence", "reason": event.reason})
+        self._work = asyncio.create_task(self._queued(self._work, event.audio))
+
+    async def _queued(
+        self, previous: Optional[asyncio.Task], audio: np.ndarray
+    ) -> None:
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        try:
+            await self._process(audio)
+        except Exception as e:
+            print(f"[AudioStream] Utterance failed: {e}")
+
+    def _maybe_partial(self) -> None:
+        ep = self.endpointer
+        if not ep.speaking or self.partial_samples <= 0:
+            return
+        if ep.utterance_samples - self._partial_at < self.partial_samples:
+            return
+        if self._partial_task is not None and not self._partial_task.done():
+            return
+        self._partial_at = ep.utterance_samples
+        self._partial_task = asyncio.create_task(
+            self._partial(ep.utterance(), self._generation)
+        )
+
+    async def _partial(self, audio: np.ndarray, generation: int) -> None:
+        try:
+            text = await asyncio.to_thread(self._transcribe, audio)
+        except Exception as e:
+            print(f"[AudioStream] Partial STT failed: {e}")
+            return
+        if generation == self._generation and text:
+            await self.send({"type": "transcript", "text": text, "final": False})
+
+    def _transcribe(self, audio: np.ndarray) -> str:
+        text = self.stt_engine.transcribe(audio, language=self.language)
+        return (text or "").strip()
+
+    async def _process(self, audio: np.ndarray) -> None:
+        self.utterances += 1
+        try:
+            text = await asyncio.to_thread(self._transcribe, audio)
+        except Exception as e:
+            await self.send({"type": "result", "error": f"STT error: {e}"})
+            return
+        await self.send({"type": "transcript", "text": text, "final": True})
+        if not text:
+            await self.send({"type": "result", "error": "No speech detected"})
+            return
+
+        bus = self.engine.event_bus
+        run_id = self.engine.run_manager.new_run_id()
+        queue: asyncio.Queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        def on_event(event: Any) -> None:
+            if event.run_id == run_id:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        async def forward() -> None:
+            while (event := await queue.get()) is not None:
+                await self.send({"type": "event", "event": event.to_dict()})
+
+        bus.subscribe("*", on_event)
+        forwarder = asyncio.create_task(forward())
+        try:
+            result = await self.engine.process_text(
+                text,
+                skip_confirmation=True,
+                audio=audio,
+                session_id=self.session_id,
+                run_id=run_id,
+            )
+        except Exception as e:
+            result = None
+            error = str(e)
+        finally:
+            bus.unsubscribe("*", on_event)
+            # After any events already scheduled from other threads
+            loop.call_soon(queue.put_nowait, None)
+            await forwarder
+
+        if result is None:
+            await self.send({"type": "result", "run_id": run_id, "error": error})
+            return
+        await self.send({
+            "type": "result",
+            "run_id": result.run_id,
+            "transcript": text,
+            "final_text": result.improved_text or result.transcript,
+            "response_text": result.response_text,
+            "session_id": self.session_id,
+            "error": result.error,
+        })
@@ -0,0 +1,204 @@
+"""Server-sent event broadcaster for WANDA Voice Core.
+
+One EventBus subscription feeds a fixed-size ring of serialized SSE frames
+shared by every client. Each event is encoded once, however many
+dashboards are connected; a client is just a cursor into the ring. Slow
+clients cannot grow memory: when the ring laps them they skip ahead and
+are told how many events they missed. Event ids are sequence numbers, so
+a reconnecting client resumes from its Last-Event-ID.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from wanda_voice_core.schemas import RunEvent
+
+
+class EventFilter:
+    """Server-side filter on event type and run_id.
+
+    Types match exactly, or by prefix when written as "provider.*".
+    """
+
+    __slots__ = ("exact", "prefixes", "run_id")
+
+    def __init__(
+        self, types: Optional[Iterable[str]] = None, run_id: Optional[str] = None
+    ):
+        types = [t for t in (types or ()) if t and t != "*"]
+        self.exact = {t for t in types if not t.endswith(".*")}
+        self.prefixes = tuple(t[:-1] for t in types if t.endswith(".*"))
+        self.run_id = run_id
+
+    def matches(self, event_type: str, run_id: Optional[str]) -> bool:
+        if self.run_id is not None and run_id != self.run_id:
+            return False
+        if not self.exact and not self.prefixes:
+            return True
+        return event_type in self.exact or event_type.startswith(self.prefixes)
+
+
+class EventBroadcaster:
+    """Fan EventBus events out to SSE clients from a shared ring buffer."""
+
+    def __init__(self, event_bus: Any, capacity: int = 1024, keepalive_s: float = 15.0):
+        self.event_bus = event_bus
+        self.capacity = capacity
+        self.keepalive_s = keepalive_s
+        self.published = 0
+        self.clients = 0
+        # slot = seq % capacity holds (seq, event_type, run_id, frame)
+        self._ring: list[Optional[tuple[int, str, Optional[str], bytes]]] = [
+            None
+        ] * capacity
+        self._seq = 0
+        self._wakeup: Optional[asyncio.Future] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+
+    # --- Lifecycle ---
+
+    def attach(self) -> None:
+        """Subscribe to the bus; must be called from the serving loop."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self.event_bus.subscribe("*", self._on_event)
+
+    def detach(self) -> None:
+        if self._loop is None:
+            return
+        self.event_bus.unsubscribe("*", self._on_event)
+        self._loop = None
+        self._wake()
+
+    @property
+    def last_id(self) -> int:
+        return self._seq
+
+    # --- Publishing ---
+
+    def _on_event(self, event: RunEvent) -> None:
+        # Runs on whichever thread emitted; only the loop thread may publish
+        loop = self._loop
+        if loop is None:
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._publish(event)
+            return
+        try:
+            loop.call_soon_threadsafe(self._publish, event)
+        except RuntimeError:
+            pass  # loop already closed
+
+    def _publish(self, event: RunEvent) -> None:
+        self._seq += 1
+        seq = self._seq
+        data = json.dumps(event.to_dict(), ensure_ascii=False)
+        frame = f"id: {seq}\nevent: {event.event_type}\ndata: {data}\n\n".encode()
+        self._ring[seq % self.capacity] = (seq, event.event_type, event.run_id, frame)
+        self.published += 1
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+        self._wakeup = None
+
+    def _wait(self) -> asyncio.Future:
+        if self._wakeup is None:
+            self._wakeup = asyncio.get_running_loop().create_future()
+        return self._wakeup
+
+    # --- Reading ---
+
+    def read(
+        self, cursor: int, flt: EventFilter, limit: int = 256
+    ) -> tuple[int, list[bytes], int]:
+        """Frames after cursor that pass flt.
+
+        Returns (new cursor, frames, missed) where missed counts events
+        that were overwritten before this reader got to them.
+        """
+        oldest = max(1, self._seq - self.capacity + 1)
+        missed = 0
+        if cursor + 1 < oldest:
+            missed = oldest - cursor - 1
+            cursor = oldest - 1
+        frames: list[bytes] = []
+        end = min(self._seq, cursor + limit)
+        for seq in range(cursor + 1, end + 1):
+            entry = self._ring[seq % self.capacity]
+            if entry is not None and entry[0] == seq and flt.matches(entry[1], entry[2]):
+                frames.append(entry[3])
+        return end, frames, missed
+
+    async def stream(
+        self, flt: EventFilter, last_event_id: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield SSE frames for one client until the broadcaster detaches.
+
+        Without last_event_id the client starts at the live edge; with it,
+        retained events after that id are replayed first.
+        """
+        cursor = self._seq if last_event_id is None else max(0, last_event_id)
+        if cursor > self._seq:
+            cursor = self._seq  # id from before a restart
+        self.clients += 1
+        try:
+            while self._loop is not None:
+                cursor, frames, missed = self.read(cursor, flt)
+                if missed:
+                    yield _frame("dropped", {"missed": missed, "resume_id": cursor})
+                for frame in frames:
+                    yield frame
+                if cursor < self._seq:
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(self._wait()), timeout=self.keepalive_s
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+        finally:
+            self.clients -= 1
+
+    async def follow(
+        self, flt: EventFilter, until: asyncio.Future, cursor: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield frames after cursor that pass flt until `until` is done.
+
+        Frames published before `until` completed are still delivered.
+        Used to stream one run's events to the client that started it.
+        """
+        cursor = self._seq if cursor is None else cursor
+        while True:
+            finished = until.done()
+            cursor, frames, missed = self.read(cursor, flt)
+            if missed:
+                yield _frame("dropped", {"missed": missed, "resume_id": cursor})
+            for frame in frames:
+                yield frame
+            if cursor < self._seq:
+                continue
+            if finished or self._loop is None:
+                return
+            await asyncio.wait(
+                {until, self._wait()}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "clients": self.clients,
+            "published": self.published,
+            "last_id": self._seq,
+            "capacity": self.capacity,
+        }
+
+
+def _frame(event: str, data: dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
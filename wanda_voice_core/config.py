@@ -1,8 +1,18 @@
-"""Extended configuration for WANDA Voice Core."""
+"""Extended configuration for WANDA Voice Core.
+
+Configuration is compiled into an immutable ConfigSnapshot whose dotted
+keys are precomputed, so get() is one dict lookup. Reloading (from the
+file watcher or update()) builds a new snapshot, swaps it in atomically
+and notifies subscribers of the keys that changed.
+"""
 
 from __future__ import annotations
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Optional, Union
 
 import yaml
 
@@ -34,6 +44,8 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "silence_timeout": 1.2,
         "silence_threshold": 0.01,
         "min_seconds": 1.0,
+        # Re-transcribe streamed audio this often while the user speaks
+        "partial_interval_s": 1.0,
     },
     "vad": {
         "engine": "silero",
@@ -60,10 +72,34 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "gemini_timeout": 90,
         "gemini_max_retries": 2,
         "gemini_fallback_model": "pro",
+        "gemini_hedge": True,
+        "gemini_hedge_percentile": 0.9,
+        "gemini_hedge_initial_delay": 20.0,
+        "gemini_hedge_min_delay": 3.0,
+        "gemini_hedge_min_samples": 5,
+        "gemini_pool_size": 1,
+        "gemini_pool_max_idle_s": 600,
         "ollama_model": "qwen3:8b",
+        "ollama_keep_alive": "30m",
         "ollama_enabled": False,
         "ollama_as_fallback": False,
     },
+    "health": {
+        "interval_s": 15.0,
+        "probe_timeout_s": 5.0,
+        "failure_threshold": 3,
+        "reset_timeout_s": 30.0,
+    },
+    "events": {
+        "max_history": 100,
+        "max_runs": 256,
+        "max_events_per_run": 500,
+        "max_run_bytes": 8388608,
+        # Keep every n-th event of high-frequency types
+        "sample_every": {"vad.speech": 10, "vad.silence": 10},
+        # Types kept out of history/run index (only delivered to subscribers)
+        "no_history": ["vad.speech", "vad.silence", "response.delta"],
+    },
     "tts": {
         "engine": "edge",
         "voice": "katja",
@@ -100,11 +136,61 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "enabled": False,
         "port": 8370,
         "host": "127.0.0.1",
+        # Largest array accepted by POST /v1/utterances
+        "max_batch": 1000,
+        # Events kept for /v1/stream clients to catch up or resume
+        "stream_buffer": 1024,
+        "stream_keepalive_s": 15,
+        # GET /v1/audio; the STT model loads on the first connection
+        "audio_enabled": True,
+    },
+    "runs": {
+        # Background artifact writer: none | flush | fsync
+        "durability": "flush",
+        "flush_bytes": 65536,
+        "flush_interval_s": 1.0,
+        # SQLite index of finished runs (runs_dir/catalog.sqlite3)
+        "catalog": True,
+        # Keep input audio per run for replay: flac | opus | wav
+        "keep_audio": True,
+        "audio_codec": "flac",
+        "audio_max_bytes": 4194304,
+    },
+    "tracing": {
+        # Write a Chrome trace (trace.json) into each run directory
+        "enabled": False,
+        # Only keep traces of runs at least this slow
+        "min_duration_ms": 0,
+    },
+    "concurrency": {
+        # Runs processed at once; more wait in the admission queue
+        "max_runs": 4,
+        # Waiting runs beyond this are rejected (HTTP 429)
+        "max_queue": 16,
+        # Concurrent requests per provider
+        "provider_limits": {"gemini_cli": 2, "ollama": 1},
+        "provider_default_limit": 2,
     },
     "history": {
         "max_turns": 12,
         "persist": False,
     },
+    "sessions": {
+        # Conversations kept in memory (least recently used go first)
+        "max_sessions": 256,
+        # Drop a session after this long without a request
+        "idle_ttl_s": 1800,
+        # Approximate memory cap across all sessions
+        "max_bytes": 16777216,
+        # Prefer the provider that last answered a session for this long
+        "affinity_ttl_s": 300,
+    },
+    "live_reload": {
+        # Watch the config file and apply changes without a restart
+        "enabled": True,
+        # Wait this long after a change for the editor to finish writing
+        "debounce_s": 0.2,
+    },
 }
 
 
@@ -119,7 +205,209 @@ def _deep_merge(base: dict, override: dict) -> dict:
     return result
 
 
-class VoiceCoreConfig:
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _flatten(data: Mapping, prefix: str, out: dict[str, Any]) -> dict[str, Any]:
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        out[path] = value
+        if isinstance(value, Mapping):
+            _flatten(value, f"{path}.", out)
+    return out
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable, pre-flattened view of one merged configuration.
+
+    flat maps every dotted path ("audio", "audio.silence_timeout", ...)
+    to its value; nested values are read-only mappings and tuples.
+    """
+
+    data: Mapping[str, Any]
+    flat: Mapping[str, Any]
+    version: int = 0
+
+    @classmethod
+    def build(cls, data: Mapping[str, Any], version: int = 0) -> ConfigSnapshot:
+        frozen = _freeze(data)
+        return cls(frozen, MappingProxyType(_flatten(frozen, "", {})), version)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.flat.get(key)
+        return value if value is not None else default
+
+    def leaves(self) -> dict[str, Any]:
+        return {k: v for k, v in self.flat.items() if not isinstance(v, Mapping)}
+
+    def changed_keys(self, other: ConfigSnapshot) -> set[str]:
+        """Leaf keys whose value differs (or that exist in only one)."""
+        mine, theirs = self.leaves(), other.leaves()
+        return {
+            key
+            for key in mine.keys() | theirs.keys()
+            if mine.get(key, _MISSING) != theirs.get(key, _MISSING)
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return _thaw(self.data)
+
+
+_MISSING = object()
+
+ConfigListener = Callable[[ConfigSnapshot, "set[str]"], None]
+
+
+def _key_matches(patterns: tuple[str, ...], key: str) -> bool:
+    return any(
+        p == "*" or key == p or key.startswith(f"{p}.") for p in patterns
+    )
+
+
+class LiveConfig:
+    """Config backed by a swappable snapshot, with change notification.
+
+    Subclasses implement _merge(raw) to apply their defaults to the raw
+    file contents.
+    """
+
+    def __init__(self, config_path: Optional[Path], raw: dict[str, Any]):
+        self.config_path = Path(config_path) if config_path else None
+        self._raw = raw
+        self._overrides: dict[str, Any] = {}
+        self._listeners: list[tuple[tuple[str, ...], ConfigListener]] = []
+        self._lock = threading.Lock()
+        self._watcher = None
+        self.snapshot = ConfigSnapshot.build(self._merge(raw))
+
+    def _merge(self, raw: dict[str, Any]) -> dict[str, Any]:
+        return raw
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any]:
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+        if not isinstance(data, dict):
+            raise ValueError("top level must be a mapping")
+        return data
+
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """The current merged configuration (read-only)."""
+        return self.snapshot.data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dot-notation access: config.get('providers.gemini_model')."""
+        return self.snapshot.get(key, default)
+
+    # --- Change notification ---
+
+    def subscribe(
+        self, keys: Union[str, Iterable[str]], callback: ConfigListener
+    ) -> None:
+        """Call callback(snapshot, changed_keys) when a matching key changes.
+
+        keys are exact dotted keys or prefixes ("audio" matches
+        "audio.silence_timeout"); "*" matches everything. Callbacks run on
+        the thread that triggered the reload.
+        """
+        patterns = (keys,) if isinstance(keys, str) else tuple(keys)
+        with self._lock:
+            self._listeners.append((patterns, callback))
+
+    def unsubscribe(self, callback: ConfigListener) -> None:
+        with self._lock:
+            self._listeners = [
+                entry for entry in self._listeners if entry[1] != callback
+            ]
+
+    # --- Reload ---
+
+    def reload(self) -> set[str]:
+        """Re-read the config file and swap in a new snapshot.
+
+        A missing or unparsable file keeps the current snapshot (editors
+        may leave a half-written file behind briefly).
+        """
+        if self.config_path is None:
+            return set()
+        try:
+            raw = self._read(self.config_path)
+        except Exception as e:
+            print(f"[Config] Reload of {self.config_path} failed, keeping current: {e}")
+            return set()
+        return self._swap(raw)
+
+    def update(self, overrides: dict[str, Any]) -> set[str]:
+        """Apply runtime overrides on top of the file and notify."""
+        with self._lock:
+            self._overrides = _deep_merge(self._overrides, overrides)
+        return self._swap(self._raw)
+
+    def _swap(self, raw: dict[str, Any]) -> set[str]:
+        with self._lock:
+            old = self.snapshot
+            new = ConfigSnapshot.build(
+                _deep_merge(self._merge(raw), self._overrides), old.version + 1
+            )
+            changed = old.changed_keys(new)
+            self._raw = raw
+            if not changed:
+                return changed
+            self.snapshot = new
+            listeners = [
+                callback
+                for patterns, callback in self._listeners
+                if any(_key_matches(patterns, key) for key in changed)
+            ]
+        print(f"[Config] Applied v{new.version}: {', '.join(sorted(changed))}")
+        for callback in listeners:
+            try:
+                callback(new, changed)
+            except Exception as e:
+                print(f"[Config] Listener error: {e}")
+        return changed
+
+    # --- File watching ---
+
+    def watch(self, debounce_s: Optional[float] = None) -> bool:
+        """Reload automatically when the config file changes."""
+        if self.config_path is None or self._watcher is not None:
+            return False
+        from wanda_voice_core.config_watch import ConfigWatcher
+
+        if debounce_s is None:
+            debounce_s = self.get("live_reload.debounce_s", 0.2)
+        self._watcher = ConfigWatcher(
+            self.config_path, self.reload, debounce_s=debounce_s
+        )
+        self._watcher.start()
+        return True
+
+    def stop_watching(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.snapshot.to_dict()
+
+
+class VoiceCoreConfig(LiveConfig):
     """Configuration loader for WANDA Voice Core."""
 
     def __init__(self, config_path: Optional[Path] = None, profile: Optional[str] = None):
@@ -135,66 +423,50 @@ class VoiceCoreConfig:
                     config_path = c
                     break
 
-        self._raw = self._load(config_path)
+        self.profile = profile
+        super().__init__(config_path, self._load(config_path))
 
+    def _merge(self, raw: dict[str, Any]) -> dict[str, Any]:
         # Apply profile defaults first, then user config on top
-        active_profile = profile or self._raw.get("profile", "gui")
+        active_profile = self.profile or raw.get("profile", "gui")
         profile_defaults = PROFILES.get(active_profile, {})
-        self.config = _deep_merge(
-            _deep_merge(DEFAULT_CONFIG, profile_defaults),
-            self._raw,
-        )
+        return _deep_merge(_deep_merge(DEFAULT_CONFIG, profile_defaults), raw)
 
     def _load(self, path: Optional[Path]) -> dict[str, Any]:
         if path is None or not path.exists():
             return {}
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
+            data = self._read(path)
             print(f"[Config] Loaded from {path}")
             return data
         except Exception as e:
             print(f"[Config] Error loading {path}: {e}")
             return {}
 
-    def get(self, key: str, default: Any = None) -> Any:
-        """Dot-notation access: config.get('providers.gemini_model')."""
-        keys = key.split(".")
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-        return value if value is not None else default
-
     @property
-    def audio(self) -> dict[str, Any]:
+    def audio(self) -> Mapping[str, Any]:
         return self.config.get("audio", {})
 
     @property
-    def stt(self) -> dict[str, Any]:
+    def stt(self) -> Mapping[str, Any]:
         return self.config.get("stt", {})
 
     @property
-    def tts(self) -> dict[str, Any]:
+    def tts(self) -> Mapping[str, Any]:
         return self.config.get("tts", {})
 
     @property
-    def providers(self) -> dict[str, Any]:
+    def providers(self) -> Mapping[str, Any]:
         return self.config.get("providers", {})
 
     @property
-    def safety(self) -> dict[str, Any]:
+    def safety(self) -> Mapping[str, Any]:
         return self.config.get("safety", {})
 
     @property
-    def api(self) -> dict[str, Any]:
+    def api(self) -> Mapping[str, Any]:
         return self.config.get("api", {})
 
     @property
-    def confirmation(self) -> dict[str, Any]:
+    def confirmation(self) -> Mapping[str, Any]:
         return self.config.get("confirmation", {})
-
-    def to_dict(self) -> dict[str, Any]:
-        return dict(self.config)
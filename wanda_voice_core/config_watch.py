@@ -0,0 +1,146 @@
+"""Config file watcher for live reload.
+
+On Linux the watcher uses inotify (through ctypes, no extra dependency)
+on the file's directory, so editors that save by writing a temp file and
+renaming it over the original are caught as well. Elsewhere it polls the
+file's mtime and size.
+"""
+
+from __future__ import annotations
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+_EVENT = struct.Struct("iIII")
+
+
+def _inotify_libc() -> Optional[ctypes.CDLL]:
+    if not hasattr(os, "O_NONBLOCK"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1  # noqa: B018 - probe for the symbol
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class ConfigWatcher:
+    """Calls on_change (debounced) when the watched file is rewritten."""
+
+    def __init__(
+        self,
+        path: Path,
+        on_change: Callable[[], object],
+        debounce_s: float = 0.2,
+        poll_interval_s: float = 1.0,
+    ):
+        self.path = Path(path).resolve()
+        self.on_change = on_change
+        self.debounce_s = debounce_s
+        self.poll_interval_s = poll_interval_s
+        self.backend: Optional[str] = None
+        self.changes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._fd = self._open_inotify()
+        self.backend = "inotify" if self._fd is not None else "poll"
+        target = self._run_inotify if self._fd is not None else self._run_poll
+        self._thread = threading.Thread(
+            target=target, name="config-watch", daemon=True
+        )
+        self._thread.start()
+        print(f"[Config] Watching {self.path} ({self.backend})")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _open_inotify(self) -> Optional[int]:
+        libc = _inotify_libc()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(fd, str(self.path.parent).encode(), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _touched(self, buf: bytes) -> bool:
+        """True if any event in buf concerns the watched file."""
+        name = self.path.name.encode()
+        offset = 0
+        while offset + _EVENT.size <= len(buf):
+            _, mask, _, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            event_name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW or event_name == name:
+                return True
+        return False
+
+    def _drain(self, timeout: float) -> bytes:
+        data = b""
+        while select.select([self._fd], [], [], timeout)[0]:
+            try:
+                data += os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            timeout = 0
+        return data
+
+    def _run_inotify(self) -> None:
+        while not self._stop.is_set():
+            if not self._touched(self._drain(0.5)):
+                continue
+            # Editors often write in several steps; wait until they're done
+            while self._drain(self.debounce_s):
+                pass
+            self._fire()
+
+    def _stat(self) -> Optional[tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _run_poll(self) -> None:
+        last = self._stat()
+        while not self._stop.wait(self.poll_interval_s):
+            current = self._stat()
+            if current is not None and current != last:
+                last = current
+                self._fire()
+
+    def _fire(self) -> None:
+        if self._stop.is_set():
+            return
+        self.changes += 1
+        try:
+            self.on_change()
+        except Exception as e:
+            print(f"[Config] Reload failed: {e}")
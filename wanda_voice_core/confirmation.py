@@ -7,6 +7,8 @@ from typing import Any, Callable, Optional
 
 from wanda_voice_core.schemas import ConfirmationState, RefinerResult
 from wanda_voice_core.event_bus import EventBus
+from wanda_voice_core.matcher import CommandMatcher
+from wanda_voice_core.tracing import span
 
 
 # Confirmation command detection
@@ -53,40 +55,21 @@ CONFIRM_COMMANDS = {
 }
 
 
+_CONFIRM_MATCHER = CommandMatcher(CONFIRM_COMMANDS)
+
+
 def detect_confirmation_command(text: str) -> Optional[ConfirmationState]:
     """Detect a confirmation command from text."""
-    import difflib
-
     if not text:
         return None
 
-    normalized = text.lower().strip()
-
-    for state, keywords in CONFIRM_COMMANDS.items():
-        for kw in keywords:
-            if normalized == kw:
-                return state
-
-            if (
-                normalized.startswith(kw + " ")
-                or normalized.endswith(" " + kw)
-                or f" {kw} " in normalized
-            ):
-                return state
-
-            if len(kw) > 3:
-                ratio = difflib.SequenceMatcher(None, normalized, kw).ratio()
-                if ratio > 0.8:
-                    return state
-
-                words = normalized.split()
-                for word in words:
-                    if len(word) > 3:
-                        word_ratio = difflib.SequenceMatcher(None, word, kw).ratio()
-                        if word_ratio > 0.85:
-                            return state
-
-    return None
+    match = _CONFIRM_MATCHER.find(
+        text,
+        ("exact", "contains", "fuzzy", "fuzzy_word"),
+        min_score=0.8,
+        word_min_score=0.85,
+    )
+    return match.label if match else None
 
 
 class ConfirmationFlow:
@@ -217,38 +200,44 @@ class ConfirmationFlow:
 
     async def _speak(self, text: str) -> None:
         """Speak text (handles both sync and async tts)."""
-        result = self.tts_speak(text)
-        if asyncio.iscoroutine(result):
-            await result
+        with span("confirmation.speak", cat="tts", chars=len(text)):
+            result = self.tts_speak(text)
+            if asyncio.iscoroutine(result):
+                await result
 
     async def _wait_for_response(
         self, timeout: float
     ) -> tuple[Optional[str], Optional[ConfirmationState]]:
         """Wait for either STT response or UI override."""
+        # to_thread copies the context, so spans in stt_listen join the trace
         listen_task = asyncio.create_task(asyncio.to_thread(self.stt_listen))
         start = asyncio.get_running_loop().time()
-        try:
-            while True:
-                if listen_task.done():
-                    result = listen_task.result()
-                    return result, None
-
-                try:
-                    override = self._override_queue.get_nowait()
-                    return None, override
-                except queue.Empty:
-                    pass
-
-                if asyncio.get_running_loop().time() - start >= timeout:
-                    return None, None
-
-                await asyncio.sleep(0.1)
-        except Exception as e:
-            print(f"[Confirmation] Listen error: {e}")
-            return None, None
-        finally:
-            if not listen_task.done():
-                listen_task.cancel()
+        with span("confirmation.listen", cat="stt", timeout_s=timeout) as sp:
+            try:
+                while True:
+                    if listen_task.done():
+                        result = listen_task.result()
+                        sp.set(heard=bool(result))
+                        return result, None
+
+                    try:
+                        override = self._override_queue.get_nowait()
+                        sp.set(override=override.value)
+                        return None, override
+                    except queue.Empty:
+                        pass
+
+                    if asyncio.get_running_loop().time() - start >= timeout:
+                        sp.set(timeout=True)
+                        return None, None
+
+                    await asyncio.sleep(0.1)
+            except Exception as e:
+                print(f"[Confirmation] Listen error: {e}")
+                return None, None
+            finally:
+                if not listen_task.done():
+                    listen_task.cancel()
 
     def reset(self) -> None:
         self.state = ConfirmationState.IDLE
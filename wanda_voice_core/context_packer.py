@@ -0,0 +1,104 @@
+"""Priority-aware context packing for provider prompts."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import IntEnum
+
+from wanda_voice_core.token_economy import (
+    count_tokens,
+    truncate_to_tokens,
+    MAX_CONTEXT_TOKENS,
+)
+
+
+class Priority(IntEnum):
+    """Lower value = packed first."""
+
+    PROMPT = 0
+    SYSTEM = 1
+    RECENT = 2
+    SUMMARY = 3
+    OLDER = 4
+
+
+@dataclass(frozen=True)
+class Segment:
+    """One piece of prompt context.
+
+    Segments with the same group are joined with newlines, groups with a
+    blank line, in the order the segments were given.
+    """
+
+    text: str
+    priority: Priority
+    group: str = ""
+
+    @property
+    def tokens(self) -> int:
+        return count_tokens(self.text)
+
+
+class ContextPacker:
+    """Greedily fills a token budget by priority, never dropping the prompt.
+
+    Segments are kept as separate strings (history entries are reused turn
+    after turn, so their token counts come from the count_tokens cache);
+    the final prompt is joined once after selection. A summary that does
+    not fit is cut to the remaining budget, keeping its most recent end.
+    """
+
+    def __init__(self, max_tokens: int = MAX_CONTEXT_TOKENS, separator_tokens: int = 1):
+        self.max_tokens = max_tokens
+        self.separator_tokens = separator_tokens
+
+    def pack(self, segments: list[Segment]) -> list[Segment]:
+        """Return the selected segments in their original order."""
+        # Within a priority, later segments (more recent turns) win
+        order = sorted(
+            range(len(segments)), key=lambda i: (segments[i].priority, -i)
+        )
+        remaining = self.max_tokens
+        chosen: dict[int, Segment] = {}
+        history_full = False
+        for i in order:
+            seg = segments[i]
+            is_turn = seg.priority in (Priority.RECENT, Priority.OLDER)
+            if is_turn and history_full:
+                continue
+            cost = seg.tokens + self.separator_tokens
+            if cost <= remaining:
+                chosen[i] = seg
+                remaining -= cost
+            elif seg.priority == Priority.PROMPT:
+                # The question itself is never dropped, only shortened
+                budget = max(1, remaining - self.separator_tokens)
+                chosen[i] = Segment(
+                    truncate_to_tokens(seg.text, budget), seg.priority, seg.group
+                )
+                remaining = 0
+            elif seg.priority == Priority.SUMMARY and remaining > self.separator_tokens:
+                budget = remaining - self.separator_tokens
+                chosen[i] = Segment(
+                    truncate_to_tokens(seg.text, budget, keep_end=True),
+                    seg.priority,
+                    seg.group,
+                )
+                remaining = 0
+            elif is_turn:
+                # Keep the conversation contiguous: no older turns past a gap
+                history_full = True
+        return [chosen[i] for i in sorted(chosen)]
+
+    def render(self, segments: list[Segment]) -> str:
+        parts: list[str] = []
+        current_group = None
+        for seg in segments:
+            if parts and seg.group == current_group:
+                parts[-1] = f"{parts[-1]}\n{seg.text}"
+            else:
+                parts.append(seg.text)
+                current_group = seg.group
+        return "\n\n".join(parts)
+
+    def pack_text(self, segments: list[Segment]) -> str:
+        return self.render(self.pack(segments))
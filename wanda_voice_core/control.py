@@ -0,0 +1,251 @@
+"""Local control socket for a running WANDA assistant.
+
+The assistant serves a Unix domain socket; CLI invocations connect to it
+instead of constructing their own assistant, so `--send-text` and friends
+take milliseconds rather than a model load. Messages are JSON objects
+framed by a 4-byte big-endian length:
+
+    request:  {"cmd": "send_text", "args": {"text": "..."}}
+    response: {"ok": true, "result": {...}}  or  {"ok": false, "error": "..."}
+
+This module only imports the standard library so the client stays cheap.
+"""
+
+from __future__ import annotations
+import asyncio
+import inspect
+import json
+import os
+import socket
+import struct
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Union
+
+_HEADER = struct.Struct(">I")
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+Handler = Callable[[dict[str, Any]], Union[Any, Awaitable[Any]]]
+
+
+class ControlError(Exception):
+    """The daemon is unreachable or answered with an error."""
+
+
+def default_socket_path() -> Path:
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return Path(runtime) / "wanda-voice.sock"
+    return Path(f"/tmp/wanda-voice-{os.getuid()}.sock")
+
+
+def encode_message(obj: Any) -> bytes:
+    data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    if len(data) > MAX_MESSAGE_BYTES:
+        raise ValueError(f"message too large ({len(data)} bytes)")
+    return _HEADER.pack(len(data)) + data
+
+
+def _decode_length(header: bytes) -> int:
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_MESSAGE_BYTES:
+        raise ControlError(f"message too large ({length} bytes)")
+    return length
+
+
+async def read_message(reader: asyncio.StreamReader) -> Any:
+    length = _decode_length(await reader.readexactly(_HEADER.size))
+    return json.loads(await reader.readexactly(length))
+
+
+# --- Server ---
+
+
+class ControlServer:
+    """Serves registered command handlers on a Unix socket.
+
+    Handlers take the request's args dict and may be plain functions
+    (run in a worker thread, so blocking work like STT is fine) or
+    coroutine functions (run on the server's loop).
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None):
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.handlers: dict[str, Handler] = {"ping": lambda args: "pong"}
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def register(self, cmd: str, handler: Handler) -> None:
+        self.handlers[cmd] = handler
+
+    async def start(self) -> None:
+        self._remove_stale_socket()
+        old_umask = os.umask(0o177)  # socket is owner-only (0600)
+        try:
+            self._server = await asyncio.start_unix_server(
+                self._serve, path=str(self.socket_path)
+            )
+        finally:
+            os.umask(old_umask)
+        print(f"[Control] Listening on {self.socket_path}")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()  # left behind by a crashed daemon
+        else:
+            raise ControlError(f"Another instance is serving {self.socket_path}")
+        finally:
+            probe.close()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    request = await read_message(reader)
+                except asyncio.IncompleteReadError:
+                    break
+                response = await self._dispatch(request)
+                writer.write(encode_message(response))
+                await writer.drain()
+        except (ConnectionError, ControlError, json.JSONDecodeError) as e:
+            print(f"[Control] Connection dropped: {e}")
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Any) -> dict[str, Any]:
+        self.requests += 1
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+        cmd = request.get("cmd")
+        handler = self.handlers.get(cmd)
+        if handler is None:
+            return {"ok": False, "error": f"unknown command: {cmd}"}
+        args = request.get("args") or {}
+        try:
+            if inspect.iscoroutinefunction(handler):
+                result = await handler(args)
+            else:
+                result = await asyncio.to_thread(handler, args)
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "result": result}
+
+
+# --- Client ---
+
+
+class ControlClient:
+    """Blocking client for one-shot CLI calls (no asyncio startup cost)."""
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: float = 180.0):
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.timeout = timeout
+
+    def available(self) -> bool:
+        try:
+            self.call("ping", timeout=2.0)
+            return True
+        except ControlError:
+            return False
+
+    def call(self, cmd: str, timeout: Optional[float] = None, **args: Any) -> Any:
+        """Send one command and return its result; raises ControlError."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout if timeout is None else timeout)
+        try:
+            sock.connect(str(self.socket_path))
+            sock.sendall(encode_message({"cmd": cmd, "args": args}))
+            length = _decode_length(_recv_exactly(sock, _HEADER.size))
+            response = json.loads(_recv_exactly(sock, length))
+        except (OSError, ValueError) as e:
+            raise ControlError(f"{self.socket_path}: {e}") from e
+        finally:
+            sock.close()
+        if not response.get("ok"):
+            raise ControlError(response.get("error", "unknown error"))
+        return response.get("result")
+
+
+def _recv_exactly(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("connection closed by daemon")
+        buf += chunk
+    return bytes(buf)
+
+
+# --- CLI forwarding ---
+
+
+def forward_cli(argv: list[str]) -> Optional[int]:
+    """Run a client-side CLI command against the running assistant.
+
+    Returns an exit code, or None when the command should be handled
+    in-process (no client flag given, or --send-text/--stt-file with no
+    daemon running and without --client).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--send-text")
+    parser.add_argument("--stt-file")
+    parser.add_argument("--status", action="store_true")
+    parser.add_argument("--refiner", choices=("on", "off"))
+    parser.add_argument("--session")
+    parser.add_argument("--socket", type=Path)
+    parser.add_argument("--client", action="store_true")
+    parser.add_argument("--local", action="store_true")
+    args, _ = parser.parse_known_args(argv)
+
+    if args.local:
+        return None
+    client_only = args.status or args.refiner is not None
+    if not (client_only or args.send_text or args.stt_file):
+        return None
+
+    client = ControlClient(args.socket)
+    if not client.available():
+        if client_only or args.client:
+            print(f"[Wanda] Not running (no control socket at {client.socket_path})")
+            return 1
+        return None
+
+    try:
+        if args.refiner is not None:
+            result = client.call("refiner", enabled=args.refiner == "on")
+            print(f"[Wanda] Refiner {'on' if result['refiner_enabled'] else 'off'}")
+        if args.stt_file:
+            path = str(Path(args.stt_file).resolve())
+            print(f"[STT] Result: {client.call('stt_file', path=path)['text']}")
+        if args.send_text:
+            result = client.call(
+                "send_text", text=args.send_text, session_id=args.session
+            )
+            if result.get("error"):
+                print(f"[Wanda] Engine error: {result['error']}")
+                return 1
+            print(f"\n{'=' * 70}\n[WANDA]\n{result['response_text']}\n{'=' * 70}")
+        if args.status:
+            print(json.dumps(client.call("status"), indent=2, ensure_ascii=False))
+    except ControlError as e:
+        print(f"[Wanda] {e}")
+        return 1
+    return 0
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import subprocess
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Callable, Optional
 
@@ -16,20 +17,43 @@ from wanda_voice_core.schemas import (
     RunEvent,
     TokenMetrics,
 )
+from wanda_voice_core.admission import AdmissionController, KeyedLimiter
 from wanda_voice_core.config import VoiceCoreConfig
 from wanda_voice_core.event_bus import EventBus
+from wanda_voice_core.health import ProviderHealthMonitor
 from wanda_voice_core.run_manager import RunManager
 from wanda_voice_core.router import IntentRouter
 from wanda_voice_core.refiner import PromptRefiner
 from wanda_voice_core.safety import SafetyPolicy
+from wanda_voice_core.sessions import (
+    Session,
+    SessionStore,
+    release_session,
+    use_session,
+)
 from wanda_voice_core.confirmation import ConfirmationFlow
 from wanda_voice_core.token_economy import (
-    truncate_to_budget,
+    truncate_to_tokens,
     redact_sensitive,
-    estimate_tokens,
-    MAX_CONTEXT_CHARS,
+    count_tokens,
+    MAX_CONTEXT_TOKENS,
+)
+from wanda_voice_core.metrics import (
+    CACHE_HITS_TOTAL,
+    CACHE_MISSES_TOTAL,
+    ERRORS_TOTAL,
+    FALLBACKS_TOTAL,
+    PROVIDER_SECONDS,
+    ROUTES_TOTAL,
+    STAGE_SECONDS,
+    MetricsRegistry,
+)
+from wanda_voice_core.providers.base import (
+    ProviderBase,
+    release_delta_sink,
+    use_delta_sink,
 )
-from wanda_voice_core.providers.base import ProviderBase
+from wanda_voice_core.tracing import end_trace, span, start_trace
 
 
 class WandaVoiceEngine:
@@ -38,10 +62,35 @@ class WandaVoiceEngine:
     Pipeline: Text -> Router -> (Refiner?) -> Confirmation -> Provider -> TTS
     """
 
+    # Settings applied to a running engine when the config is reloaded
+    LIVE_CONFIG_KEYS = (
+        "refiner.enabled",
+        "router.confidence_threshold",
+        "safety",
+        "confirmation.timeout",
+        "tracing",
+        "sessions",
+        "history.max_turns",
+    )
+
     def __init__(self, config: Optional[VoiceCoreConfig] = None):
         self.config = config or VoiceCoreConfig()
-        self.event_bus = EventBus()
-        self.run_manager = RunManager()
+        self.event_bus = EventBus(
+            max_history=self.config.get("events.max_history", 100),
+            max_runs=self.config.get("events.max_runs", 256),
+            max_events_per_run=self.config.get("events.max_events_per_run", 500),
+            max_run_bytes=self.config.get("events.max_run_bytes", 8 * 1024 * 1024),
+            sample_every=self.config.get("events.sample_every", {}),
+            no_history=self.config.get("events.no_history", []),
+        )
+        self.run_manager = RunManager(
+            durability=self.config.get("runs.durability", "flush"),
+            flush_bytes=self.config.get("runs.flush_bytes", 64 * 1024),
+            flush_interval_s=self.config.get("runs.flush_interval_s", 1.0),
+            catalog=self.config.get("runs.catalog", True),
+            audio_codec=self.config.get("runs.audio_codec", "flac"),
+            audio_max_bytes=self.config.get("runs.audio_max_bytes", 4 * 1024 * 1024),
+        )
 
         # Core modules
         self.router = IntentRouter(
@@ -61,16 +110,53 @@ class WandaVoiceEngine:
         # Providers (set externally or via _init_providers)
         self._primary_provider: Optional[ProviderBase] = None
         self._fallback_provider: Optional[ProviderBase] = None
+        self.health = ProviderHealthMonitor(
+            event_bus=self.event_bus,
+            interval_s=self.config.get("health.interval_s", 15.0),
+            probe_timeout_s=self.config.get("health.probe_timeout_s", 5.0),
+            failure_threshold=self.config.get("health.failure_threshold", 3),
+            reset_timeout_s=self.config.get("health.reset_timeout_s", 30.0),
+        )
+        self.metrics = MetricsRegistry()
+        self._init_metrics()
+        self.tracing_enabled = self.config.get("tracing.enabled", False)
+        self.trace_min_duration_ms = self.config.get("tracing.min_duration_ms", 0)
+
+        # Per-caller conversation state
+        self.sessions = SessionStore(
+            max_sessions=self.config.get("sessions.max_sessions", 256),
+            idle_ttl_s=self.config.get("sessions.idle_ttl_s", 1800.0),
+            max_bytes=self.config.get("sessions.max_bytes", 16 * 1024 * 1024),
+            max_turns=self.config.get("history.max_turns", 12),
+            affinity_ttl_s=self.config.get("sessions.affinity_ttl_s", 300.0),
+        )
+
+        # Concurrent runs: admission queue plus per-provider limits
+        self.admission = AdmissionController(
+            max_concurrent=self.config.get("concurrency.max_runs", 4),
+            max_queue=self.config.get("concurrency.max_queue", 16),
+        )
+        self.provider_limits = KeyedLimiter(
+            "provider",
+            limits=self.config.get("concurrency.provider_limits", {}),
+            default=self.config.get("concurrency.provider_default_limit", 2),
+        )
 
         # Confirmation flow (requires tts/stt callbacks, set via set_io)
         self._tts_speak: Optional[Callable] = None
         self._stt_listen: Optional[Callable] = None
         self._confirmation: Optional[ConfirmationFlow] = None
+        # One speaker and one microphone: confirmations never overlap
+        self._confirmation_lock: Optional[asyncio.Lock] = None
 
         # Clipboard tool detection
         self._clipboard_tool = self._detect_clipboard_tool()
         self._typing_tool = self._detect_typing_tool()
 
+        # Re-tune live when the config file changes (no restart, no reload
+        # of models or providers)
+        self.config.subscribe(self.LIVE_CONFIG_KEYS, self._on_config_change)
+
     # --- Setup ---
 
     def set_providers(
@@ -78,6 +164,18 @@ class WandaVoiceEngine:
     ) -> None:
         self._primary_provider = primary
         self._fallback_provider = fallback
+        for provider in (primary, fallback):
+            if provider is not None:
+                if provider.event_bus is None:
+                    provider.event_bus = self.event_bus
+                self.health.register(provider)
+
+    def start_health_monitor(self) -> None:
+        """Start background provider probes (call from the engine's loop)."""
+        self.health.start()
+
+    async def stop_health_monitor(self) -> None:
+        await self.health.stop()
 
     def set_io(self, tts_speak: Callable, stt_listen: Callable) -> None:
         """Set TTS and STT callbacks for confirmation flow."""
@@ -90,6 +188,26 @@ class WandaVoiceEngine:
             timeout=self.config.get("confirmation.timeout", 10),
         )
 
+    def _on_config_change(self, snapshot: Any, changed: set[str]) -> None:
+        """Apply reloaded settings to the running components."""
+        get = snapshot.get
+        if "refiner.enabled" in changed:
+            self.set_refiner_enabled(get("refiner.enabled", True))
+        self.router.confidence_threshold = get("router.confidence_threshold", 0.6)
+        self.safety.command_execution = get("safety.command_execution", False)
+        self.safety.risk_threshold_voice = get("safety.risk_threshold_voice", 3)
+        self.safety.risk_threshold_gui = get("safety.risk_threshold_gui", 6)
+        if self._confirmation is not None:
+            self._confirmation.timeout = get("confirmation.timeout", 10)
+        self.tracing_enabled = get("tracing.enabled", False)
+        self.trace_min_duration_ms = get("tracing.min_duration_ms", 0)
+        self.sessions.idle_ttl_s = get("sessions.idle_ttl_s", 1800.0)
+        self.sessions.max_turns = get("history.max_turns", 12)
+        self.sessions.affinity_ttl_s = get("sessions.affinity_ttl_s", 300.0)
+        self.event_bus.emit(
+            "config.reload", {"version": snapshot.version, "changed": sorted(changed)}
+        )
+
     def set_refiner_enabled(self, enabled: bool) -> None:
         self.refiner_enabled = bool(enabled)
         self.event_bus.emit("refiner.toggle", {"enabled": self.refiner_enabled})
@@ -101,19 +219,71 @@ class WandaVoiceEngine:
     # --- Main Pipeline ---
 
     async def process_text(
-        self, text: str, skip_confirmation: bool = False
+        self,
+        text: str,
+        skip_confirmation: bool = False,
+        audio: Any = None,
+        session_id: Optional[str] = None,
+        run_id: Optional[str] = None,
     ) -> EngineResult:
-        """Process text input through the full pipeline (for API/OVOS)."""
-        run_id = self.run_manager.start_run()
+        """Process text input through the full pipeline (for API/OVOS).
+
+        audio, if given, is the input the text was transcribed from; it is
+        kept with the run for replay. session_id selects the conversation
+        (history, summary, provider affinity); callers without one share the
+        default session. run_id (see RunManager.new_run_id) names the run
+        in advance. Up to concurrency.max_runs calls run at once; raises
+        OverloadedError if the admission queue is full.
+        """
+        async with self.admission.slot():
+            return await self._process_text(
+                text, skip_confirmation, audio, session_id, run_id
+            )
+
+    async def _process_text(
+        self,
+        text: str,
+        skip_confirmation: bool = False,
+        audio: Any = None,
+        session_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> EngineResult:
+        session = self.sessions.get(session_id)
+        session_token = use_session(session)
+        try:
+            return await self._run_pipeline(
+                text, skip_confirmation, audio, session, run_id
+            )
+        finally:
+            release_session(session_token)
+
+    async def _run_pipeline(
+        self,
+        text: str,
+        skip_confirmation: bool,
+        audio: Any,
+        session: Session,
+        run_id: Optional[str] = None,
+    ) -> EngineResult:
+        run_id = self.run_manager.start_run(run_id)
+        if audio is not None:
+            self._keep_audio(audio, run_id)
         result = EngineResult(run_id=run_id)
         t0 = time.time()
+        started = time.perf_counter()
+        trace_token = start_trace(run_id) if self.tracing_enabled else None
 
         try:
-            self.event_bus.emit("run.start", {"text": text[:100]}, run_id=run_id)
+            self.event_bus.emit(
+                "run.start",
+                {"text": text[:100], "session_id": session.session_id},
+                run_id=run_id,
+            )
             result.transcript = text
 
             # Safety check
-            safety_result = self.safety.check_text(text)
+            with self._stage("safety"):
+                safety_result = self.safety.check_text(text)
             self.event_bus.emit(
                 "safety.check",
                 {
@@ -131,8 +301,10 @@ class WandaVoiceEngine:
                 return result
 
             # Route
-            route_result = self.router.route(text)
+            with self._stage("route"):
+                route_result = self.router.route(text)
             result.route = route_result.route
+            self.metrics.inc(ROUTES_TOTAL, route=route_result.route.value)
             self.event_bus.emit(
                 "router.result",
                 {
@@ -160,7 +332,8 @@ class WandaVoiceEngine:
                 and self.refiner_enabled
                 and self.config.get("refiner.enabled", True)
             ):
-                refiner_result = await self.refiner.refine(text)
+                with self._stage("refine"):
+                    refiner_result = await self.refiner.refine(text)
                 improved_text = refiner_result.improved_text
                 result.improved_text = improved_text
                 self.event_bus.emit(
@@ -174,7 +347,7 @@ class WandaVoiceEngine:
                 )
 
                 if confirmation_enabled:
-                    action = await self._confirmation.run(refiner_result, run_id=run_id)
+                    action = await self._confirm(refiner_result, run_id)
                     result.confirmation_action = action
                     if action == ConfirmationState.SEND:
                         pass
@@ -202,7 +375,7 @@ class WandaVoiceEngine:
                 )
 
                 # Run confirmation flow
-                action = await self._confirmation.run(refiner_result, run_id=run_id)
+                action = await self._confirm(refiner_result, run_id)
                 result.confirmation_action = action
 
                 if action == ConfirmationState.SEND:
@@ -218,27 +391,42 @@ class WandaVoiceEngine:
 
             # Redact and truncate
             prompt = redact_sensitive(improved_text)
-            prompt = truncate_to_budget(prompt, MAX_CONTEXT_CHARS)
+            prompt = truncate_to_tokens(prompt, MAX_CONTEXT_TOKENS)
 
             # Send to provider
-            response = await self._send_to_provider(prompt, run_id)
+            sent: dict[str, Any] = {}
+            with self._stage("provider"):
+                response = await self._send_to_provider(
+                    prompt, run_id, sent, session
+                )
             result.response_text = response
+            if sent.get("provider"):
+                self.sessions.record_turn(
+                    session, prompt, response, provider=sent["provider"]
+                )
 
             # Metrics
             latency = (time.time() - t0) * 1000
             result.metrics = {
                 "chars_in": len(prompt),
                 "chars_out": len(response),
-                "token_est_in": estimate_tokens(prompt),
-                "token_est_out": estimate_tokens(response),
+                "token_est_in": count_tokens(prompt),
+                "token_est_out": count_tokens(response),
                 "latency_ms": latency,
+                "provider": sent.get("provider"),
             }
             self.event_bus.emit("metrics.update", result.metrics, run_id=run_id)
 
         except Exception as e:
             result.error = str(e)
+            self.metrics.inc(ERRORS_TOTAL, stage="pipeline")
             self.event_bus.emit("error", {"message": str(e)}, run_id=run_id)
         finally:
+            self.metrics.observe(
+                STAGE_SECONDS, time.perf_counter() - started, stage="total"
+            )
+            if trace_token is not None:
+                self._save_trace(trace_token, run_id)
             self.event_bus.emit(
                 "run.end",
                 {
@@ -247,108 +435,264 @@ class WandaVoiceEngine:
                 run_id=run_id,
             )
             self.run_manager.end_run(
-                {"result": result.response_text[:200] if result.response_text else ""}
+                {
+                    "result": (
+                        result.response_text[:200] if result.response_text else ""
+                    ),
+                    "route": result.route.value if result.route else None,
+                    "provider": result.metrics.get("provider"),
+                    "latency_ms": result.metrics.get(
+                        "latency_ms", (time.time() - t0) * 1000
+                    ),
+                    "error": result.error,
+                },
+                run_id=run_id,
             )
 
         return result
 
     async def process_audio(
-        self, audio_data: Any, stt_engine: Any = None
+        self, audio_data: Any, stt_engine: Any = None, session_id: Optional[str] = None
     ) -> EngineResult:
         """Process audio input: STT -> pipeline.
 
         Args:
             audio_data: numpy array of audio samples
             stt_engine: STT engine with .transcribe(audio, language) method
+            session_id: conversation to continue (default session if None)
         """
+        async with self.admission.slot():
+            text = await self._transcribe(audio_data, stt_engine)
+            if isinstance(text, EngineResult):
+                return text
+            return await self._process_text(text, session_id=session_id)
+
+    async def _transcribe(self, audio_data: Any, stt_engine: Any) -> Any:
+        """Run STT in its own run; returns the text or a failed EngineResult."""
         run_id = self.run_manager.start_run()
-        self.event_bus.emit("recording.stop", {}, run_id=run_id)
-
-        if stt_engine is None:
-            return EngineResult(run_id=run_id, error="No STT engine provided")
+        trace_token = start_trace(run_id) if self.tracing_enabled else None
+        try:
+            self.event_bus.emit("recording.stop", {}, run_id=run_id)
+            if audio_data is not None:
+                self._keep_audio(audio_data, run_id)
 
-        # Transcribe
-        self.event_bus.emit("stt.result", {"status": "transcribing"}, run_id=run_id)
-        language = self.config.get("stt.language", "de")
+            if stt_engine is None:
+                return EngineResult(run_id=run_id, error="No STT engine provided")
 
-        try:
-            text = stt_engine.transcribe(audio_data, language=language)
-        except Exception as e:
-            return EngineResult(run_id=run_id, error=f"STT error: {e}")
+            # Transcribe
+            self.event_bus.emit(
+                "stt.result", {"status": "transcribing"}, run_id=run_id
+            )
+            language = self.config.get("stt.language", "de")
+
+            try:
+                with self._stage("stt"):
+                    text = stt_engine.transcribe(audio_data, language=language)
+            except Exception as e:
+                self.metrics.inc(ERRORS_TOTAL, stage="stt")
+                return EngineResult(run_id=run_id, error=f"STT error: {e}")
+
+            if not text or not text.strip():
+                self.event_bus.emit("stt.result", {"status": "empty"}, run_id=run_id)
+                return EngineResult(
+                    run_id=run_id, transcript="", error="No speech detected"
+                )
 
-        if not text or not text.strip():
-            self.event_bus.emit("stt.result", {"status": "empty"}, run_id=run_id)
-            return EngineResult(
-                run_id=run_id, transcript="", error="No speech detected"
+            self.event_bus.emit("stt.result", {"text": text[:100]}, run_id=run_id)
+            return text
+        finally:
+            if trace_token is not None:
+                self._save_trace(trace_token, run_id)
+            self.run_manager.end_run(run_id=run_id)
+
+    def _init_metrics(self) -> None:
+        m = self.metrics
+        m.describe(STAGE_SECONDS, "Pipeline stage wall time")
+        m.describe(PROVIDER_SECONDS, "Provider call wall time")
+        m.describe(ROUTES_TOTAL, "Runs by route")
+        m.describe(FALLBACKS_TOTAL, "Requests sent to a fallback provider")
+        m.describe(CACHE_HITS_TOTAL, "Cache hits")
+        m.describe(CACHE_MISSES_TOTAL, "Cache misses")
+        m.describe(ERRORS_TOTAL, "Errors by stage")
+
+        def on_pool(event: RunEvent) -> None:
+            name = CACHE_HITS_TOTAL if event.data.get("warm") else CACHE_MISSES_TOTAL
+            m.inc(name, cache="gemini_pool")
+
+        self.event_bus.subscribe("provider.pool", on_pool)
+
+        def token_cache() -> list[tuple[str, dict[str, str], float]]:
+            info = count_tokens.cache_info()
+            return [
+                (CACHE_HITS_TOTAL, {"cache": "token_count"}, info.hits),
+                (CACHE_MISSES_TOTAL, {"cache": "token_count"}, info.misses),
+            ]
+
+        m.register_collector(token_cache)
+
+    @contextmanager
+    def _stage(self, stage: str):
+        """Time a pipeline stage into the metrics and the run trace."""
+        with self.metrics.timer(STAGE_SECONDS, stage=stage), span(stage, cat="stage"):
+            yield
+
+    def _save_trace(self, token: Any, run_id: str) -> None:
+        trace = end_trace(token)
+        if trace is not None and trace.duration_ms >= self.trace_min_duration_ms:
+            self.run_manager.save_artifact(
+                "trace.json", trace.to_chrome(), run_id=run_id
             )
 
-        self.event_bus.emit("stt.result", {"text": text[:100]}, run_id=run_id)
+    def _keep_audio(self, audio: Any, run_id: str) -> None:
+        if self.config.get("runs.keep_audio", True):
+            self.run_manager.save_audio(
+                audio,
+                sample_rate=self.config.get("audio.sample_rate", 16000),
+                run_id=run_id,
+            )
 
-        # Close current run and delegate to process_text
-        self.run_manager.end_run()
-        return await self.process_text(text)
+    async def _confirm(self, refiner_result: RefinerResult, run_id: str) -> Any:
+        """Run the confirmation flow, one run at a time."""
+        if self._confirmation_lock is None:
+            self._confirmation_lock = asyncio.Lock()
+        async with self._confirmation_lock:
+            with self._stage("confirmation"):
+                return await self._confirmation.run(refiner_result, run_id=run_id)
 
     # --- Provider ---
 
-    async def _send_to_provider(self, prompt: str, run_id: str) -> str:
-        """Send prompt to primary provider with fallback."""
+    async def _send_to_provider(
+        self,
+        prompt: str,
+        run_id: str,
+        sent: Optional[dict[str, Any]] = None,
+        session: Optional[Session] = None,
+    ) -> str:
+        """Send prompt to the first healthy provider, falling back in order.
+
+        Providers whose circuit breaker is open are skipped without a call,
+        so a known-dead primary costs nothing until its cool-down expires.
+        A session's recent provider is tried first, so a conversation stays
+        on the model that holds its context. The session summary is passed
+        as context. If given, sent["provider"] is set to the provider that
+        answered.
+        """
         if not self._primary_provider:
             return "Kein Provider konfiguriert."
 
-        self.event_bus.emit(
-            "provider.request",
-            {
-                "provider": self._primary_provider.name,
-                "chars": len(prompt),
-            },
-            run_id=run_id,
-        )
+        providers = [
+            p for p in (self._primary_provider, self._fallback_provider) if p
+        ]
+        context: Optional[str] = None
+        if session is not None:
+            context = session.summary or None
+            preferred = self.sessions.affinity(session)
+            providers.sort(key=lambda p: p.name != preferred)
+        last_failure: Optional[str] = None
+        for provider in providers:
+            is_fallback = provider is not self._primary_provider
+            if not self.health.allow(provider.name):
+                self.event_bus.emit(
+                    "provider.skipped",
+                    {"provider": provider.name, "reason": "circuit_open"},
+                    run_id=run_id,
+                )
+                continue
 
-        try:
-            response = await self._primary_provider.send(prompt)
+            if is_fallback:
+                self.metrics.inc(FALLBACKS_TOTAL, provider=provider.name)
+            self.event_bus.emit(
+                "provider.request",
+                {
+                    "provider": provider.name,
+                    "chars": len(prompt),
+                    **({"fallback": True} if is_fallback else {}),
+                },
+                run_id=run_id,
+            )
+            try:
+                async with self.provider_limits.acquire(provider.name):
+                    started = time.perf_counter()
+                    with span(
+                        f"provider.{provider.name}",
+                        cat="provider",
+                        fallback=is_fallback,
+                    ):
+                        response = await self._send_streaming(
+                            provider, prompt, context, run_id
+                        )
+            except Exception as e:
+                self._observe_provider(provider.name, started, "exception")
+                self.health.record_failure(provider.name, str(e))
+                self.event_bus.emit(
+                    "provider.timeout" if is_fallback else "provider.error",
+                    {"provider": provider.name, "error": str(e)},
+                    run_id=run_id,
+                )
+                continue
+
+            if not provider.last_send_ok:
+                # Provider answered with its own failure message
+                self._observe_provider(provider.name, started, "failed")
+                self.health.record_failure(provider.name, response[:200])
+                self.event_bus.emit(
+                    "provider.error",
+                    {"provider": provider.name, "error": response[:200]},
+                    run_id=run_id,
+                )
+                last_failure = response
+                continue
+
+            self._observe_provider(provider.name, started, "ok")
+            self.health.record_success(provider.name)
+            if sent is not None:
+                sent["provider"] = provider.name
             self.event_bus.emit(
                 "provider.response",
                 {
-                    "provider": self._primary_provider.name,
+                    "provider": provider.name,
                     "chars": len(response),
+                    **({"fallback": True} if is_fallback else {}),
                 },
                 run_id=run_id,
             )
             return response
-        except Exception as e:
+
+        return last_failure or "Provider nicht erreichbar. Bitte versuche es nochmal."
+
+    async def _send_streaming(
+        self,
+        provider: ProviderBase,
+        prompt: str,
+        context: Optional[str],
+        run_id: Optional[str],
+    ) -> str:
+        """provider.send, emitting response.delta events if it streams."""
+        if not provider.streams or not self.event_bus.wants("response.delta"):
+            return await provider.send(prompt, context)
+
+        def on_delta(text: str) -> None:
             self.event_bus.emit(
-                "provider.error",
-                {
-                    "provider": self._primary_provider.name,
-                    "error": str(e),
-                },
+                "response.delta",
+                {"provider": provider.name, "text": text},
                 run_id=run_id,
             )
 
-            # Try fallback
-            if self._fallback_provider:
-                try:
-                    response = await self._fallback_provider.send(prompt)
-                    self.event_bus.emit(
-                        "provider.response",
-                        {
-                            "provider": self._fallback_provider.name,
-                            "chars": len(response),
-                            "fallback": True,
-                        },
-                        run_id=run_id,
-                    )
-                    return response
-                except Exception as e2:
-                    self.event_bus.emit(
-                        "provider.timeout",
-                        {
-                            "error": str(e2),
-                        },
-                        run_id=run_id,
-                    )
-
-            return "Provider nicht erreichbar. Bitte versuche es nochmal."
+        token = use_delta_sink(on_delta)
+        try:
+            return await provider.send(prompt, context)
+        finally:
+            release_delta_sink(token)
+
+    def _observe_provider(self, name: str, started: float, outcome: str) -> None:
+        self.metrics.observe(
+            PROVIDER_SECONDS,
+            time.perf_counter() - started,
+            provider=name,
+            outcome=outcome,
+        )
+        if outcome != "ok":
+            self.metrics.inc(ERRORS_TOTAL, stage="provider")
 
     # --- Clipboard / Typing ---
 
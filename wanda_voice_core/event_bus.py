@@ -1,10 +1,11 @@
 """Thread-safe EventBus for WANDA Voice Core."""
 
 from __future__ import annotations
+import sys
 import threading
 import time
-from collections import deque
-from typing import Any, Callable
+from collections import OrderedDict, deque
+from typing import Any, Callable, Iterable, Optional, Union
 
 from wanda_voice_core.schemas import RunEvent
 
@@ -21,8 +22,14 @@ EVENT_TYPES = {
     "refiner.skipped",
     "provider.request",
     "provider.response",
+    "response.delta",
     "provider.error",
     "provider.timeout",
+    "provider.hedge",
+    "provider.hedge_result",
+    "provider.pool",
+    "provider.skipped",
+    "provider.health",
     "tts.start",
     "tts.stop",
     "tts.interrupt",
@@ -37,16 +44,237 @@ EVENT_TYPES = {
     "error",
 }
 
+# Payload passed to emit: a dict, or a callable building the dict. Callables
+# are only evaluated when the event is actually recorded or delivered.
+Payload = Union[dict[str, Any], Callable[[], dict[str, Any]], None]
+
+# Overflow policies for async subscribers
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_BLOCK = "block"
+OVERFLOW_POLICIES = {OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST, OVERFLOW_BLOCK}
+
+
+class AsyncSubscriber:
+    """Delivers events to one callback from its own bounded queue and thread.
+
+    The emitting thread only enqueues, so a slow subscriber (GTK, a stalled
+    SSE client) adds no latency to the pipeline. What happens when the
+    queue is full is decided by the overflow policy.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[RunEvent], None],
+        max_queue: int = 256,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        name: str = "",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: {overflow}")
+        self.callback = callback
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.delivered = 0
+        self.dropped = 0
+        self.max_lag = 0
+        self.last_delay_s = 0.0
+        self._queue: deque[tuple[float, RunEvent]] = deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self._in_flight = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"EventBus-{name or 'subscriber'}", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, event: RunEvent) -> None:
+        with self._cond:
+            if not self._running:
+                return
+            if len(self._queue) >= self.max_queue:
+                if self.overflow == OVERFLOW_DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                if self.overflow == OVERFLOW_DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    while self._running and len(self._queue) >= self.max_queue:
+                        self._cond.wait()
+                    if not self._running:
+                        return
+            self._queue.append((time.monotonic(), event))
+            self.max_lag = max(self.max_lag, len(self._queue))
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                enqueued_at, event = self._queue.popleft()
+                self._in_flight = True
+                self._cond.notify_all()
+            self.last_delay_s = time.monotonic() - enqueued_at
+            try:
+                self.callback(event)
+            except Exception as e:
+                print(f"[EventBus] Error in callback for {event.event_type}: {e}")
+            finally:
+                self.delivered += 1
+                self._in_flight = False
+
+    @property
+    def lag(self) -> int:
+        """Events queued but not yet delivered."""
+        return len(self._queue)
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until the queue is drained. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue or self._in_flight:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=timeout)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "last_delay_ms": round(self.last_delay_s * 1000, 2),
+            "overflow": self.overflow,
+        }
+
 
 class EventBus:
-    """Thread-safe publish/subscribe event bus with rolling log."""
+    """Thread-safe publish/subscribe event bus with rolling log.
+
+    Subscribers are called synchronously on the emitting thread by default.
+    With dispatch="async" each subscriber gets its own bounded queue and
+    delivery thread (see AsyncSubscriber).
 
-    def __init__(self, max_history: int = 100):
+    Besides the rolling log, events carrying a run_id are indexed per run.
+    Whole runs are evicted least-recently-used once max_runs or
+    max_run_bytes (estimated) is exceeded, and each run keeps at most
+    max_events_per_run events.
+
+    High-frequency types (e.g. vad.speech) can be kept out of the history
+    (no_history) and sampled (sample_every={"vad.speech": 10} keeps every
+    10th). An event that is sampled out, or that has neither subscribers
+    nor history capture, is never built: emit returns None without
+    allocating the event or evaluating a lazy payload.
+    """
+
+    def __init__(
+        self,
+        max_history: int = 100,
+        default_dispatch: str = "sync",
+        max_runs: int = 256,
+        max_events_per_run: int = 500,
+        max_run_bytes: int = 8 * 1024 * 1024,
+        sample_every: Optional[dict[str, int]] = None,
+        no_history: Optional[Iterable[str]] = None,
+    ):
         self._subscribers: dict[str, list[Callable]] = {}
         self._lock = threading.Lock()
         self._history: deque[RunEvent] = deque(maxlen=max_history)
+        self.default_dispatch = default_dispatch
+        self.max_runs = max_runs
+        self.max_events_per_run = max_events_per_run
+        self.max_run_bytes = max_run_bytes
+        self._runs: OrderedDict[str, deque[RunEvent]] = OrderedDict()
+        self._run_bytes: dict[str, int] = {}
+        self._total_run_bytes = 0
+        self._sample_every: dict[str, int] = {}
+        self._sample_counts: dict[str, int] = {}
+        self._no_history: set[str] = set()
+        self.emitted = 0
+        self.skipped = 0
+        self.sampled_out = 0
+        for event_type, every in (sample_every or {}).items():
+            self.set_sampling(event_type, every)
+        for event_type in no_history or ():
+            self.set_history_capture(event_type, False)
+
+    def set_sampling(self, event_type: str, every: int) -> None:
+        """Keep only every n-th event of event_type (n <= 1 keeps all)."""
+        event_type = sys.intern(event_type)
+        with self._lock:
+            if every > 1:
+                self._sample_every[event_type] = int(every)
+            else:
+                self._sample_every.pop(event_type, None)
+            self._sample_counts.pop(event_type, None)
+
+    def set_history_capture(self, event_type: str, enabled: bool) -> None:
+        """Include or exclude event_type from the history and run index."""
+        event_type = sys.intern(event_type)
+        with self._lock:
+            if enabled:
+                self._no_history.discard(event_type)
+            else:
+                self._no_history.add(event_type)
+
+    def wants(self, event_type: str) -> bool:
+        """True if an event of this type would be recorded or delivered.
+
+        Lets callers skip work that even a lazy payload can't avoid.
+        Sampling is not considered; see sample().
+        """
+        return (
+            event_type not in self._no_history
+            or event_type in self._subscribers
+            or "*" in self._subscribers
+        )
+
+    def sample(self, event_type: str) -> bool:
+        """Advance event_type's sampling counter; False if this one is dropped.
+
+        emit() does this itself. Callers that need the decision before they
+        know whether to emit (e.g. ahead of a VAD query) call it first and
+        pass sampled=True to emit.
+        """
+        with self._lock:
+            return self._sample(event_type)
 
-    def subscribe(self, event_type: str, callback: Callable[[RunEvent], None]) -> None:
+    def _sample(self, event_type: str) -> bool:
+        every = self._sample_every.get(event_type)
+        if every is None:
+            return True
+        count = self._sample_counts.get(event_type, 0)
+        self._sample_counts[event_type] = count + 1
+        if count % every:
+            self.sampled_out += 1
+            return False
+        return True
+
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callable[[RunEvent], None],
+        dispatch: Optional[str] = None,
+        max_queue: int = 256,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+    ) -> None:
+        if (dispatch or self.default_dispatch) == "async":
+            name = getattr(callback, "__name__", "subscriber")
+            callback = AsyncSubscriber(
+                callback, max_queue=max_queue, overflow=overflow, name=name
+            )
+        event_type = sys.intern(event_type)
         with self._lock:
             if event_type not in self._subscribers:
                 self._subscribers[event_type] = []
@@ -54,29 +282,82 @@ class EventBus:
 
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
         with self._lock:
-            if event_type in self._subscribers:
-                try:
-                    self._subscribers[event_type].remove(callback)
-                except ValueError:
-                    pass
+            subs = self._subscribers.get(event_type, [])
+            for sub in subs:
+                if sub == callback or getattr(sub, "callback", None) == callback:
+                    subs.remove(sub)
+                    break
+            else:
+                return
+            if not subs:
+                del self._subscribers[event_type]
+        if isinstance(sub, AsyncSubscriber):
+            sub.stop()
+
+    def _async_subscribers(self) -> list[AsyncSubscriber]:
+        with self._lock:
+            return [
+                sub
+                for subs in self._subscribers.values()
+                for sub in subs
+                if isinstance(sub, AsyncSubscriber)
+            ]
+
+    def subscriber_stats(self) -> list[dict[str, Any]]:
+        """Lag and drop counters for every async subscriber."""
+        return [
+            {"callback": getattr(sub.callback, "__name__", repr(sub.callback)),
+             **sub.stats()}
+            for sub in self._async_subscribers()
+        ]
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait for all async subscribers to drain their queues."""
+        return all(sub.flush(timeout) for sub in self._async_subscribers())
 
     def emit(
         self,
         event_type: str,
-        data: dict[str, Any] | None = None,
+        data: Payload = None,
         run_id: str | None = None,
-    ) -> RunEvent:
+        sampled: bool = False,
+    ) -> Optional[RunEvent]:
+        """Record and deliver an event.
+
+        Returns the event, or None if it was sampled out or unobserved.
+        sampled=True means the caller already kept it via sample().
+        """
+        with self._lock:
+            if not sampled and not self._sample(event_type):
+                return None
+            capture = event_type not in self._no_history
+            callbacks = self._subscribers.get(event_type)
+            wildcard = self._subscribers.get("*")
+            if not capture and not callbacks and not wildcard:
+                self.skipped += 1
+                return None
+            callbacks = list(callbacks or ())
+            # Also notify wildcard subscribers
+            callbacks.extend(wildcard or ())
+
+        if callable(data):
+            try:
+                data = data()
+            except Exception as e:
+                print(f"[EventBus] Error building payload for {event_type}: {e}")
+                data = {"payload_error": str(e)}
         event = RunEvent(
-            event_type=event_type,
+            event_type=sys.intern(event_type),
             data=data or {},
             timestamp=time.time(),
             run_id=run_id,
         )
         with self._lock:
-            self._history.append(event)
-            callbacks = list(self._subscribers.get(event_type, []))
-            # Also notify wildcard subscribers
-            callbacks.extend(self._subscribers.get("*", []))
+            self.emitted += 1
+            if capture:
+                self._history.append(event)
+                if run_id is not None:
+                    self._index_event(event)
 
         for cb in callbacks:
             try:
@@ -86,16 +367,74 @@ class EventBus:
 
         return event
 
+    def emit_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "emitted": self.emitted,
+                "skipped": self.skipped,
+                "sampled_out": self.sampled_out,
+            }
+
     def get_recent_events(self, n: int = 10) -> list[RunEvent]:
         with self._lock:
             items = list(self._history)
         return items[-n:]
 
+    def _index_event(self, event: RunEvent) -> None:
+        """Append to the run's slice and enforce retention (lock held)."""
+        run_id = event.run_id
+        events = self._runs.get(run_id)
+        if events is None:
+            events = deque(maxlen=self.max_events_per_run)
+            self._runs[run_id] = events
+            self._run_bytes[run_id] = 0
+        else:
+            self._runs.move_to_end(run_id)
+        size = _estimate_size(event)
+        if len(events) == events.maxlen:
+            size -= _estimate_size(events[0])
+        events.append(event)
+        self._run_bytes[run_id] += size
+        self._total_run_bytes += size
+
+        while len(self._runs) > 1 and (
+            len(self._runs) > self.max_runs
+            or self._total_run_bytes > self.max_run_bytes
+        ):
+            old_id, _ = self._runs.popitem(last=False)
+            self._total_run_bytes -= self._run_bytes.pop(old_id, 0)
+
     def get_events_for_run(self, run_id: str) -> list[RunEvent]:
         with self._lock:
-            return [e for e in self._history if e.run_id == run_id]
+            events = self._runs.get(run_id)
+            if events is None:
+                return []
+            self._runs.move_to_end(run_id)
+            return list(events)
+
+    def run_index_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "runs": len(self._runs),
+                "events": sum(len(e) for e in self._runs.values()),
+                "bytes_est": self._total_run_bytes,
+            }
 
     def clear(self) -> None:
+        subs = self._async_subscribers()
         with self._lock:
             self._history.clear()
+            self._runs.clear()
+            self._run_bytes.clear()
+            self._total_run_bytes = 0
             self._subscribers.clear()
+        for sub in subs:
+            sub.stop()
+
+
+def _estimate_size(event: RunEvent) -> int:
+    """Rough in-memory size of an event (object overhead + payload text)."""
+    size = 200
+    for key, value in event.data.items():
+        size += 60 + len(key) + (len(value) if isinstance(value, str) else 16)
+    return size
@@ -0,0 +1,213 @@
+"""Provider health monitor with per-provider circuit breakers."""
+
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from typing import Any, Optional
+
+from wanda_voice_core.providers.base import ProviderBase
+from wanda_voice_core.schemas import CircuitState
+
+
+class CircuitBreaker:
+    """Closed -> open after N consecutive failures, half-open after a cool-down.
+
+    In half-open state a single trial request is let through; its outcome
+    closes or re-opens the circuit.
+
+    Background probes are tracked apart from real requests: a cheap probe
+    (e.g. "gemini --version") passing says little about whether a request
+    will answer, so it never resets the request failure count or closes
+    the circuit. A passing probe only moves OPEN to HALF_OPEN early; N
+    consecutive failing probes open the circuit on their own.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout_s: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.probe_failures = 0
+        self.opened_at = 0.0
+        self.last_error: Optional[str] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout_s:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> CircuitState:
+        with self._lock:
+            self.failures = 0
+            self.probe_failures = 0
+            self.last_error = None
+            self._trial_in_flight = False
+            self.state = CircuitState.CLOSED
+            return self.state
+
+    def record_failure(self, error: str = "") -> CircuitState:
+        with self._lock:
+            self.failures += 1
+            self.last_error = error or self.last_error
+            self._trial_in_flight = False
+            if (
+                self.state == CircuitState.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                self._open()
+            return self.state
+
+    def record_probe(self, ok: bool, error: str = "") -> CircuitState:
+        with self._lock:
+            if ok:
+                self.probe_failures = 0
+                if self.state == CircuitState.OPEN:
+                    self.state = CircuitState.HALF_OPEN
+                    self._trial_in_flight = False
+            else:
+                self.probe_failures += 1
+                self.last_error = error or self.last_error
+                if self.probe_failures >= self.failure_threshold:
+                    self._open()
+            return self.state
+
+    def _open(self) -> None:
+        if self.state != CircuitState.OPEN:
+            self.opened_at = time.monotonic()
+        self.state = CircuitState.OPEN
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "failures": self.failures,
+            "probe_failures": self.probe_failures,
+            "last_error": self.last_error,
+        }
+
+
+class ProviderHealthMonitor:
+    """Probes providers in the background and tracks their circuit state."""
+
+    def __init__(
+        self,
+        event_bus: Any = None,
+        interval_s: float = 15.0,
+        probe_timeout_s: float = 5.0,
+        failure_threshold: int = 3,
+        reset_timeout_s: float = 30.0,
+    ):
+        self.event_bus = event_bus
+        self.interval_s = interval_s
+        self.probe_timeout_s = probe_timeout_s
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self._providers: dict[str, ProviderBase] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._last_probe: dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, provider: ProviderBase) -> None:
+        self._providers[provider.name] = provider
+        if provider.name not in self._breakers:
+            self._breakers[provider.name] = CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                reset_timeout_s=self.reset_timeout_s,
+            )
+
+    def breaker(self, name: str) -> Optional[CircuitBreaker]:
+        return self._breakers.get(name)
+
+    def allow(self, name: str) -> bool:
+        breaker = self._breakers.get(name)
+        return breaker is None or breaker.allow_request()
+
+    def is_healthy(self, name: str) -> bool:
+        """Non-blocking view of the last known state (no probe, no side effects)."""
+        breaker = self._breakers.get(name)
+        return breaker is None or breaker.state == CircuitState.CLOSED
+
+    def record_success(self, name: str) -> None:
+        self._record(name, ok=True)
+
+    def record_failure(self, name: str, error: str = "") -> None:
+        self._record(name, ok=False, error=error)
+
+    def _record(
+        self, name: str, ok: bool, error: str = "", probe: bool = False
+    ) -> None:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            return
+        old = breaker.state
+        if probe:
+            new = breaker.record_probe(ok, error)
+        elif ok:
+            new = breaker.record_success()
+        else:
+            new = breaker.record_failure(error)
+        if new != old and self.event_bus is not None:
+            self.event_bus.emit(
+                "provider.health",
+                {"provider": name, "old": old.value, "new": new.value, "error": error},
+            )
+
+    async def probe(self, name: str) -> bool:
+        """Probe one provider now and feed the result into its breaker.
+
+        Probe results only feed the breaker's probe state; see CircuitBreaker.
+        """
+        provider = self._providers[name]
+        try:
+            ok = await asyncio.wait_for(
+                provider.check_health(), timeout=self.probe_timeout_s
+            )
+            error = "" if ok else "probe failed"
+        except asyncio.TimeoutError:
+            ok, error = False, "probe timeout"
+        except Exception as e:
+            ok, error = False, str(e)
+        self._last_probe[name] = time.time()
+        self._record(name, ok=ok, error=error, probe=True)
+        return ok
+
+    async def probe_all(self) -> dict[str, bool]:
+        names = list(self._providers)
+        results = await asyncio.gather(*(self.probe(n) for n in names))
+        return dict(zip(names, results))
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe_all()
+            await asyncio.sleep(self.interval_s)
+
+    def start(self) -> None:
+        """Start background probing on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: {**breaker.to_dict(), "last_probe": self._last_probe.get(name)}
+            for name, breaker in self._breakers.items()
+        }
@@ -0,0 +1,85 @@
+"""Per-key latency tracking (EWMA + percentiles) for WANDA Voice Core."""
+
+from __future__ import annotations
+import math
+import threading
+from collections import deque
+from typing import Optional
+
+
+class LatencyStats:
+    """Rolling latency distribution for a single key (e.g. a model).
+
+    A censored sample is a lower bound (e.g. the timeout of a call that
+    never answered). It enters the window like any other sample so that
+    timeouts pull the percentiles up instead of vanishing from them.
+    """
+
+    def __init__(self, window: int = 200, alpha: float = 0.2):
+        self.alpha = alpha
+        self.ewma: Optional[float] = None
+        self.count = 0
+        self.censored = 0
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float, censored: bool = False) -> None:
+        self.count += 1
+        if censored:
+            self.censored += 1
+        self._samples.append(seconds)
+        if self.ewma is None:
+            self.ewma = seconds
+        else:
+            self.ewma = self.alpha * seconds + (1 - self.alpha) * self.ewma
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile over the sample window (q in 0..1)."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        return {
+            "count": self.count,
+            "censored": self.censored,
+            "ewma_s": round(self.ewma, 3) if self.ewma is not None else None,
+            "p50_s": self.percentile(0.5),
+            "p90_s": self.percentile(0.9),
+            "p99_s": self.percentile(0.99),
+        }
+
+
+class LatencyTracker:
+    """Thread-safe collection of LatencyStats keyed by name."""
+
+    def __init__(self, window: int = 200, alpha: float = 0.2):
+        self.window = window
+        self.alpha = alpha
+        self._stats: dict[str, LatencyStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float, censored: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = LatencyStats(window=self.window, alpha=self.alpha)
+                self._stats[key] = stats
+            stats.add(seconds, censored)
+
+    def get(self, key: str) -> Optional[LatencyStats]:
+        with self._lock:
+            return self._stats.get(key)
+
+    def percentile(self, key: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """Return the q-percentile for key, or None with too few samples."""
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None or len(stats._samples) < min_samples:
+                return None
+            return stats.percentile(q)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self._stats.items()}
@@ -0,0 +1,272 @@
+"""Compiled keyword matching for voice commands.
+
+A CommandMatcher is built once from a keyword table ({label: [phrases]})
+and answers every lookup with dict probes over the input's token windows
+plus a BK-tree search for typos, so the cost depends on the input length
+and the longest phrase, not on how many keywords the table holds.
+
+When several phrases match, the one listed first wins (earlier label,
+then earlier phrase within it), as with the nested loops this replaces.
+"""
+
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from typing import Any, Container, Iterable, Mapping, Optional
+
+_TOKEN = re.compile(r"\w+")
+
+# Kölner Phonetik
+_UMLAUTS = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "s"})
+_VOWELS = set("aeijouy")
+_SIMPLE_CODES = {
+    "b": "1",
+    "f": "3",
+    "v": "3",
+    "w": "3",
+    "g": "4",
+    "k": "4",
+    "q": "4",
+    "l": "5",
+    "m": "6",
+    "n": "6",
+    "r": "7",
+    "s": "8",
+    "z": "8",
+}
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            )
+        previous = current
+    return previous[-1]
+
+
+def similarity(a: str, b: str, distance: Optional[int] = None) -> float:
+    """1.0 for equal strings, 0.0 when every character differs."""
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    if distance is None:
+        distance = levenshtein(a, b)
+    return 1.0 - distance / longest
+
+
+def koelner_phonetik(word: str) -> str:
+    """Kölner Phonetik code of a German word ("Wanda" -> "362")."""
+    word = "".join(c for c in word.lower().translate(_UMLAUTS) if c.isalpha())
+    codes = []
+    for i, c in enumerate(word):
+        prev = word[i - 1] if i else ""
+        nxt = word[i + 1] if i + 1 < len(word) else ""
+        if c in _VOWELS:
+            code = "0"
+        elif c == "h":
+            code = ""
+        elif c == "p":
+            code = "3" if nxt == "h" else "1"
+        elif c in "dt":
+            code = "8" if nxt in ("c", "s", "z") else "2"
+        elif c == "c":
+            if i == 0:
+                code = "4" if nxt and nxt in "ahkloqrux" else "8"
+            elif nxt and nxt in "ahkoqux" and prev not in ("s", "z"):
+                code = "4"
+            else:
+                code = "8"
+        elif c == "x":
+            code = "8" if prev in ("c", "k", "q") else "48"
+        else:
+            code = _SIMPLE_CODES.get(c, "")
+        codes.append(code)
+
+    collapsed = []
+    for code in "".join(codes):
+        if not collapsed or collapsed[-1] != code:
+            collapsed.append(code)
+    if not collapsed:
+        return ""
+    return collapsed[0] + "".join(c for c in collapsed[1:] if c != "0")
+
+
+class BKTree:
+    """Burkhard-Keller tree over Levenshtein distance."""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root: Optional[tuple[str, dict[int, Any]]] = None
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            self.size = 1
+            return
+        node = self._root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, radius: int) -> list[tuple[int, str]]:
+        """All (distance, word) pairs within radius of word."""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= radius:
+                found.append((distance, node_word))
+            for d in range(max(1, distance - radius), distance + radius + 1):
+                child = children.get(d)
+                if child is not None:
+                    stack.append(child)
+        return found
+
+
+@dataclass(frozen=True)
+class Match:
+    label: Any
+    keyword: str
+    kind: str
+    score: float = 1.0
+
+
+class CommandMatcher:
+    """Keyword table compiled for exact, token-window and fuzzy lookup.
+
+    Kinds accepted by find():
+        exact       the whole input is a phrase
+        prefix      the input starts with a phrase (whole tokens)
+        suffix      the input ends with a phrase (whole tokens)
+        contains    a phrase appears anywhere (whole tokens)
+        fuzzy       the whole input is within min_score of a phrase
+        fuzzy_word  a single input token is within word_min_score of a phrase
+        phonetic    a single input token sounds like a one-word phrase
+                    (needs phonetic=True)
+    """
+
+    def __init__(
+        self,
+        table: Mapping[Any, Iterable[str]],
+        fuzzy_min_len: int = 4,
+        phonetic: bool = False,
+        min_phonetic_len: int = 3,
+    ):
+        self.fuzzy_min_len = fuzzy_min_len
+        self._phrases: dict[str, tuple[tuple[int, int], Any]] = {}
+        for label_rank, (label, phrases) in enumerate(table.items()):
+            for phrase_rank, phrase in enumerate(phrases):
+                key = " ".join(tokenize(phrase))
+                if key and key not in self._phrases:
+                    self._phrases[key] = ((label_rank, phrase_rank), label)
+        self._max_tokens = max((k.count(" ") + 1 for k in self._phrases), default=0)
+        self._max_len = max(map(len, self._phrases), default=0)
+        self._tree = BKTree(k for k in self._phrases if len(k) >= fuzzy_min_len)
+
+        self._codes: dict[str, list[str]] = {}
+        if phonetic:
+            for key in self._phrases:
+                code = koelner_phonetik(key)
+                if " " not in key and len(code) >= min_phonetic_len:
+                    self._codes.setdefault(code, []).append(key)
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def find(
+        self,
+        text: str,
+        kinds: Iterable[str] = ("exact",),
+        min_score: float = 0.8,
+        word_min_score: Optional[float] = None,
+        phonetic_min_score: float = 0.0,
+        labels: Optional[Container] = None,
+    ) -> Optional[Match]:
+        """Best match of the given kinds, or None.
+
+        min_score applies to "fuzzy" (and to "fuzzy_word" unless
+        word_min_score is given); scores are 1 - edit distance / length.
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return None
+        kinds = set(kinds)
+        joined = " ".join(tokens)
+        candidates: list[tuple[str, str, float]] = []
+
+        if "exact" in kinds and joined in self._phrases:
+            candidates.append((joined, "exact", 1.0))
+        if kinds & {"prefix", "suffix", "contains"}:
+            candidates.extend(self._windows(tokens, kinds))
+        if "fuzzy" in kinds and len(joined) * min_score <= self._max_len:
+            candidates.extend(self._fuzzy(joined, min_score, "fuzzy"))
+        if "fuzzy_word" in kinds:
+            word_score = min_score if word_min_score is None else word_min_score
+            for token in set(tokens):
+                if len(token) >= self.fuzzy_min_len:
+                    candidates.extend(self._fuzzy(token, word_score, "fuzzy_word"))
+        if "phonetic" in kinds and self._codes:
+            for token in set(tokens):
+                for key in self._codes.get(koelner_phonetik(token), ()):
+                    score = similarity(token, key)
+                    if score >= phonetic_min_score:
+                        candidates.append((key, "phonetic", score))
+
+        best = None
+        for key, kind, score in candidates:
+            rank, label = self._phrases[key]
+            if labels is not None and label not in labels:
+                continue
+            if best is None or rank < best[0]:
+                best = (rank, Match(label, key, kind, score))
+        return best[1] if best else None
+
+    def _windows(self, tokens: list[str], kinds: set[str]):
+        count = len(tokens)
+        anywhere = "contains" in kinds
+        for size in range(1, min(self._max_tokens, count) + 1):
+            starts = range(count - size + 1) if anywhere else {0, count - size}
+            for start in starts:
+                if start == 0 and "prefix" in kinds:
+                    kind = "prefix"
+                elif start + size == count and "suffix" in kinds:
+                    kind = "suffix"
+                elif anywhere:
+                    kind = "contains"
+                else:
+                    continue
+                key = " ".join(tokens[start:start + size])
+                if key in self._phrases:
+                    yield key, kind, 1.0
+
+    def _fuzzy(self, text: str, min_score: float, kind: str):
+        # similarity >= min_score bounds the edit distance
+        radius = int((1.0 - min_score) * len(text) / min_score + 1e-9)
+        if radius < 1:
+            return
+        for distance, key in self._tree.search(text, radius):
+            score = similarity(text, key, distance)
+            if score >= min_score:
+                yield key, kind, score
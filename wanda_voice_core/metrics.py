@@ -0,0 +1,226 @@
+"""Metrics registry (histograms + counters) for WANDA Voice Core.
+
+Latencies go into fixed-bucket histograms, so recording is O(buckets) with
+no per-sample storage, and p50/p95/p99 are estimated from the buckets the
+same way Prometheus' histogram_quantile does. render_prometheus() emits
+the text exposition format served at GET /v1/metrics.
+"""
+
+from __future__ import annotations
+import bisect
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+# Seconds; covers cache hits through slow cloud calls
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0,
+)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+# Metric names used by the engine
+STAGE_SECONDS = "wanda_stage_duration_seconds"
+PROVIDER_SECONDS = "wanda_provider_duration_seconds"
+ROUTES_TOTAL = "wanda_routes_total"
+FALLBACKS_TOTAL = "wanda_provider_fallbacks_total"
+CACHE_HITS_TOTAL = "wanda_cache_hits_total"
+CACHE_MISSES_TOTAL = "wanda_cache_misses_total"
+ERRORS_TOTAL = "wanda_errors_total"
+
+
+class Histogram:
+    """Fixed-bucket histogram for one label set."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0..1) by interpolating inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                upper = self.bounds[i]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+    def to_dict(self) -> dict[str, Any]:
+        def ms(v: Optional[float]) -> Optional[float]:
+            return round(v * 1000, 1) if v is not None else None
+
+        return {
+            "count": self.count,
+            "avg_ms": ms(self.sum / self.count) if self.count else None,
+            "p50_ms": ms(self.percentile(0.5)),
+            "p95_ms": ms(self.percentile(0.95)),
+            "p99_ms": ms(self.percentile(0.99)),
+        }
+
+
+class _Timer:
+    __slots__ = ("_registry", "_name", "_labels", "_start", "elapsed")
+
+    def __init__(self, registry: "MetricsRegistry", name: str, labels: dict[str, str]):
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+        self.elapsed = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.elapsed = time.perf_counter() - self._start
+        self._registry.observe(self._name, self.elapsed, **self._labels)
+
+
+class MetricsRegistry:
+    """Thread-safe registry of labelled histograms and counters."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: dict[str, dict[LabelKey, Histogram]] = {}
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._help: dict[str, str] = {}
+        self._collectors: list[Callable[[], Iterable[tuple[str, dict[str, str], float]]]] = []
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram(self.buckets)
+            hist.observe(value)
+
+    def timer(self, name: str, **labels: str) -> _Timer:
+        """Context manager observing the block's wall time in seconds."""
+        return _Timer(self, name, labels)
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def register_collector(
+        self, fn: Callable[[], Iterable[tuple[str, dict[str, str], float]]]
+    ) -> None:
+        """Add a callable yielding (counter_name, labels, value) at scrape time,
+        for counters kept elsewhere (e.g. lru_cache statistics)."""
+        self._collectors.append(fn)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        with self._lock:
+            return self._histograms.get(name, {}).get(_label_key(labels))
+
+    def counter(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def _collected(self) -> dict[str, dict[LabelKey, float]]:
+        collected: dict[str, dict[LabelKey, float]] = {}
+        for fn in self._collectors:
+            try:
+                for name, labels, value in fn():
+                    collected.setdefault(name, {})[_label_key(labels)] = value
+            except Exception as e:
+                print(f"[Metrics] Collector failed: {e}")
+        return collected
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-friendly view with percentile estimates per series."""
+        collected = self._collected()
+        with self._lock:
+            histograms = {
+                name: {_label_str(key): hist.to_dict() for key, hist in series.items()}
+                for name, series in self._histograms.items()
+            }
+            counters = {
+                name: {_label_str(key): value for key, value in series.items()}
+                for name, series in self._counters.items()
+            }
+        for name, series in collected.items():
+            counters[name] = {_label_str(key): value for key, value in series.items()}
+        return {"histograms": histograms, "counters": counters}
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        collected = self._collected()
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                self._header(lines, name, "histogram")
+                for key, hist in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, n in zip(hist.bounds, hist.counts):
+                        cumulative += n
+                        lines.append(
+                            f"{name}_bucket{_render_labels(key, le=_fmt(bound))} {cumulative}"
+                        )
+                    lines.append(
+                        f"{name}_bucket{_render_labels(key, le='+Inf')} {hist.count}"
+                    )
+                    lines.append(f"{name}_sum{_render_labels(key)} {_fmt(hist.sum)}")
+                    lines.append(f"{name}_count{_render_labels(key)} {hist.count}")
+            counters = {name: dict(series) for name, series in self._counters.items()}
+        for name, series in collected.items():
+            counters.setdefault(name, {}).update(series)
+        for name in sorted(counters):
+            self._header(lines, name, "counter")
+            for key, value in sorted(counters[name].items()):
+                lines.append(f"{name}{_render_labels(key)} {_fmt(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines: list[str], name: str, kind: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _label_str(key: LabelKey) -> str:
+    return ",".join(f"{k}={v}" for k, v in key) or "_"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_labels(key: LabelKey, **extra: str) -> str:
+    items = list(key) + list(extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def _fmt(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
@@ -2,13 +2,40 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Optional
+
+# Receives response text deltas of the request being sent in this context;
+# bound by the engine when someone listens for response.delta events
+_delta_sink: ContextVar[Optional[Callable[[str], None]]] = ContextVar(
+    "wanda_delta_sink", default=None
+)
+
+
+def current_delta_sink() -> Optional[Callable[[str], None]]:
+    """Callback for response deltas of the current request, if any."""
+    return _delta_sink.get()
+
+
+def use_delta_sink(sink: Optional[Callable[[str], None]]) -> Token:
+    """Bind sink to the current context; pass the token to release_delta_sink."""
+    return _delta_sink.set(sink)
+
+
+def release_delta_sink(token: Token) -> None:
+    _delta_sink.reset(token)
 
 
 class ProviderBase(ABC):
     """Abstract base for LLM providers."""
 
     name: str = "base"
+    # Optional EventBus, attached by WandaVoiceEngine.set_providers
+    event_bus: Any = None
+    # False when the last send() returned a failure message instead of an answer
+    last_send_ok: bool = True
+    # True if send() passes text deltas to current_delta_sink() as they arrive
+    streams: bool = False
 
     @abstractmethod
     async def send(self, prompt: str, context: Optional[str] = None) -> str:
@@ -20,6 +47,16 @@ class ProviderBase(ABC):
         """Check if provider is reachable."""
         ...
 
+    async def check_health(self) -> bool:
+        """Async health probe (default: run is_available in a worker thread)."""
+        import asyncio
+        return await asyncio.to_thread(self.is_available)
+
+    def _emit(self, event_type: str, data: dict[str, Any]) -> None:
+        """Emit a provider event if an EventBus is attached."""
+        if self.event_bus is not None:
+            self.event_bus.emit(event_type, {"provider": self.name, **data})
+
     def send_sync(self, prompt: str, context: Optional[str] = None) -> str:
         """Synchronous send (default: run async in new loop)."""
         import asyncio
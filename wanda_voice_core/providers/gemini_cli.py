@@ -6,12 +6,23 @@ import subprocess
 import time
 from typing import Optional
 
+from wanda_voice_core.latency import LatencyTracker
 from wanda_voice_core.providers.base import ProviderBase
-from wanda_voice_core.token_economy import truncate_to_budget, MAX_CONTEXT_CHARS
+from wanda_voice_core.providers.gemini_pool import GeminiProcessPool
+from wanda_voice_core.context_packer import ContextPacker, Priority, Segment
+from wanda_voice_core.sessions import current_session
+from wanda_voice_core.token_economy import MAX_CONTEXT_TOKENS
+from wanda_voice_core.tracing import instant, span
 
 
 class GeminiCLIProvider(ProviderBase):
-    """LLM provider using Gemini CLI with retry/timeout/fallback."""
+    """LLM provider using Gemini CLI with retry/timeout/fallback.
+
+    With hedging enabled, the fallback chain (fallback model, then local
+    Ollama) is started in parallel once the primary model has been running
+    longer than its observed p90 latency. The first answer wins and the
+    slower call is cancelled.
+    """
 
     name = "gemini_cli"
 
@@ -24,6 +35,13 @@ class GeminiCLIProvider(ProviderBase):
         fallback_model: Optional[str] = "pro",
         local_fallback: bool = True,
         local_model: str = "qwen3:8b",
+        hedge: bool = True,
+        hedge_percentile: float = 0.9,
+        hedge_initial_delay: float = 20.0,
+        hedge_min_delay: float = 3.0,
+        hedge_min_samples: int = 5,
+        pool_size: int = 0,
+        pool_max_idle_s: float = 600.0,
     ):
         self.model = model
         self.gemini_path = gemini_path
@@ -34,10 +52,28 @@ class GeminiCLIProvider(ProviderBase):
         self.local_model = local_model
         self._local_provider: Optional[ProviderBase] = None
         self.history: list[dict[str, str]] = []
+        self.packer = ContextPacker(max_tokens=MAX_CONTEXT_TOKENS)
+        self.recent_messages = 4
         self._available: Optional[bool] = None
+        self._available_at = 0.0
+        self.availability_ttl_s = 60.0
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_initial_delay = hedge_initial_delay
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.latency = LatencyTracker()
+        self._pool: Optional[GeminiProcessPool] = None
+        if pool_size > 0:
+            self._pool = GeminiProcessPool(
+                gemini_path=gemini_path, size=pool_size, max_idle_s=pool_max_idle_s
+            )
 
     def is_available(self) -> bool:
-        if self._available is not None:
+        if (
+            self._available is not None
+            and time.monotonic() - self._available_at < self.availability_ttl_s
+        ):
             return self._available
         try:
             result = subprocess.run(
@@ -49,46 +85,173 @@ class GeminiCLIProvider(ProviderBase):
             self._available = result.returncode == 0
         except Exception:
             self._available = False
+        self._available_at = time.monotonic()
+        return self._available
+
+    async def check_health(self) -> bool:
+        """Probe the CLI without blocking the event loop."""
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.gemini_path,
+                "--version",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await asyncio.wait_for(proc.wait(), timeout=5)
+            self._available = proc.returncode == 0
+        except asyncio.TimeoutError:
+            self._available = False
+            if proc and proc.returncode is None:
+                proc.kill()
+        except Exception:
+            self._available = False
+        self._available_at = time.monotonic()
         return self._available
 
     async def send(self, prompt: str, context: Optional[str] = None) -> str:
         """Send prompt with retry logic and fallback."""
+        # Packed to the token budget by priority; the question always survives
         full_prompt = self._build_prompt(prompt, context)
-        # Enforce token budget
-        full_prompt = truncate_to_budget(full_prompt, MAX_CONTEXT_CHARS)
 
-        # Try primary model with retries
+        if self.hedge and (self.fallback_model or self.local_fallback):
+            result = await self._send_hedged(full_prompt, prompt, context)
+        else:
+            result = await self._call_with_retries(full_prompt)
+            if result is None:
+                result = await self._call_fallbacks(full_prompt, prompt, context)
+
+        if result is not None:
+            self.last_send_ok = True
+            self._update_history(prompt, result)
+            return result
+        self.last_send_ok = False
+        return "Gemini ist gerade nicht erreichbar. Bitte versuche es nochmal."
+
+    async def _call_with_retries(self, prompt: str) -> Optional[str]:
+        """Call the primary model, retrying with growing timeouts."""
         for attempt in range(self.max_retries + 1):
             current_timeout = self.timeout + (attempt * 30)
-            result = await self._call_gemini(self.model, full_prompt, current_timeout)
+            result = await self._call_gemini(self.model, prompt, current_timeout)
             if result is not None:
-                self._update_history(prompt, result)
                 return result
 
             if attempt < self.max_retries:
                 wait = 2 ** (attempt + 1)  # 2s, 4s
                 print(f"[Gemini] Retry in {wait}s...")
+                instant("gemini.retry", cat="provider", attempt=attempt + 1, wait_s=wait)
                 await asyncio.sleep(wait)
+        return None
 
-        # Try fallback model
+    async def _call_fallbacks(
+        self, full_prompt: str, prompt: str, context: Optional[str] = None
+    ) -> Optional[str]:
+        """Try the fallback model, then local Ollama."""
         if self.fallback_model:
             print(f"[Gemini] Trying fallback: {self.fallback_model}")
             result = await self._call_gemini(
                 self.fallback_model, full_prompt, self.timeout + 60
             )
             if result is not None:
-                self._update_history(prompt, result)
                 return result
 
         if self.local_fallback:
-            local_result = await self._try_local_fallback(full_prompt)
-            if local_result is not None:
-                self._update_history(prompt, local_result)
-                return local_result
+            return await self._try_local_fallback(prompt, context)
+        return None
 
-        return "Gemini ist gerade nicht erreichbar. Bitte versuche es nochmal."
+    def hedge_delay(self) -> tuple[float, str]:
+        """Seconds to wait for the primary before hedging, and why."""
+        observed = self.latency.percentile(
+            self.model, self.hedge_percentile, min_samples=self.hedge_min_samples
+        )
+        if observed is None:
+            delay, reason = self.hedge_initial_delay, "initial"
+        else:
+            delay, reason = observed, f"p{int(self.hedge_percentile * 100)}"
+        return max(self.hedge_min_delay, min(delay, float(self.timeout))), reason
 
-    async def _try_local_fallback(self, prompt: str) -> Optional[str]:
+    async def _send_hedged(
+        self, full_prompt: str, prompt: str, context: Optional[str] = None
+    ) -> Optional[str]:
+        """Race the primary against the fallback chain after the hedge delay."""
+        primary = asyncio.create_task(
+            self._call_with_retries(full_prompt), name="gemini-primary"
+        )
+        delay, reason = self.hedge_delay()
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+
+        if primary in done:
+            result = primary.result()
+            if result is not None:
+                return result
+            self._emit(
+                "provider.hedge",
+                {"model": self.model, "decision": "primary_failed", "delay_s": 0.0},
+            )
+            return await self._call_fallbacks(full_prompt, prompt, context)
+
+        hedge_target = self.fallback_model or f"ollama:{self.local_model}"
+        print(f"[Gemini] Hedging after {delay:.1f}s ({reason}) -> {hedge_target}")
+        instant("gemini.hedge", cat="provider", hedge_to=hedge_target, delay_s=delay)
+        self._emit(
+            "provider.hedge",
+            {
+                "model": self.model,
+                "decision": "hedge",
+                "hedge_to": hedge_target,
+                "delay_s": round(delay, 2),
+                "reason": reason,
+            },
+        )
+        hedge = asyncio.create_task(
+            self._call_fallbacks(full_prompt, prompt, context), name="gemini-hedge"
+        )
+        return await self._race({"primary": primary, "hedge": hedge})
+
+    async def _race(self, tasks: dict[str, asyncio.Task]) -> Optional[str]:
+        """Return the first non-empty result and cancel the remaining tasks."""
+        names = {task: name for name, task in tasks.items()}
+        pending = set(tasks.values())
+        winner: Optional[str] = None
+        result: Optional[str] = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    if task.result() is not None:
+                        winner, result = names[task], task.result()
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        self._emit(
+            "provider.hedge_result",
+            {
+                "winner": winner,
+                "cancelled": [names[task] for task in pending],
+            },
+        )
+        return result
+
+    async def _try_local_fallback(
+        self, prompt: str, context: Optional[str] = None
+    ) -> Optional[str]:
+        """Answer via local Ollama using /api/chat with our own history.
+
+        The history is sent as chat messages (not the flattened Gemini
+        prompt) so Ollama can reuse the KV cache of the unchanged prefix.
+        """
         try:
             from wanda_voice_core.providers.ollama import OllamaProvider
 
@@ -96,15 +259,38 @@ class GeminiCLIProvider(ProviderBase):
                 print(f"[Gemini] Initializing local fallback: {self.local_model}")
                 self._local_provider = OllamaProvider(model=self.local_model)
 
-            if self._local_provider.is_available():
-                print(f"[Gemini] Using local fallback (Ollama)")
-                return await self._local_provider.send(prompt)
+            with span("gemini.local_fallback", cat="provider") as sp:
+                if await self._local_provider.check_health():
+                    print(f"[Gemini] Using local fallback (Ollama)")
+                    messages = []
+                    if context:
+                        messages.append({"role": "system", "content": context})
+                    messages.extend(self._history()[-24:])
+                    messages.append({"role": "user", "content": prompt})
+                    reply = await self._local_provider.chat(messages)
+                    sp.set(ok=self._local_provider.last_send_ok)
+                    if self._local_provider.last_send_ok:
+                        return reply
+                else:
+                    sp.set(ok=False, reason="unhealthy")
         except Exception as e:
             print(f"[Gemini] Local fallback error: {e}")
         return None
 
     async def _call_gemini(
         self, model: str, prompt: str, timeout: int
+    ) -> Optional[str]:
+        """Run one prompt on the CLI (pooled worker or fresh subprocess)."""
+        with span("gemini.call", cat="provider", model=model, timeout_s=timeout) as sp:
+            if self._pool is not None:
+                result = await self._call_gemini_pooled(model, prompt, timeout)
+            else:
+                result = await self._call_gemini_subprocess(model, prompt, timeout)
+            sp.set(ok=result is not None)
+            return result
+
+    async def _call_gemini_subprocess(
+        self, model: str, prompt: str, timeout: int
     ) -> Optional[str]:
         """Execute Gemini CLI command securely via stdin to avoid process list leaks."""
         proc = None
@@ -129,15 +315,27 @@ class GeminiCLIProvider(ProviderBase):
                 if stderr:
                     print(f"[Gemini] stderr: {stderr.decode().strip()[:200]}")
                 print(f"[Gemini] ok ({elapsed}s, {len(stdout)} bytes)")
+                self.latency.record(model, elapsed)
                 return stdout.decode().strip()
             print(f"[Gemini] Error: {stderr.decode().strip()[:200]}")
         except asyncio.TimeoutError:
             print(f"[Gemini] Timeout ({timeout}s)")
+            # Censored at the timeout: the answer would have taken longer
+            self.latency.record(model, float(timeout), censored=True)
             try:
                 if proc:
                     proc.kill()
+                    await asyncio.wait_for(proc.wait(), timeout=5)
             except Exception:
                 pass
+        except asyncio.CancelledError:
+            # Lost a hedge race or the caller gave up: don't leak the process
+            try:
+                if proc and proc.returncode is None:
+                    proc.kill()
+            except Exception:
+                pass
+            raise
         except FileNotFoundError:
             print(f"[Gemini] Binary not found: {self.gemini_path}")
             self._available = False
@@ -145,19 +343,88 @@ class GeminiCLIProvider(ProviderBase):
             print(f"[Gemini] Exception: {e}")
         return None
 
+    async def _call_gemini_pooled(
+        self, model: str, prompt: str, timeout: int
+    ) -> Optional[str]:
+        """Execute the prompt on a pre-spawned worker from the process pool."""
+        try:
+            started = time.time()
+            with span("gemini.pool", cat="provider", model=model) as sp:
+                res = await self._pool.run(model, prompt.encode(), timeout)
+                sp.set(**res.to_dict())
+            elapsed = round(time.time() - started, 2)
+            self._emit("provider.pool", {"model": model, **res.to_dict()})
+            if res.returncode == 0:
+                if res.stderr:
+                    print(f"[Gemini] stderr: {res.stderr.decode().strip()[:200]}")
+                saved = f", saved ~{res.saved_s:.2f}s" if res.saved_s else ""
+                print(
+                    f"[Gemini] ok ({elapsed}s, {len(res.stdout)} bytes, "
+                    f"{'warm' if res.warm else 'cold'}{saved})"
+                )
+                self.latency.record(model, elapsed)
+                return res.stdout.decode().strip()
+            print(f"[Gemini] Error: {res.stderr.decode().strip()[:200]}")
+        except asyncio.TimeoutError:
+            print(f"[Gemini] Timeout ({timeout}s)")
+            # Censored at the timeout: the answer would have taken longer
+            self.latency.record(model, float(timeout), censored=True)
+        except FileNotFoundError:
+            print(f"[Gemini] Binary not found: {self.gemini_path}")
+            self._available = False
+        except Exception as e:
+            print(f"[Gemini] Exception: {e}")
+        return None
+
+    async def warm_pool(self) -> None:
+        """Pre-spawn pool workers for the primary and fallback models."""
+        if self._pool is None:
+            return
+        await self._pool.warm(self.model)
+        if self.fallback_model:
+            await self._pool.warm(self.fallback_model)
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+
     def _build_prompt(self, prompt: str, context: Optional[str] = None) -> str:
-        parts = []
-        if context:
-            parts.append(context)
-        if self.history:
-            history_str = "\n".join(
-                f"{m['role']}: {m['content']}" for m in self.history[-24:]
+        # The session summary (which the engine also hands over as context)
+        # ranks below recent turns; any other context is a system prompt
+        session = current_session()
+        summary = session.summary if session is not None else ""
+        segments: list[Segment] = []
+        if context and context != summary:
+            segments.append(Segment(context, Priority.SYSTEM, "context"))
+        if summary:
+            segments.append(
+                Segment(
+                    f"Earlier in this conversation:\n{summary}",
+                    Priority.SUMMARY,
+                    "summary",
+                )
+            )
+        history = self._history()[-24:]
+        for idx, m in enumerate(history):
+            recent = idx >= len(history) - self.recent_messages
+            segments.append(
+                Segment(
+                    f"{m['role']}: {m['content']}",
+                    Priority.RECENT if recent else Priority.OLDER,
+                    "history",
+                )
             )
-            parts.append(history_str)
-        parts.append(f"User: {prompt}")
-        return "\n\n".join(parts)
+        segments.append(Segment(f"User: {prompt}", Priority.PROMPT, "prompt"))
+        return self.packer.pack_text(segments)
+
+    def _history(self) -> list[dict[str, str]]:
+        """History of the current session, or the provider's own."""
+        session = current_session()
+        return session.history if session is not None else self.history
 
     def _update_history(self, prompt: str, response: str) -> None:
+        if current_session() is not None:
+            return  # the engine records the turn in the session
         self.history.append({"role": "user", "content": prompt})
         self.history.append({"role": "assistant", "content": response})
         # Trim to max turns
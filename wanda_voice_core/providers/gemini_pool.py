@@ -0,0 +1,271 @@
+"""Warm process pool for the Gemini CLI provider.
+
+Each worker is a ``gemini <model> -`` process spawned ahead of time and
+blocked on stdin, so Node start-up and auth initialization overlap with
+the idle time before the next prompt. In ``-`` mode the CLI reads a single
+prompt until EOF, so workers are one-shot and replaced after every use.
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import signal
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from wanda_voice_core.latency import LatencyTracker
+
+
+@dataclass
+class PoolResult:
+    """Outcome of one prompt executed by the pool."""
+
+    returncode: Optional[int]
+    stdout: bytes
+    stderr: bytes
+    warm: bool
+    first_byte_s: float
+    saved_s: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "warm": self.warm,
+            "first_byte_s": round(self.first_byte_s, 3),
+            "saved_s": round(self.saved_s, 3) if self.saved_s is not None else None,
+        }
+
+
+@dataclass
+class _Worker:
+    proc: asyncio.subprocess.Process
+    spawned_at: float
+
+    def alive(self) -> bool:
+        return self.proc.returncode is None
+
+
+class GeminiProcessPool:
+    """Bounded pool of pre-spawned, stdin-driven Gemini CLI processes."""
+
+    def __init__(
+        self,
+        gemini_path: str = "gemini",
+        size: int = 1,
+        max_idle_s: float = 600.0,
+        health_interval_s: float = 30.0,
+    ):
+        self.gemini_path = gemini_path
+        self.size = max(0, size)
+        self.max_idle_s = max_idle_s
+        self.health_interval_s = health_interval_s
+        self.latency = LatencyTracker()
+        self._idle: dict[str, list[_Worker]] = {}
+        self._spawning: dict[str, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._procs: set[asyncio.subprocess.Process] = set()
+        self._health_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+
+    async def _spawn(self, model: str) -> _Worker:
+        proc = await asyncio.create_subprocess_exec(
+            self.gemini_path,
+            model,
+            "-",  # Read from stdin
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # Own process group, so kills reach the CLI's child processes too
+            start_new_session=True,
+        )
+        self._procs.add(proc)
+        return _Worker(proc=proc, spawned_at=time.monotonic())
+
+    def _bind_loop(self) -> None:
+        """Subprocess transports belong to one loop; drop workers from another."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            for workers in self._idle.values():
+                for worker in workers:
+                    _kill(worker.proc)
+            self._idle.clear()
+            self._spawning.clear()
+            self._tasks.clear()
+            self._procs.clear()
+            self._health_task = None
+            self._loop = loop
+
+    def health_check(self) -> int:
+        """Drop dead or stale idle workers and refill. Returns workers removed."""
+        removed = 0
+        now = time.monotonic()
+        for model, workers in self._idle.items():
+            keep = []
+            for worker in workers:
+                if worker.alive() and now - worker.spawned_at < self.max_idle_s:
+                    keep.append(worker)
+                else:
+                    _kill(worker.proc)
+                    removed += 1
+            self._idle[model] = keep
+        self._procs = {p for p in self._procs if p.returncode is None}
+        if self._loop is not None and not self._closed:
+            for model in list(self._idle):
+                self._replenish(model)
+        return removed
+
+    def _replenish(self, model: str) -> None:
+        missing = (
+            self.size - len(self._idle.get(model, [])) - self._spawning.get(model, 0)
+        )
+        for _ in range(max(0, missing)):
+            self._spawning[model] = self._spawning.get(model, 0) + 1
+            task = asyncio.get_running_loop().create_task(self._fill_one(model))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fill_one(self, model: str) -> None:
+        try:
+            worker = await self._spawn(model)
+        except Exception as e:
+            print(f"[GeminiPool] Pre-spawn failed: {e}")
+            return
+        finally:
+            self._spawning[model] = max(0, self._spawning.get(model, 0) - 1)
+        if self._closed:
+            _kill(worker.proc)
+            return
+        self._idle.setdefault(model, []).append(worker)
+
+    async def _health_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.health_interval_s)
+            try:
+                self.health_check()
+            except Exception as e:
+                print(f"[GeminiPool] Health check failed: {e}")
+
+    async def warm(self, model: str) -> None:
+        """Pre-spawn workers for model and start periodic health checks."""
+        self._bind_loop()
+        self._closed = False
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.get_running_loop().create_task(
+                self._health_loop()
+            )
+        self._replenish(model)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def _acquire(self, model: str) -> tuple[_Worker, bool]:
+        self._bind_loop()
+        self.health_check()
+        workers = self._idle.get(model, [])
+        worker = workers.pop(0) if workers else None
+        self._replenish(model)
+        if worker is not None:
+            return worker, True
+        return await self._spawn(model), False
+
+    async def run(self, model: str, prompt: bytes, timeout: float) -> PoolResult:
+        """Run one prompt on a warm (or, if none is ready, cold) worker.
+
+        Raises asyncio.TimeoutError after timeout; the worker is killed.
+        """
+        worker, warm = await self._acquire(model)
+        proc = worker.proc
+        try:
+            stdout, stderr, sent_at, first_byte_at = await asyncio.wait_for(
+                _communicate_timed(proc, prompt), timeout=timeout
+            )
+        except BaseException:
+            _kill(proc)
+            raise
+        finally:
+            if proc.returncode is not None:
+                self._procs.discard(proc)
+
+        first_byte_s = first_byte_at - sent_at
+        result = PoolResult(
+            returncode=proc.returncode,
+            stdout=stdout,
+            stderr=stderr,
+            warm=warm,
+            first_byte_s=first_byte_s,
+        )
+        if proc.returncode == 0 and stdout:
+            if warm:
+                self.latency.record("warm_first_byte", first_byte_s)
+                cold = self.latency.get("cold_first_byte")
+                if cold is not None and cold.ewma is not None:
+                    result.saved_s = max(0.0, cold.ewma - first_byte_s)
+            else:
+                # Cold workers pay spawn + init before the prompt is read
+                self.latency.record(
+                    "cold_first_byte", first_byte_at - worker.spawned_at
+                )
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "idle": {model: len(w) for model, w in self._idle.items()},
+            "latency": self.latency.snapshot(),
+        }
+
+    async def close(self) -> None:
+        """Stop health checks and kill and reap every process the pool spawned."""
+        self._closed = True
+        tasks = list(self._tasks)
+        if self._health_task is not None:
+            tasks.append(self._health_task)
+            self._health_task = None
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for proc in list(self._procs):
+            _kill(proc)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2)
+            except Exception:
+                pass
+        self._procs.clear()
+        self._idle.clear()
+        self._spawning.clear()
+
+
+async def _communicate_timed(
+    proc: asyncio.subprocess.Process, data: bytes
+) -> tuple[bytes, bytes, float, float]:
+    """Like Process.communicate, but also returns when the prompt was sent
+    and when the first output byte arrived (time.monotonic)."""
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    try:
+        proc.stdin.write(data)
+        await proc.stdin.drain()
+        proc.stdin.close()
+        sent = time.monotonic()
+        first = await proc.stdout.read(1)
+        first_byte_at = time.monotonic()
+        rest = await proc.stdout.read()
+        stderr = await stderr_task
+        await proc.wait()
+    finally:
+        if not stderr_task.done():
+            stderr_task.cancel()
+    return first + rest, stderr, sent, first_byte_at
+
+
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill the worker's whole process group (the CLI may fork children)."""
+    if proc.returncode is not None:
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except Exception:
+        try:
+            proc.kill()
+        except Exception:
+            pass
@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 import json
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from wanda_voice_core.providers.base import ProviderBase
-from wanda_voice_core.token_economy import truncate_to_budget, MAX_CONTEXT_CHARS
+from wanda_voice_core.providers.base import ProviderBase, current_delta_sink
+from wanda_voice_core.sessions import current_session
+from wanda_voice_core.tracing import span
+from wanda_voice_core.token_economy import (
+    truncate_to_budget,
+    MAX_CONTEXT_CHARS,
+    MAX_TURNS,
+)
 
 
 class OllamaProvider(ProviderBase):
-    """LLM provider using Ollama HTTP API."""
+    """LLM provider using Ollama HTTP API.
+
+    Conversations go through /api/chat with an append-only message list per
+    conversation id, and keep_alive holds the model (and its KV cache) in
+    memory between turns. Because the message prefix stays identical from
+    one turn to the next, Ollama only has to prefill the new turn.
+
+    When a delta sink is bound (see providers.base), the reply is streamed
+    and each chunk is passed to the sink as it arrives.
+    """
 
     name = "ollama"
+    streams = True
 
     def __init__(
         self,
@@ -19,12 +35,17 @@ class OllamaProvider(ProviderBase):
         api_url: str = "http://localhost:11434",
         timeout: int = 60,
         auto_start: bool = True,
+        keep_alive: str = "30m",
+        max_turns: int = MAX_TURNS,
     ):
         self.model = model
         self.api_url = api_url
         self.timeout = timeout
         self.auto_start = auto_start
+        self.keep_alive = keep_alive
+        self.max_turns = max_turns
         self._available: Optional[bool] = None
+        self._conversations: dict[str, list[dict[str, str]]] = {}
 
     def is_available(self) -> bool:
         try:
@@ -35,37 +56,131 @@ class OllamaProvider(ProviderBase):
             self._available = False
         return self._available
 
-    async def send(self, prompt: str, context: Optional[str] = None) -> str:
-        """Send prompt to Ollama."""
+    async def check_health(self) -> bool:
+        """Async probe of /api/tags (safe to call from the event loop)."""
         import aiohttp
 
-        full_prompt = prompt
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    f"{self.api_url}/api/tags",
+                    timeout=aiohttp.ClientTimeout(total=3),
+                ) as resp:
+                    self._available = resp.status == 200
+        except Exception:
+            self._available = False
+        return self._available
+
+    async def send(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        conversation_id: str = "default",
+    ) -> str:
+        """Send one user turn within a multi-turn conversation.
+
+        Inside an engine run the current session's history is used (and
+        recorded by the engine) instead of the conversation_id store.
+        """
+        session = current_session()
+        if session is not None:
+            history = session.history
+        else:
+            history = self._conversations.setdefault(conversation_id, [])
+        user_msg = {"role": "user", "content": prompt}
+        messages = list(history)
         if context:
-            full_prompt = truncate_to_budget(
-                f"{context}\n\nUser: {prompt}", MAX_CONTEXT_CHARS
+            messages.insert(
+                0,
+                {
+                    "role": "system",
+                    "content": truncate_to_budget(context, MAX_CONTEXT_CHARS),
+                },
             )
+        messages.append(user_msg)
+
+        reply = await self.chat(messages)
+        if self.last_send_ok and session is None:
+            history.append(user_msg)
+            history.append({"role": "assistant", "content": reply})
+            self._trim(history)
+        return reply
+
+    async def chat(self, messages: list[dict[str, str]]) -> str:
+        """POST a message list to /api/chat and return the reply text."""
+        import aiohttp
 
+        sink = current_delta_sink()
         payload: dict[str, Any] = {
             "model": self.model,
-            "prompt": full_prompt,
-            "stream": False,
+            "messages": messages,
+            "stream": sink is not None,
+            "keep_alive": self.keep_alive,
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/api/generate",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("response", "").strip()
-                    return f"Ollama error: HTTP {resp.status}"
+            with span(
+                "ollama.chat", cat="provider", model=self.model, messages=len(messages)
+            ) as sp:
+                async with aiohttp.ClientSession() as session:
+                    async with session.post(
+                        f"{self.api_url}/api/chat",
+                        json=payload,
+                        timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    ) as resp:
+                        sp.set(status=resp.status)
+                        if resp.status == 200 and sink is not None:
+                            reply = await self._read_stream(resp, sink)
+                            self.last_send_ok = True
+                            return reply
+                        if resp.status == 200:
+                            data = await resp.json()
+                            self.last_send_ok = True
+                            message = data.get("message") or {}
+                            return message.get("content", "").strip()
+                        self.last_send_ok = False
+                        return f"Ollama error: HTTP {resp.status}"
         except Exception as e:
             print(f"[Ollama] Error: {e}")
+            self.last_send_ok = False
             return f"Ollama nicht erreichbar: {e}"
 
+    @staticmethod
+    async def _read_stream(resp: Any, sink: Callable[[str], None]) -> str:
+        """Read /api/chat NDJSON chunks, passing each text delta to sink."""
+        parts: list[str] = []
+        async for line in resp.content:
+            if not line.strip():
+                continue
+            chunk = json.loads(line)
+            if chunk.get("error"):
+                raise RuntimeError(chunk["error"])
+            delta = (chunk.get("message") or {}).get("content", "")
+            if delta:
+                parts.append(delta)
+                sink(delta)
+            if chunk.get("done"):
+                break
+        return "".join(parts).strip()
+
+    def _trim(self, history: list[dict[str, str]]) -> None:
+        """Drop the oldest half in one step once the window is full.
+
+        Trimming a pair every turn would shift the prefix (and invalidate the
+        KV cache) on every request; halving keeps it stable for many turns.
+        """
+        max_msgs = self.max_turns * 2
+        if len(history) > max_msgs:
+            del history[: len(history) - self.max_turns]
+            if history and history[0]["role"] != "user":
+                del history[0]
+
+    def clear_history(self, conversation_id: Optional[str] = None) -> None:
+        if conversation_id is None:
+            self._conversations.clear()
+        else:
+            self._conversations.pop(conversation_id, None)
+
     async def generate_json(self, prompt: str, system: str = "",
                             model: Optional[str] = None) -> Optional[dict]:
         """Generate structured JSON response."""
@@ -76,6 +191,7 @@ class OllamaProvider(ProviderBase):
             "prompt": prompt,
             "stream": False,
             "format": "json",
+            "keep_alive": self.keep_alive,
             "options": {"temperature": 0.3, "num_predict": 512},
         }
         if system:
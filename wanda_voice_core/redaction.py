@@ -0,0 +1,92 @@
+"""Single-pass redaction of secrets and noise before prompts leave the box.
+
+All rules are compiled into one alternation and applied with a single
+re.sub, instead of one full pass per pattern. Before scanning, each
+rule's literal prefilter (e.g. "sk-", "-----BEGIN") is checked with a
+plain substring search, and rules whose literals are absent are left
+out of the scan; the combined pattern for each set of active rules is
+compiled once per Redactor.
+
+Rules must stay linear-time under Python's backtracking re: every
+variable-length part either has a constant bound or stops at a
+delimiter that also bounds where the next match can start. Unanchored
+character-class runs get a lookbehind so they are only tried at the
+start of a run, not at every position inside it.
+"""
+
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+@dataclass(frozen=True)
+class RedactionRule:
+    """One pattern and the placeholder that replaces its matches.
+
+    literals: the rule can only match if one of these substrings occurs
+    in the text (compared case-insensitively when ignore_case is set).
+    Empty means the rule is always scanned.
+    """
+
+    name: str
+    pattern: str
+    replacement: str
+    literals: tuple[str, ...] = ()
+    ignore_case: bool = False
+
+
+class Redactor:
+    """Applies a set of RedactionRules in one pass.
+
+    Where matches overlap, the leftmost wins; at the same position the
+    rule listed first wins.
+    """
+
+    def __init__(self, rules: Iterable[RedactionRule]):
+        self.rules = tuple(rules)
+        for rule in self.rules:
+            re.compile(rule.pattern)  # fail early on a broken rule
+        self._replacements = {
+            f"_r{i}": rule.replacement for i, rule in enumerate(self.rules)
+        }
+        self._literals = [
+            tuple(lit.lower() for lit in r.literals) if r.ignore_case else r.literals
+            for r in self.rules
+        ]
+        self._needs_lower = any(r.ignore_case and r.literals for r in self.rules)
+        self._scanners: dict[tuple[int, ...], Optional[re.Pattern]] = {}
+
+    def _active(self, text: str) -> tuple[int, ...]:
+        lowered = text.lower() if self._needs_lower else text
+        active = []
+        for i, rule in enumerate(self.rules):
+            haystack = lowered if rule.ignore_case else text
+            if not rule.literals or any(lit in haystack for lit in self._literals[i]):
+                active.append(i)
+        return tuple(active)
+
+    def _scanner(self, active: tuple[int, ...]) -> Optional[re.Pattern]:
+        if active not in self._scanners:
+            parts = []
+            for i in active:
+                rule = self.rules[i]
+                flags = "(?i:" if rule.ignore_case else "(?:"
+                parts.append(f"(?P<_r{i}>{flags}{rule.pattern}))")
+            self._scanners[active] = re.compile("|".join(parts)) if parts else None
+        return self._scanners[active]
+
+    def _replace(self, match: re.Match) -> str:
+        return self._replacements[match.lastgroup]
+
+    def redact(self, text: str) -> str:
+        scanner = self._scanner(self._active(text))
+        if scanner is None:
+            return text
+        return scanner.sub(self._replace, text)
+
+    def search(self, text: str) -> Optional[str]:
+        """Name of the first rule that matches, or None."""
+        scanner = self._scanner(self._active(text))
+        match = scanner.search(text) if scanner is not None else None
+        return self.rules[int(match.lastgroup[2:])].name if match else None
@@ -4,6 +4,7 @@ from __future__ import annotations
 import re
 from typing import Optional
 
+from wanda_voice_core.matcher import CommandMatcher
 from wanda_voice_core.schemas import RouterResult, RouteType
 
 
@@ -18,6 +19,8 @@ COMMAND_KEYWORDS: dict[str, list[str]] = {
     "resume": ["wanda weiter", "hey wanda", "resume"],
 }
 
+_COMMAND_MATCHER = CommandMatcher(COMMAND_KEYWORDS)
+
 # Intent keywords -> "refine" route (needs Ollama improvement)
 REFINE_KEYWORDS = [
     "brainstorm", "ideen", "optionen", "möglichkeiten", "vorschläge",
@@ -77,16 +80,15 @@ class IntentRouter:
 
     def _check_commands(self, text: str) -> Optional[RouterResult]:
         """Check for voice commands."""
-        for cmd_name, keywords in COMMAND_KEYWORDS.items():
-            for kw in keywords:
-                if text == kw or text.startswith(kw + " ") or text.endswith(" " + kw):
-                    return RouterResult(
-                        route=RouteType.COMMAND,
-                        confidence=0.95,
-                        command={"name": cmd_name, "keyword": kw},
-                        notes=f"command: {cmd_name}",
-                    )
-        return None
+        match = _COMMAND_MATCHER.find(text, ("exact", "prefix", "suffix"))
+        if match is None:
+            return None
+        return RouterResult(
+            route=RouteType.COMMAND,
+            confidence=0.95,
+            command={"name": match.label, "keyword": match.keyword},
+            notes=f"command: {match.label}",
+        )
 
     def _needs_refinement(self, text: str) -> bool:
         """Check if text contains refine-worthy keywords."""
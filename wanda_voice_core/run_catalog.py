@@ -0,0 +1,211 @@
+"""SQLite catalogue of runs for WANDA Voice Core.
+
+One row per finished run, so runs can be searched by route, provider,
+latency or error and expired without walking the run directory tree.
+"""
+
+from __future__ import annotations
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    started_at  REAL NOT NULL,
+    ended_at    REAL,
+    duration_ms REAL,
+    route       TEXT,
+    provider    TEXT,
+    latency_ms  REAL,
+    error       TEXT,
+    size_bytes  INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_latency ON runs (latency_ms);
+CREATE INDEX IF NOT EXISTS idx_runs_route ON runs (route, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_errors ON runs (started_at)
+    WHERE error IS NOT NULL;
+"""
+
+_COLUMNS = (
+    "run_id",
+    "started_at",
+    "ended_at",
+    "duration_ms",
+    "route",
+    "provider",
+    "latency_ms",
+    "error",
+    "size_bytes",
+)
+
+
+class RunCatalog:
+    """Thread-safe run index backed by a single SQLite file.
+
+    The database is opened on first use, so constructing a catalogue costs
+    nothing until a run actually ends.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def record(self, entry: dict[str, Any]) -> None:
+        """Insert or replace the row for entry["run_id"]."""
+        self.record_many([entry])
+
+    def record_many(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Insert or replace several rows in one transaction."""
+        rows = []
+        for entry in entries:
+            row = [entry.get(col) for col in _COLUMNS]
+            row[_COLUMNS.index("size_bytes")] = entry.get("size_bytes") or 0
+            rows.append(row)
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO runs ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({placeholders})",
+                    rows,
+                )
+
+    def known(self, run_ids: Iterable[str]) -> set[str]:
+        """The subset of run_ids that have a row."""
+        run_ids = list(run_ids)
+        found: set[str] = set()
+        with self._lock:
+            conn = self._connect()
+            # Stay well below SQLite's host parameter limit
+            for i in range(0, len(run_ids), 500):
+                chunk = run_ids[i:i + 500]
+                found.update(
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT run_id FROM runs WHERE run_id IN "
+                        f"({', '.join('?' for _ in chunk)})",
+                        chunk,
+                    )
+                )
+        return found
+
+    def _query(self, sql: str, params: tuple = ()) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    # --- Queries ---
+
+    def get(self, run_id: str) -> Optional[dict[str, Any]]:
+        rows = self._query("SELECT * FROM runs WHERE run_id = ?", (run_id,))
+        return rows[0] if rows else None
+
+    def slowest(self, n: int = 10) -> list[dict[str, Any]]:
+        return self._query(
+            "SELECT * FROM runs WHERE latency_ms IS NOT NULL "
+            "ORDER BY latency_ms DESC LIMIT ?",
+            (n,),
+        )
+
+    def errors(self, since_s: float = 3600.0, limit: int = 100) -> list[dict[str, Any]]:
+        """Runs that ended with an error in the last since_s seconds."""
+        return self._query(
+            "SELECT * FROM runs WHERE error IS NOT NULL AND started_at >= ? "
+            "ORDER BY started_at DESC LIMIT ?",
+            (time.time() - since_s, limit),
+        )
+
+    def by_route(self, route: str, limit: int = 100) -> list[dict[str, Any]]:
+        return self._query(
+            "SELECT * FROM runs WHERE route = ? ORDER BY started_at DESC LIMIT ?",
+            (route, limit),
+        )
+
+    def recent(self, limit: int = 20) -> list[dict[str, Any]]:
+        return self._query(
+            "SELECT * FROM runs ORDER BY started_at DESC LIMIT ?", (limit,)
+        )
+
+    def stats(self) -> dict[str, Any]:
+        rows = self._query(
+            "SELECT COUNT(*) AS runs, COALESCE(SUM(size_bytes), 0) AS size_bytes, "
+            "COUNT(error) AS errors FROM runs"
+        )
+        return rows[0]
+
+    # --- Retention ---
+
+    def expire(
+        self,
+        max_age_s: Optional[float] = None,
+        max_runs: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> list[str]:
+        """Delete rows past any of the limits and return their run_ids.
+
+        All limits are folded into one cutoff on started_at, so the select
+        and the delete both walk the started_at index and only touch the
+        rows being removed.
+        """
+        cutoffs: list[float] = []
+        with self._lock:
+            conn = self._connect()
+            if max_age_s is not None:
+                cutoffs.append(time.time() - max_age_s)
+            if max_runs is not None:
+                row = conn.execute(
+                    "SELECT started_at FROM runs ORDER BY started_at DESC "
+                    "LIMIT 1 OFFSET ?",
+                    (max(0, max_runs - 1),),
+                ).fetchone()
+                if row is not None:
+                    # Keep the newest max_runs: everything strictly older goes
+                    cutoffs.append(row[0] if max_runs > 0 else float("inf"))
+            if max_bytes is not None:
+                row = conn.execute(
+                    "SELECT started_at FROM ("
+                    "  SELECT started_at, SUM(size_bytes) OVER ("
+                    "    ORDER BY started_at DESC ROWS UNBOUNDED PRECEDING"
+                    "  ) AS total FROM runs"
+                    ") WHERE total > ? LIMIT 1",
+                    (max_bytes,),
+                ).fetchone()
+                if row is not None:
+                    # First run that no longer fits: it and everything older go
+                    cutoffs.append(math.nextafter(row[0], math.inf))
+            if not cutoffs:
+                return []
+            cutoff = max(cutoffs)
+            with conn:
+                expired = [
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT run_id FROM runs WHERE started_at < ?", (cutoff,)
+                    )
+                ]
+                conn.execute("DELETE FROM runs WHERE started_at < ?", (cutoff,))
+        return expired
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
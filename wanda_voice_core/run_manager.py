@@ -2,96 +2,537 @@
 
 from __future__ import annotations
 import json
+import os
+import queue
+import threading
 import time
 import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+from wanda_voice_core import audio_artifacts
+from wanda_voice_core.run_catalog import RunCatalog
 from wanda_voice_core.schemas import RunEvent
 
+# Durability modes for the background writer
+DURABILITY_NONE = "none"  # leave data in userspace buffers until the run closes
+DURABILITY_FLUSH = "flush"  # flush to the OS after every batch
+DURABILITY_FSYNC = "fsync"  # flush and fsync after every batch
+DURABILITY_MODES = {DURABILITY_NONE, DURABILITY_FLUSH, DURABILITY_FSYNC}
+
+# Run started by the current task; asyncio tasks inherit a copy of it
+_active_run: ContextVar[Optional[str]] = ContextVar("wanda_run", default=None)
+
+
+@dataclass
+class RunContext:
+    """State of one in-flight run."""
+
+    run_id: str
+    run_dir: Path
+    started_at: float
+    event_count: int = 0
+    audio_budget: dict[str, Optional[int]] = field(default_factory=dict)
+
+
+class RunWriter:
+    """Background thread that owns all run artifact I/O.
+
+    Event lines are buffered per run and written in one batch once
+    flush_bytes are pending, flush_interval_s has passed, or the run is
+    closed. Run directories are created on the first write and each run's
+    events.jsonl stays open until the run is closed, so a run costs a
+    handful of syscalls instead of an open/write/close per event.
+    """
+
+    def __init__(
+        self,
+        durability: str = DURABILITY_FLUSH,
+        flush_bytes: int = 64 * 1024,
+        flush_interval_s: float = 1.0,
+    ):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Invalid durability mode: {durability}")
+        self.durability = durability
+        self.flush_bytes = flush_bytes
+        self.flush_interval_s = flush_interval_s
+        self.batches_written = 0
+        self.errors = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._buffers: dict[Path, list[str]] = {}
+        self._buffer_bytes: dict[Path, int] = {}
+        self._first_buffered: dict[Path, float] = {}
+        self._handles: dict[Path, Any] = {}
+        self._created: set[Path] = set()
+        self._bytes: dict[Path, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    # --- Producer side (any thread, never blocks on I/O) ---
+
+    def append_event(self, run_dir: Path, entry: dict[str, Any]) -> None:
+        self._submit(("event", run_dir, entry))
+
+    def write_file(self, run_dir: Path, name: str, data: Any) -> None:
+        """Queue a file write. data may be a callable producing the payload
+        on the writer thread (e.g. an encoder); returning None skips it."""
+        self._submit(("file", run_dir, name, data))
+
+    def close_run(
+        self, run_dir: Path, on_closed: Optional[Callable[[int], None]] = None
+    ) -> None:
+        """Flush and close the run; on_closed(bytes_written) runs on the writer."""
+        self._submit(("close_run", run_dir, on_closed))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Write everything queued so far. Returns False on timeout."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._submit(("sync", done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(("stop",))
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _submit(self, op: tuple) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="RunWriter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(op)
+
+    # --- Writer thread ---
+
+    def _run(self) -> None:
+        while True:
+            try:
+                op = self._queue.get(timeout=self._next_timeout())
+            except queue.Empty:
+                self._flush_due()
+                continue
+            kind = op[0]
+            if kind == "event":
+                self._buffer(op[1], op[2])
+            elif kind == "file":
+                self._write_file(op[1], op[2], op[3])
+            elif kind == "close_run":
+                self._flush_run(op[1])
+                handle = self._handles.pop(op[1], None)
+                if handle is not None:
+                    self._close_handle(handle)
+                self._created.discard(op[1])
+                written = self._bytes.pop(op[1], 0)
+                if op[2] is not None:
+                    try:
+                        op[2](written)
+                    except Exception as e:
+                        self.errors += 1
+                        print(f"[RunManager] Close callback failed: {e}")
+            elif kind == "sync":
+                self._flush_all()
+                op[1].set()
+            elif kind == "stop":
+                self._flush_all()
+                for handle in self._handles.values():
+                    self._close_handle(handle)
+                self._handles.clear()
+                return
+            self._flush_due()
+
+    def _next_timeout(self) -> Optional[float]:
+        if not self._first_buffered:
+            return None
+        oldest = min(self._first_buffered.values())
+        return max(0.0, oldest + self.flush_interval_s - time.monotonic())
+
+    def _buffer(self, run_dir: Path, entry: dict[str, Any]) -> None:
+        try:
+            line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        except (TypeError, ValueError) as e:
+            print(f"[RunManager] Unserializable event dropped: {e}")
+            return
+        self._buffers.setdefault(run_dir, []).append(line)
+        self._buffer_bytes[run_dir] = self._buffer_bytes.get(run_dir, 0) + len(line)
+        self._first_buffered.setdefault(run_dir, time.monotonic())
+        if self._buffer_bytes[run_dir] >= self.flush_bytes:
+            self._flush_run(run_dir)
+
+    def _flush_due(self) -> None:
+        now = time.monotonic()
+        for run_dir, since in list(self._first_buffered.items()):
+            if now - since >= self.flush_interval_s:
+                self._flush_run(run_dir)
+
+    def _flush_all(self) -> None:
+        for run_dir in list(self._buffers):
+            self._flush_run(run_dir)
+
+    def _flush_run(self, run_dir: Path) -> None:
+        lines = self._buffers.pop(run_dir, None)
+        self._buffer_bytes.pop(run_dir, None)
+        self._first_buffered.pop(run_dir, None)
+        if not lines:
+            return
+        try:
+            handle = self._handles.get(run_dir)
+            if handle is None:
+                self._ensure_dir(run_dir)
+                handle = open(run_dir / "events.jsonl", "a", encoding="utf-8")
+                self._handles[run_dir] = handle
+            data = "".join(lines)
+            handle.write(data)
+            self._sync(handle)
+            self._bytes[run_dir] = self._bytes.get(run_dir, 0) + len(data)
+            self.batches_written += 1
+        except OSError as e:
+            self.errors += 1
+            print(f"[RunManager] Event write failed: {e}")
+
+    def _write_file(self, run_dir: Path, name: str, data: Any) -> None:
+        path = run_dir / name
+        if callable(data):
+            try:
+                data = data()
+            except Exception as e:
+                self.errors += 1
+                print(f"[RunManager] Building {name} failed: {e}")
+                return
+            if data is None:
+                return
+        try:
+            self._ensure_dir(path.parent)
+            if isinstance(data, (dict, list)):
+                payload = json.dumps(data, ensure_ascii=False, default=str).encode()
+            elif isinstance(data, (bytes, bytearray, memoryview)):
+                payload = data
+            else:
+                payload = str(data).encode()
+            with open(path, "wb") as f:
+                f.write(payload)
+                self._sync(f)
+            self._bytes[run_dir] = self._bytes.get(run_dir, 0) + len(payload)
+        except OSError as e:
+            self.errors += 1
+            print(f"[RunManager] Write of {name} failed: {e}")
+
+    def _ensure_dir(self, path: Path) -> None:
+        if path not in self._created:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created.add(path)
+
+    def _sync(self, handle: Any) -> None:
+        if self.durability == DURABILITY_NONE:
+            return
+        handle.flush()
+        if self.durability == DURABILITY_FSYNC:
+            os.fsync(handle.fileno())
+
+    def _close_handle(self, handle: Any) -> None:
+        try:
+            handle.close()
+        except OSError as e:
+            self.errors += 1
+            print(f"[RunManager] Close failed: {e}")
+
 
 class RunManager:
-    """Manages run artifacts: events, summaries, audio files."""
+    """Manages run artifacts: events, summaries, audio files.
+
+    All file I/O is handed to a RunWriter thread; nothing here blocks the
+    pipeline on the filesystem. With catalog=True each finished run is
+    also indexed in runs_dir/catalog.sqlite3 (see RunCatalog). Run
+    directories the catalog does not know (runs from before it existed,
+    or whose catalog write failed) are indexed from their summary.json
+    before retention is applied, so they expire like any other run.
+    """
 
-    def __init__(self, runs_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        runs_dir: Optional[Path] = None,
+        durability: str = DURABILITY_FLUSH,
+        flush_bytes: int = 64 * 1024,
+        flush_interval_s: float = 1.0,
+        catalog: bool = True,
+        audio_codec: str = audio_artifacts.CODEC_FLAC,
+        audio_max_bytes: Optional[int] = 4 * 1024 * 1024,
+    ):
         if runs_dir is None:
             runs_dir = Path.home() / ".wanda" / "voice_runs"
-        self.runs_dir = runs_dir
-        self._current_run: Optional[str] = None
-        self._run_start: float = 0.0
-        self._events: list[dict[str, Any]] = []
+        self.runs_dir = Path(runs_dir)
+        self.catalog: Optional[RunCatalog] = (
+            RunCatalog(self.runs_dir / "catalog.sqlite3") if catalog else None
+        )
+        self.writer = RunWriter(
+            durability=durability,
+            flush_bytes=flush_bytes,
+            flush_interval_s=flush_interval_s,
+        )
+        self.audio_codec = audio_artifacts.resolve_codec(audio_codec)
+        self.audio_max_bytes = audio_max_bytes
+        self.audio_stats = {"clips": 0, "raw_bytes": 0, "stored_bytes": 0, "dropped": 0}
+        self._runs: dict[str, RunContext] = {}
+        self._lock = threading.Lock()
+        # Ended runs whose catalog row is not written yet, and runs whose
+        # catalog write failed (retried by backfill_catalog)
+        self._closing: set[str] = set()
+        self._uncatalogued: set[str] = set()
+        self._backfilled = False
 
-    def start_run(self) -> str:
-        run_id = f"run_{int(time.time())}_{uuid.uuid4().hex[:8]}"
-        run_dir = self.runs_dir / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-        self._current_run = run_id
-        self._run_start = time.time()
-        self._events = []
+    @staticmethod
+    def new_run_id() -> str:
+        return f"run_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+
+    def start_run(self, run_id: Optional[str] = None) -> str:
+        """Open a new run and make it the current run of this context.
+
+        Each asyncio task sees its own current run, so overlapping
+        requests never share run state. run_id lets a caller pick the id
+        up front (from new_run_id) to follow the run's events.
+        """
+        run_id = run_id or self.new_run_id()
+        ctx = RunContext(
+            run_id=run_id,
+            run_dir=self.runs_dir / run_id,
+            started_at=time.time(),
+            audio_budget={"left": self.audio_max_bytes},
+        )
+        with self._lock:
+            self._runs[run_id] = ctx
+        _active_run.set(run_id)
         return run_id
 
     @property
     def current_run(self) -> Optional[str]:
-        return self._current_run
+        run_id = _active_run.get()
+        return run_id if run_id in self._runs else None
+
+    @property
+    def active_runs(self) -> list[str]:
+        with self._lock:
+            return list(self._runs)
+
+    def _context(self, run_id: Optional[str]) -> Optional[RunContext]:
+        return self._runs.get(run_id or _active_run.get() or "")
 
     def log_event(self, event: RunEvent) -> None:
-        if not self._current_run:
+        ctx = self._context(event.run_id)
+        if ctx is not None:
+            ctx.event_count += 1
+            run_dir = ctx.run_dir
+        elif event.run_id:
+            # Late event for a run that already ended
+            run_dir = self.runs_dir / event.run_id
+        else:
             return
-        entry = event.to_dict()
-        self._events.append(entry)
-        events_file = self.runs_dir / self._current_run / "events.jsonl"
-        try:
-            with open(events_file, "a") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-        except OSError:
-            pass
+        self.writer.append_event(run_dir, event.to_dict())
 
-    def save_artifact(self, name: str, data: Any) -> Optional[Path]:
-        if not self._current_run:
-            return None
-        artifact_path = self.runs_dir / self._current_run / name
-        try:
-            artifact_path.parent.mkdir(parents=True, exist_ok=True)
-            if isinstance(data, (dict, list)):
-                with open(artifact_path, "w") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-            elif isinstance(data, bytes):
-                with open(artifact_path, "wb") as f:
-                    f.write(data)
-            else:
-                with open(artifact_path, "w") as f:
-                    f.write(str(data))
-            return artifact_path
-        except OSError:
+    def save_artifact(
+        self, name: str, data: Any, run_id: Optional[str] = None
+    ) -> Optional[Path]:
+        """Queue an artifact write; returns the path it will be written to."""
+        ctx = self._context(run_id)
+        if ctx is None:
             return None
+        self.writer.write_file(ctx.run_dir, name, data)
+        return ctx.run_dir / name
 
     def save_audio(
-        self, audio_data: bytes, filename: str = "audio.wav"
+        self,
+        audio_data: Any,
+        sample_rate: int = 16000,
+        name: str = "audio",
+        run_id: Optional[str] = None,
     ) -> Optional[Path]:
-        return self.save_artifact(filename, audio_data)
+        """Queue mono audio for encoding; returns the path it will be written to.
+
+        audio_data (float32 numpy array or buffer, or WAV bytes) is handed
+        to the writer thread without copying, so the caller must not modify
+        it afterwards. Encoded clips share the run's audio_max_bytes budget;
+        a clip that doesn't fit is trimmed, or dropped if nothing is left.
+        """
+        ctx = self._context(run_id)
+        if ctx is None:
+            return None
+        filename = name + audio_artifacts.extension(self.audio_codec)
+        budget = ctx.audio_budget
+        stats = self.audio_stats
+        codec = self.audio_codec
+
+        def encode() -> Optional[bytes]:
+            samples = audio_artifacts.to_samples(audio_data)
+            encoded = audio_artifacts.encode_audio(
+                samples, sample_rate, codec, max_bytes=budget["left"]
+            )
+            stats["clips"] += 1
+            stats["raw_bytes"] += samples.nbytes
+            if encoded is None:
+                stats["dropped"] += 1
+                print(f"[RunManager] Audio budget exhausted, {filename} dropped")
+                return None
+            stats["stored_bytes"] += len(encoded)
+            if budget["left"] is not None:
+                budget["left"] -= len(encoded)
+            return encoded
+
+        self.writer.write_file(ctx.run_dir, filename, encode)
+        return ctx.run_dir / filename
 
-    def end_run(self, summary: Optional[dict[str, Any]] = None) -> None:
-        if not self._current_run:
+    def end_run(
+        self, summary: Optional[dict[str, Any]] = None, run_id: Optional[str] = None
+    ) -> None:
+        run_id = run_id or _active_run.get()
+        with self._lock:
+            ctx = self._runs.pop(run_id, None) if run_id else None
+        if ctx is None:
             return
-        duration = time.time() - self._run_start
+        if _active_run.get() == run_id:
+            _active_run.set(None)
+        duration = time.time() - ctx.started_at
         summary_data = {
-            "run_id": self._current_run,
+            "run_id": ctx.run_id,
             "duration_s": round(duration, 2),
-            "event_count": len(self._events),
-            "started_at": self._run_start,
+            "event_count": ctx.event_count,
+            "started_at": ctx.started_at,
             **(summary or {}),
         }
-        summary_path = self.runs_dir / self._current_run / "summary.json"
+        self.writer.write_file(ctx.run_dir, "summary.json", summary_data)
+        on_closed = None
+        if self.catalog is not None:
+            catalog = self.catalog
+            entry = {
+                "run_id": ctx.run_id,
+                "started_at": ctx.started_at,
+                "ended_at": ctx.started_at + duration,
+                "duration_ms": round(duration * 1000, 1),
+                "route": summary_data.get("route"),
+                "provider": summary_data.get("provider"),
+                "latency_ms": summary_data.get("latency_ms"),
+                "error": summary_data.get("error"),
+            }
+
+            def on_closed(written: int) -> None:
+                try:
+                    catalog.record({**entry, "size_bytes": written})
+                except Exception:
+                    with self._lock:
+                        self._uncatalogued.add(ctx.run_id)
+                    raise
+                finally:
+                    with self._lock:
+                        self._closing.discard(ctx.run_id)
+
+            with self._lock:
+                self._closing.add(ctx.run_id)
+
+        self.writer.close_run(ctx.run_dir, on_closed)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until all queued artifacts are written (tests, shutdown)."""
+        return self.writer.flush(timeout)
+
+    def close(self) -> None:
+        self.writer.close()
+        if self.catalog is not None:
+            self.catalog.close()
+
+    def backfill_catalog(self, run_ids: Optional[list[str]] = None) -> int:
+        """Index run directories that have no catalog row yet.
+
+        Scans runs_dir (or just run_ids) and records each unknown run from
+        its summary.json, falling back to the directory mtime. Runs still
+        open or waiting for their catalog write are skipped. Returns the
+        number of runs added.
+        """
+        if self.catalog is None:
+            return 0
+        with self._lock:
+            busy = set(self._runs) | self._closing
+        if run_ids is None:
+            if not self.runs_dir.is_dir():
+                return 0
+            run_ids = [p.name for p in self.runs_dir.iterdir() if p.is_dir()]
+        candidates = [r for r in run_ids if r not in busy]
+        unknown = set(candidates) - self.catalog.known(candidates)
+        entries = [e for e in map(self._entry_from_dir, sorted(unknown)) if e]
+        if entries:
+            self.catalog.record_many(entries)
+            print(f"[RunManager] Catalogued {len(entries)} existing run(s)")
+        return len(entries)
+
+    def _entry_from_dir(self, run_id: str) -> Optional[dict[str, Any]]:
+        run_dir = self.runs_dir / run_id
         try:
-            with open(summary_path, "w") as f:
-                json.dump(summary_data, f, ensure_ascii=False, indent=2)
+            files = [p for p in run_dir.rglob("*") if p.is_file()]
+            size = sum(p.stat().st_size for p in files)
+            started_at = run_dir.stat().st_mtime
         except OSError:
+            return None
+        summary: dict[str, Any] = {}
+        try:
+            summary = json.loads((run_dir / "summary.json").read_text())
+        except (OSError, ValueError):
             pass
-        self._current_run = None
-        self._events = []
+        if not isinstance(summary, dict):
+            summary = {}
+        started_at = summary.get("started_at") or started_at
+        duration_s = summary.get("duration_s")
+        return {
+            "run_id": run_id,
+            "started_at": started_at,
+            "ended_at": started_at + duration_s if duration_s is not None else None,
+            "duration_ms": duration_s * 1000 if duration_s is not None else None,
+            "route": summary.get("route"),
+            "provider": summary.get("provider"),
+            "latency_ms": summary.get("latency_ms"),
+            "error": summary.get("error"),
+            "size_bytes": size,
+        }
+
+    def apply_retention(
+        self,
+        max_age_s: Optional[float] = None,
+        max_runs: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> list[str]:
+        """Expire catalogued runs past any limit and delete their directories.
+
+        Cost is proportional to the number of runs removed; the run
+        directory is only scanned once per RunManager, to catalogue runs
+        from before the catalog existed. Returns the expired run_ids.
+        """
+        import shutil
+
+        if self.catalog is None:
+            return []
+        with self._lock:
+            retry, self._uncatalogued = list(self._uncatalogued), set()
+        if not self._backfilled:
+            self.backfill_catalog()
+            self._backfilled = True
+        elif retry:
+            self.backfill_catalog(retry)
+        expired = self.catalog.expire(
+            max_age_s=max_age_s, max_runs=max_runs, max_bytes=max_bytes
+        )
+        for run_id in expired:
+            shutil.rmtree(self.runs_dir / run_id, ignore_errors=True)
+        return expired
 
     def cleanup_old_runs(self, max_runs: int = 50) -> None:
         """Remove oldest runs if over limit."""
+        if self.catalog is not None:
+            self.apply_retention(max_runs=max_runs)
+            return
         if not self.runs_dir.exists():
             return
         runs = sorted(self.runs_dir.iterdir(), key=lambda p: p.stat().st_mtime)
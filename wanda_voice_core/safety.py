@@ -3,7 +3,8 @@
 from __future__ import annotations
 import re
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence
 
 from wanda_voice_core.schemas import RiskLevel
 
@@ -70,6 +71,58 @@ INJECTION_PATTERNS = [
 ]
 
 
+class PolicyMatcher:
+    """Tiered pattern lists compiled into one scanner.
+
+    Every pattern becomes a zero-width lookahead alternative, most severe
+    tier first, so a single pass reports at each position the most severe
+    pattern that matches there. match() returns (tier, index) of the
+    pattern an in-order walk over the lists would have hit first, and
+    caches the answer per text.
+    """
+
+    def __init__(
+        self, tiers: Sequence[Sequence[re.Pattern]], cache_size: int = 1024
+    ):
+        parts = []
+        for tier, patterns in enumerate(tiers):
+            for index, pattern in enumerate(patterns):
+                scoped = "(?i:" if pattern.flags & re.IGNORECASE else "(?:"
+                parts.append(f"(?=(?P<t{tier}_{index}>{scoped}{pattern.pattern})))")
+        self._scanner = re.compile("|".join(parts))
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, text: str) -> Optional[tuple[int, int]]:
+        best = None
+        for m in self._scanner.finditer(text):
+            tier, index = map(int, m.lastgroup[1:].split("_"))
+            if best is None or (tier, index) < best:
+                best = (tier, index)
+                if best == (0, 0):
+                    break
+        return best
+
+    def matches(self, text: str) -> bool:
+        """True if any pattern matches (uncached)."""
+        return self._scanner.search(text) is not None
+
+
+# Tiers of _COMMAND_POLICY, most severe first
+DENY, DANGEROUS, CAUTION, ALLOW = range(4)
+
+# Compiled at import; changes to the lists above need a new PolicyMatcher
+_COMMAND_POLICY = PolicyMatcher(
+    [
+        DENYLIST,
+        [pattern for pattern, _ in DANGEROUS_LIST],
+        [pattern for pattern, _ in CAUTION_LIST],
+        ALLOWLIST,
+    ]
+)
+# Prompts are rarely repeated, so there is nothing to cache
+_TEXT_POLICY = PolicyMatcher([INJECTION_PATTERNS], cache_size=0)
+
+
 class SafetyPolicy:
     """Validates commands and text against security policies."""
 
@@ -83,45 +136,43 @@ class SafetyPolicy:
     def check_command(self, command: str) -> SafetyResult:
         """Check a shell command against security policies."""
         command = command.strip()
+        tier, index = _COMMAND_POLICY.match(command) or (None, None)
 
         # Denylist: always blocked
-        for pattern in DENYLIST:
-            if pattern.search(command):
-                return SafetyResult(
-                    risk_level=RiskLevel.BLOCKED,
-                    risk_score=10,
-                    message=f"BLOCKED: Matches denylist pattern",
-                )
+        if tier == DENY:
+            return SafetyResult(
+                risk_level=RiskLevel.BLOCKED,
+                risk_score=10,
+                message=f"BLOCKED: Matches denylist pattern",
+            )
 
         # Dangerous
-        for pattern, score in DANGEROUS_LIST:
-            if pattern.search(command):
-                return SafetyResult(
-                    risk_level=RiskLevel.DANGEROUS,
-                    risk_score=score,
-                    message=f"DANGEROUS: {command[:50]}",
-                    requires_voice_confirm=True,
-                    requires_gui_confirm=True,
-                )
+        if tier == DANGEROUS:
+            return SafetyResult(
+                risk_level=RiskLevel.DANGEROUS,
+                risk_score=DANGEROUS_LIST[index][1],
+                message=f"DANGEROUS: {command[:50]}",
+                requires_voice_confirm=True,
+                requires_gui_confirm=True,
+            )
 
         # Caution
-        for pattern, score in CAUTION_LIST:
-            if pattern.search(command):
-                return SafetyResult(
-                    risk_level=RiskLevel.CAUTION,
-                    risk_score=score,
-                    message=f"Requires confirmation: {command[:50]}",
-                    requires_voice_confirm=score >= self.risk_threshold_voice,
-                    requires_gui_confirm=score >= self.risk_threshold_gui,
-                )
+        if tier == CAUTION:
+            score = CAUTION_LIST[index][1]
+            return SafetyResult(
+                risk_level=RiskLevel.CAUTION,
+                risk_score=score,
+                message=f"Requires confirmation: {command[:50]}",
+                requires_voice_confirm=score >= self.risk_threshold_voice,
+                requires_gui_confirm=score >= self.risk_threshold_gui,
+            )
 
         # Allowlist
-        for pattern in ALLOWLIST:
-            if pattern.search(command):
-                return SafetyResult(
-                    risk_level=RiskLevel.SAFE,
-                    risk_score=0,
-                )
+        if tier == ALLOW:
+            return SafetyResult(
+                risk_level=RiskLevel.SAFE,
+                risk_score=0,
+            )
 
         # Unknown: treat as caution
         return SafetyResult(
@@ -131,15 +182,18 @@ class SafetyPolicy:
             requires_voice_confirm=True,
         )
 
+    def check_many(self, commands: Iterable[str]) -> list[SafetyResult]:
+        """Check every step of a multi-step plan; repeated steps hit the cache."""
+        return [self.check_command(command) for command in commands]
+
     def check_text(self, text: str) -> SafetyResult:
         """Check text for injection attempts."""
-        for pattern in INJECTION_PATTERNS:
-            if pattern.search(text):
-                return SafetyResult(
-                    risk_level=RiskLevel.BLOCKED,
-                    risk_score=9,
-                    message="Potential prompt injection detected",
-                )
+        if _TEXT_POLICY.matches(text):
+            return SafetyResult(
+                risk_level=RiskLevel.BLOCKED,
+                risk_score=9,
+                message="Potential prompt injection detected",
+            )
         return SafetyResult(risk_level=RiskLevel.SAFE, risk_score=0)
 
     def is_safe_for_voice(self, result: SafetyResult) -> bool:
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
+import re
 import time
 
 
@@ -39,10 +40,20 @@ class ConfirmationState(str, Enum):
     CANCEL = "cancel"
 
 
+class CircuitState(str, Enum):
+    CLOSED = "closed"  # healthy, requests flow
+    OPEN = "open"  # failing, requests skipped
+    HALF_OPEN = "half_open"  # one trial request allowed
+
+
 class ValidationError(Exception):
     pass
 
 
+class OverloadedError(Exception):
+    """Raised when the engine's admission queue is full."""
+
+
 @dataclass
 class RouterResult:
     route: RouteType
@@ -78,17 +89,30 @@ class RefinerResult:
         return self
 
 
+_SESSION_ID = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+
+def validate_session_id(session_id: Optional[str]) -> Optional[str]:
+    if session_id is not None and (
+        not isinstance(session_id, str) or not _SESSION_ID.fullmatch(session_id)
+    ):
+        raise ValidationError("session_id must be 1-128 characters of [A-Za-z0-9._:-]")
+    return session_id
+
+
 @dataclass
 class UtteranceRequest:
     text: str
     mode: str = "text"  # "text" or "voice"
     context: Optional[str] = None
+    session_id: Optional[str] = None
 
     def validate(self) -> UtteranceRequest:
         if not self.text or not self.text.strip():
             raise ValidationError("text must not be empty")
         if self.mode not in ("text", "voice"):
             raise ValidationError(f"Invalid mode: {self.mode}")
+        validate_session_id(self.session_id)
         return self
 
 
@@ -101,7 +125,7 @@ class UtteranceResponse:
     run_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunEvent:
     event_type: str
     data: dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,219 @@
+"""Session-scoped conversation state for WANDA Voice Core.
+
+Each caller (API client, OVOS bridge, desktop loop) gets its own Session
+with its own history, rolling summary of trimmed turns and provider
+affinity. Sessions live in an LRU bounded by count and approximate memory
+and are dropped after idle_ttl_s without use.
+
+The engine binds the session of the current run with use_session();
+providers read it with current_session(), so concurrent runs of different
+sessions never see each other's turns.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from wanda_voice_core.token_economy import MAX_CONTEXT_CHARS, summarize_context
+
+DEFAULT_SESSION = "default"
+
+# Rough per-message overhead of the dict and its two strings
+_MESSAGE_OVERHEAD = 200
+
+_current: ContextVar[Optional["Session"]] = ContextVar("wanda_session", default=None)
+
+
+@dataclass
+class Session:
+    session_id: str
+    history: list[dict[str, str]] = field(default_factory=list)
+    summary: str = ""
+    provider: Optional[str] = None
+    provider_at: float = 0.0
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.monotonic)
+    size_bytes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "turns": len(self.history) // 2,
+            "has_summary": bool(self.summary),
+            "provider": self.provider,
+            "created_at": self.created_at,
+            "idle_s": round(time.monotonic() - self.last_used, 1),
+            "size_bytes": self.size_bytes,
+        }
+
+
+def _message_size(message: dict[str, str]) -> int:
+    return len(message.get("content", "")) + _MESSAGE_OVERHEAD
+
+
+class SessionStore:
+    """LRU of sessions with idle TTL and a memory cap.
+
+    History is trimmed the way OllamaProvider trims its own: once max_turns
+    pairs are exceeded the oldest half is dropped at once, keeping the
+    message prefix stable for KV-cache reuse. Dropped turns are folded
+    into the session summary, so no context is lost outright.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 256,
+        idle_ttl_s: float = 1800.0,
+        max_bytes: int = 16 * 1024 * 1024,
+        max_turns: int = 12,
+        summary_chars: int = MAX_CONTEXT_CHARS,
+        affinity_ttl_s: float = 300.0,
+    ):
+        self.max_sessions = max_sessions
+        self.idle_ttl_s = idle_ttl_s
+        self.max_bytes = max_bytes
+        self.max_turns = max_turns
+        self.summary_chars = summary_chars
+        self.affinity_ttl_s = affinity_ttl_s
+        self.evicted = 0
+        self.expired = 0
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, session_id: Optional[str] = None) -> Session:
+        """Return the session (created on first use) and mark it recently used."""
+        session_id = session_id or DEFAULT_SESSION
+        now = time.monotonic()
+        with self._lock:
+            self._expire_idle(now)
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = Session(session_id)
+                self._evict()
+            else:
+                self._sessions.move_to_end(session_id)
+            session.last_used = now
+            return session
+
+    def peek(self, session_id: str) -> Optional[Session]:
+        """Look up a session without creating or touching it."""
+        return self._sessions.get(session_id)
+
+    def drop(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            self._bytes -= session.size_bytes
+            return True
+
+    def record_turn(
+        self,
+        session: Session,
+        prompt: str,
+        response: str,
+        provider: Optional[str] = None,
+    ) -> None:
+        """Append one user/assistant pair and enforce the limits."""
+        added = [
+            {"role": "user", "content": prompt},
+            {"role": "assistant", "content": response},
+        ]
+        with self._lock:
+            session.history.extend(added)
+            grown = sum(_message_size(m) for m in added)
+            if len(session.history) > self.max_turns * 2:
+                cut = len(session.history) - self.max_turns
+                dropped = session.history[:cut]
+                del session.history[:cut]
+                grown -= sum(_message_size(m) for m in dropped)
+                grown -= len(session.summary)
+                prior = (
+                    [{"role": "summary", "content": session.summary}]
+                    if session.summary
+                    else []
+                )
+                session.summary = summarize_context(
+                    prior + dropped, max_chars=self.summary_chars
+                )
+                grown += len(session.summary)
+            if provider is not None:
+                session.provider = provider
+                session.provider_at = time.monotonic()
+            session.size_bytes += grown
+            if session.session_id in self._sessions:
+                self._bytes += grown
+                self._evict(keep=session.session_id)
+
+    def affinity(self, session: Session) -> Optional[str]:
+        """Provider that answered this session recently, if any."""
+        if session.provider and time.monotonic() - session.provider_at < self.affinity_ttl_s:
+            return session.provider
+        return None
+
+    def expire_idle(self) -> int:
+        with self._lock:
+            return self._expire_idle(time.monotonic())
+
+    def _expire_idle(self, now: float) -> int:
+        # Sessions are in LRU order, so only the expired prefix is visited
+        removed = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_used < self.idle_ttl_s:
+                break
+            self._sessions.popitem(last=False)
+            self._bytes -= session.size_bytes
+            removed += 1
+        self.expired += removed
+        return removed
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        while self._sessions and (
+            len(self._sessions) > self.max_sessions or self._bytes > self.max_bytes
+        ):
+            session_id = next(iter(self._sessions))
+            if session_id == keep:
+                if len(self._sessions) == 1:
+                    break
+                self._sessions.move_to_end(session_id)
+                continue
+            session = self._sessions.pop(session_id)
+            self._bytes -= session.size_bytes
+            self.evicted += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "size_bytes": self._bytes,
+            "max_sessions": self.max_sessions,
+            "max_bytes": self.max_bytes,
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
+
+
+def current_session() -> Optional[Session]:
+    """Session of the run being processed in this context, if any."""
+    return _current.get()
+
+
+def use_session(session: Optional[Session]) -> Token:
+    """Bind session to the current context; pass the token to release_session."""
+    return _current.set(session)
+
+
+def release_session(token: Token) -> None:
+    _current.reset(token)
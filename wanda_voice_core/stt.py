@@ -0,0 +1,49 @@
+"""Server-side speech-to-text for WANDA Voice Core.
+
+Used by the WebSocket audio endpoint so thin clients don't need their own
+STT. faster-whisper is optional; without it audio ingestion is disabled.
+"""
+
+from __future__ import annotations
+from typing import Any, Optional
+
+# Optional dependency
+try:
+    from faster_whisper import WhisperModel
+except Exception:
+    WhisperModel = None
+
+
+class FasterWhisperSTT:
+    """Minimal faster-whisper wrapper taking float32 numpy audio directly."""
+
+    def __init__(
+        self, model_name: str = "large-v3-turbo", device: str = "auto", beam_size: int = 1
+    ):
+        if WhisperModel is None:
+            raise ImportError("faster-whisper required: pip install faster-whisper")
+        compute_type = "int8" if device == "cpu" else "default"
+        self.model = WhisperModel(model_name, device=device, compute_type=compute_type)
+        self.model_name = model_name
+        self.beam_size = beam_size
+        print(f"[STT] Loaded faster-whisper {model_name} ({device})")
+
+    def transcribe(self, audio_data: Any, language: str = "de") -> str:
+        segments, _ = self.model.transcribe(
+            audio_data, language=language, beam_size=self.beam_size, vad_filter=False
+        )
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
+
+def load_stt(config: Any) -> Optional[FasterWhisperSTT]:
+    """Build the configured STT engine, or None if it isn't available."""
+    if config.get("stt.engine", "faster-whisper") != "faster-whisper":
+        return None
+    try:
+        return FasterWhisperSTT(
+            model_name=config.get("stt.model", "large-v3-turbo"),
+            device=config.get("stt.device", "auto"),
+        )
+    except Exception as e:
+        print(f"[STT] Not available, audio ingestion disabled: {e}")
+        return None
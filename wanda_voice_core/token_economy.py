@@ -5,7 +5,12 @@ Import from there: from wanda_voice_core.schemas import TokenMetrics
 """
 
 from __future__ import annotations
+import math
 import re
+import threading
+from collections import OrderedDict, namedtuple
+
+from wanda_voice_core.redaction import RedactionRule, Redactor
 
 # Hard caps
 MAX_CONTEXT_CHARS = 8000
@@ -15,12 +20,103 @@ MAX_OUTPUT_TOKENS = 2048
 # Approximate chars per token (German text is ~3.5 chars/token)
 CHARS_PER_TOKEN = 3.5
 
+# Token budget equivalent of MAX_CONTEXT_CHARS
+MAX_CONTEXT_TOKENS = int(MAX_CONTEXT_CHARS / CHARS_PER_TOKEN)
+
+# Optional BPE tokenizer; falls back to a local word-piece approximation
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENCODING = None
+
+_WORD_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count from character count."""
     return max(1, int(len(text) / CHARS_PER_TOKEN))
 
 
+def _count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return sum(
+        math.ceil(len(piece) / 4) if piece[0].isalnum() or piece[0] == "_" else 1
+        for piece in _WORD_PIECE_RE.findall(text)
+    )
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class TokenCounter:
+    """Count tokens with a local tokenizer, cached per distinct string.
+
+    Uses tiktoken when installed; otherwise counts word pieces, charging
+    long words one token per 4 characters and each punctuation mark one
+    token, which tracks BPE counts far better than a flat chars/token ratio.
+
+    The cache is keyed by (hash, length) of the text, not the text itself,
+    so it holds no prompt or response strings and its memory stays fixed
+    at maxsize small entries. str hashes are cached on the string, so a
+    history entry reused turn after turn is looked up without rehashing.
+    """
+
+    def __init__(self, maxsize: int = 8192):
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple[int, int], int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, text: str) -> int:
+        key = (hash(text), len(text))
+        with self._lock:
+            count = self._cache.get(key)
+            if count is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return count
+            self._misses += 1
+        count = _count_tokens(text)
+        with self._lock:
+            self._cache[key] = count
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return count
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+
+count_tokens = TokenCounter()
+
+
+def truncate_to_tokens(text: str, max_tokens: int, keep_end: bool = False) -> str:
+    """Cut text to at most max_tokens, keeping the beginning (or the end)."""
+    if count_tokens(text) <= max_tokens:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        part = text[len(text) - mid:] if keep_end else text[:mid]
+        if _count_tokens(part) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[len(text) - lo:] if keep_end else text[:lo]
+
+
 def check_budget(text: str, max_tokens: int = MAX_OUTPUT_TOKENS) -> bool:
     """Check if text is within token budget."""
     return estimate_tokens(text) <= max_tokens
@@ -65,32 +161,43 @@ def summarize_context(
     return "\n".join(parts)
 
 
-# Redaction patterns
-_PATTERNS = [
-    (re.compile(r"\bsk-[a-zA-Z0-9]{20,}\b"), "[REDACTED_KEY]"),
-    (re.compile(r"\b[a-f0-9]{40,}\b"), "[REDACTED_HEX]"),
-    (re.compile(r"[A-Za-z0-9+/]{40,}={0,2}"), "[REDACTED_B64]"),
-    (
-        re.compile(r"-----BEGIN [A-Z ]+-----[\s\S]*?-----END [A-Z ]+-----"),
+# Redaction rules, applied in one pass (see redaction.py). Listed in the
+# order they used to run, which is also the tie-break for overlaps.
+REDACTION_RULES = [
+    RedactionRule("key", r"\bsk-[a-zA-Z0-9]{20,}\b", "[REDACTED_KEY]", ("sk-",)),
+    RedactionRule("hex", r"\b[a-f0-9]{40,}\b", "[REDACTED_HEX]"),
+    RedactionRule(
+        "b64", r"(?<![A-Za-z0-9+/])[A-Za-z0-9+/]{40,}={0,2}", "[REDACTED_B64]"
+    ),
+    RedactionRule(
+        "cert",
+        # The body stops at the next "-----", so a BEGIN without END costs
+        # one scan up to the next marker, not one to the end of the text
+        r"-----BEGIN [A-Z ]+-----[^-]*(?:-(?!----)[^-]*)*-----END [A-Z ]+-----",
         "[REDACTED_CERT]",
+        ("-----BEGIN",),
     ),
-    (
-        re.compile(
-            r"(?:password|passwd|secret|token)\s*[:=]\s*(?!\[REDACTED_)(?![a-f0-9]{40,}\b)\S+",
-            re.IGNORECASE,
-        ),
+    RedactionRule(
+        "secret",
+        # Values the rules above would redact keep their own placeholder
+        r"(?:password|passwd|secret|token)\s*[:=]\s*"
+        r"(?-i:(?!sk-[a-zA-Z0-9]{20,}\b|[a-f0-9]{40,}\b|[A-Za-z0-9+/]{40}))\S+",
         "[REDACTED_SECRET]",
+        ("password", "passwd", "secret", "token"),
+        ignore_case=True,
     ),
     # Stack traces (multi-line, simplified)
-    (
-        re.compile(r"Traceback \(most recent call last\):[\s\S]{0,2000}?(?:\n\S|\Z)"),
+    RedactionRule(
+        "stacktrace",
+        r"Traceback \(most recent call last\):[\s\S]{0,2000}?(?:\n\S|\Z)",
         "[REDACTED_STACKTRACE]",
+        ("Traceback (most recent call last):",),
     ),
 ]
 
+_REDACTOR = Redactor(REDACTION_RULES)
+
 
 def redact_sensitive(text: str) -> str:
     """Strip secrets, hex strings, base64 blobs, stack traces."""
-    for pattern, replacement in _PATTERNS:
-        text = pattern.sub(replacement, text)
-    return text
+    return _REDACTOR.redact(text)
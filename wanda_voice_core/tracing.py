@@ -0,0 +1,177 @@
+"""Lightweight span tracing for WANDA Voice Core runs.
+
+A trace is bound to the current context with start_trace(); span() then
+records complete events into it from anywhere below in the call stack,
+including asyncio tasks and asyncio.to_thread workers, which inherit the
+context. Without an active trace span() returns a shared no-op object, so
+instrumented code pays one ContextVar lookup.
+
+Trace.to_chrome() produces Chrome trace-event JSON (trace.json), which
+opens directly in Perfetto or chrome://tracing. Each asyncio task or
+thread gets its own track, so concurrent work (hedged requests) shows up
+side by side.
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+_current: ContextVar[Optional["Trace"]] = ContextVar("wanda_trace", default=None)
+
+
+class Trace:
+    """Collected spans of one run."""
+
+    def __init__(self, run_id: str, max_events: int = 10000):
+        self.run_id = run_id
+        self.max_events = max_events
+        self.started_at = time.time()
+        self.dropped = 0
+        self._t0 = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: list[dict[str, Any]] = []
+        self._lanes: dict[Any, int] = {}
+        self._lane_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def now_us(self) -> float:
+        return (time.perf_counter() - self._t0) * 1e6
+
+    @property
+    def duration_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    def _lane(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            key, name = id(task), task.get_name()
+        else:
+            thread = threading.current_thread()
+            key, name = ("thread", thread.ident), thread.name
+        with self._lock:
+            tid = self._lanes.get(key)
+            if tid is None:
+                tid = self._lanes[key] = len(self._lanes) + 1
+                self._lane_names[tid] = name
+        return tid
+
+    def _add(self, event: dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped += 1
+                return
+            self._events.append(event)
+
+    def instant(self, name: str, cat: str = "wanda", **args: Any) -> None:
+        self._add({
+            "name": name, "cat": cat, "ph": "i", "s": "t",
+            "ts": round(self.now_us(), 1), "pid": self._pid, "tid": self._lane(),
+            "args": args,
+        })
+
+    def to_chrome(self) -> dict[str, Any]:
+        with self._lock:
+            events = list(self._events)
+            lanes = dict(self._lane_names)
+        meta = [
+            {"name": "process_name", "ph": "M", "pid": self._pid, "tid": 0,
+             "args": {"name": f"wanda {self.run_id}"}},
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+             "args": {"name": name}}
+            for tid, name in lanes.items()
+        ]
+        return {
+            "traceEvents": meta + events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "run_id": self.run_id,
+                "started_at": self.started_at,
+                "dropped_events": self.dropped,
+            },
+        }
+
+
+class Span:
+    """Context manager recording one complete ("X") event."""
+
+    __slots__ = ("_trace", "name", "cat", "args", "_start", "_tid")
+
+    def __init__(self, trace: Trace, name: str, cat: str, args: dict[str, Any]):
+        self._trace = trace
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> "Span":
+        self._tid = self._trace._lane()
+        self._start = self._trace.now_us()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        end = self._trace.now_us()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._trace._add({
+            "name": self.name, "cat": self.cat, "ph": "X",
+            "ts": round(self._start, 1), "dur": round(end - self._start, 1),
+            "pid": self._trace._pid, "tid": self._tid, "args": self.args,
+        })
+
+    def set(self, **args: Any) -> None:
+        """Attach results known only inside the span (e.g. warm=True)."""
+        self.args.update(args)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str, cat: str = "wanda", **args: Any) -> Any:
+    """Time a block in the current trace (no-op without one)."""
+    trace = _current.get()
+    if trace is None:
+        return _NOOP
+    return Span(trace, name, cat, args)
+
+
+def instant(name: str, cat: str = "wanda", **args: Any) -> None:
+    """Mark a point in time in the current trace (no-op without one)."""
+    trace = _current.get()
+    if trace is not None:
+        trace.instant(name, cat, **args)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
+
+
+def start_trace(run_id: str) -> Token:
+    """Bind a new Trace to the current context; pass the token to end_trace."""
+    return _current.set(Trace(run_id))
+
+
+def end_trace(token: Token) -> Optional[Trace]:
+    """Unbind the trace started with token and return it."""
+    trace = _current.get()
+    _current.reset(token)
+    return trace
@@ -0,0 +1,99 @@
+"""Stream WAV files to the WANDA Voice Core audio WebSocket.
+
+Usage:
+    python -m wanda_voice_core.ws_client question.wav [more.wav ...]
+        [--url ws://127.0.0.1:8370/v1/audio] [--session ID] [--realtime]
+
+Each file is converted to 16 kHz mono 16-bit PCM, sent in 20 ms frames
+and closed with an "end" message; server messages are printed as they
+arrive.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+FRAME_MS = 20
+
+
+def wav_to_pcm16(path: Path, sample_rate: int = 16000) -> bytes:
+    """Read a WAV file as 16 kHz mono little-endian int16 PCM."""
+    import numpy as np
+
+    from wanda_voice_core.audio_artifacts import load_audio
+
+    samples, rate = load_audio(path)
+    samples = np.asarray(samples, dtype=np.float32)
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    if rate != sample_rate:
+        # Linear resampling is plenty for speech at these rates
+        n = int(len(samples) * sample_rate / rate)
+        samples = np.interp(
+            np.linspace(0, len(samples) - 1, n), np.arange(len(samples)), samples
+        ).astype(np.float32)
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+async def stream_files(
+    url: str,
+    files: list[Path],
+    session_id: Optional[str] = None,
+    realtime: bool = False,
+    sample_rate: int = 16000,
+) -> list[dict[str, Any]]:
+    """Send each file, then "end"; returns the "result" messages.
+
+    A file with pauses may yield several results (one per utterance).
+    """
+    import aiohttp
+
+    results: list[dict[str, Any]] = []
+    frame_bytes = sample_rate * FRAME_MS // 1000 * 2
+    async with aiohttp.ClientSession() as http:
+        async with http.ws_connect(url) as ws:
+            await ws.send_json(
+                {"type": "start", "sample_rate": sample_rate, "session_id": session_id}
+            )
+            for path in files:
+                pcm = wav_to_pcm16(path, sample_rate)
+                for i in range(0, len(pcm), frame_bytes):
+                    await ws.send_bytes(pcm[i:i + frame_bytes])
+                    if realtime:
+                        await asyncio.sleep(FRAME_MS / 1000)
+                await ws.send_json({"type": "end"})
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    data = json.loads(msg.data)
+                    print(json.dumps(data, ensure_ascii=False))
+                    if data.get("type") == "error":
+                        return results
+                    if data.get("type") == "result":
+                        results.append(data)
+                    elif data.get("type") == "end":
+                        break
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--url", default="ws://127.0.0.1:8370/v1/audio")
+    parser.add_argument("--session", default=None)
+    parser.add_argument(
+        "--realtime", action="store_true", help="pace frames like a live microphone"
+    )
+    args = parser.parse_args(argv)
+    results = asyncio.run(
+        stream_files(args.url, args.files, args.session, args.realtime)
+    )
+    return 0 if results and not any(r.get("error") for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())